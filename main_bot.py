@@ -14,7 +14,11 @@ Usage:
 """
 import asyncio
 import argparse
+import logging
 import sys
+import time
+import numpy as np
+import requests
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
 
@@ -29,8 +33,13 @@ from src.execution.ibkr_client import IBKRClient
 from src.execution.forecastex_contracts import ForecastExContractFactory
 from src.execution.forecastex_execution import ExecutionEngine
 from src.storage.ledger import TradeLedger
+from src.models.market import Market
+from src.signal_server.signal_store import SharedSignalStore
 from src.signal_server.config import settings
 
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
 
 class UnifiedTradingBot:
     """
@@ -41,7 +50,8 @@ class UnifiedTradingBot:
         self,
         mode: str = "analysis-only",
         polling_interval: int = 60,
-        sentiment_enabled: bool = True
+        sentiment_enabled: bool = True,
+        arb_threshold: float = 0.02
     ):
         """
         Initialize the unified bot.
@@ -50,10 +60,12 @@ class UnifiedTradingBot:
             mode: Trading mode (analysis-only, paper, live)
             polling_interval: Seconds between checks (for non-streaming markets)
             sentiment_enabled: Whether to use sentiment analysis
+            arb_threshold: Minimum arb spread to trigger a trade (e.g., 0.02 = 2%)
         """
         self.mode = mode
         self.polling_interval = polling_interval
         self.sentiment_enabled = sentiment_enabled
+        self.arb_threshold = arb_threshold
 
         # Components
         self.poly_client: Optional[PolymarketClient] = None
@@ -67,22 +79,63 @@ class UnifiedTradingBot:
 
         # State
         self.running = False
+        self.streaming_enabled = False
         self.market_signals: Dict[str, Any] = {}
 
+        # Hot-path callable, bound once in initialize()
+        self._compute_prob: Optional[Any] = None
+
+        # Shared HTTP session, created in initialize()
+        self._http: Optional[requests.Session] = None
+
+        # Duplicate-error suppression state for cycle error logging
+        self._last_err_key: Optional[tuple] = None
+        self._last_err_time: float = 0.0
+
+        # Probability at which each market was last evaluated; lets the
+        # execution loop skip markets whose signal has barely moved
+        self._last_p_eval: Dict[str, float] = {}
+
+        # Dirty bits: market IDs whose probability changed since the
+        # execution / sentiment layer last consumed them. Turns both
+        # layers from O(watchlist) per cycle into O(changed) per cycle.
+        self._dirty: set = set()
+        self._dirty_sent: set = set()
+
         # Watchlist (markets to monitor)
-        self.watchlist: List[Dict[str, Any]] = [
-            {
-                "description": "US CPI YoY",
-                "polymarket_id": "example_condition_id",  # Replace with real ID
-                "keywords": ["CPI", "inflation", "consumer price"],
-                "strike": 100.0,
-                "expiry_date": "2026-03-15",
-                "is_yes": True,
-                "tags": ["Economics"]
-            },
+        self.watchlist: List[Market] = [
+            Market(
+                description="US CPI YoY",
+                polymarket_id="example_condition_id",  # Replace with real ID
+                keywords=["CPI", "inflation", "consumer price"],
+                strike=100.0,
+                expiry_date="2026-03-15",
+                is_yes=True,
+                tags=["Economics"]
+            ),
             # Add more markets here
         ]
 
+        # Columnar (SoA) views of the watchlist so per-cycle numeric work
+        # (days to expiry, probability vectors) runs in one vectorized pass
+        self.markets_by_id: Dict[str, Market] = {m.polymarket_id: m for m in self.watchlist}
+        self._index_by_id: Dict[str, int] = {m.polymarket_id: i for i, m in enumerate(self.watchlist)}
+        self._strikes = np.array([m.strike for m in self.watchlist], dtype=np.float64)
+        self._expiry_ns = np.array(
+            [int(m.expiry_dt.timestamp() * 1e9) for m in self.watchlist], dtype=np.int64
+        )
+        self._is_yes = np.array([m.is_yes for m in self.watchlist], dtype=np.bool_)
+
+        # Numeric signal state lives in a shared-memory record block so the
+        # layers (optionally running as separate processes) read and write
+        # the same buffer zero-copy; the field views below behave like the
+        # plain arrays they replace
+        self._signal_store = SharedSignalStore(len(self.watchlist))
+        self._p_poly = self._signal_store.records['p']
+        self._sent_score = self._signal_store.records['sent']
+        self._sent_conf = self._signal_store.records['conf']
+        self._signal_ts = self._signal_store.records['ts']
+
         print(f"✓ UnifiedTradingBot initialized in {mode.upper()} mode")
 
     async def initialize(self):
@@ -94,19 +147,54 @@ class UnifiedTradingBot:
 
         # Layer 1: Polymarket Signal Engine
         print("[Layer 1] Initializing Polymarket signal engine...")
+
+        # Pay the JIT compilation cost up front instead of on the first signal
+        from src.signal_server._kernels import warmup
+        warmup()
+
+        # One pooled HTTP session shared by the sync REST clients so
+        # keep-alive amortizes TCP/TLS setup across layers; the Polymarket
+        # client is async and owns its own pooled aiohttp session
+        self._http = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=64)
+        self._http.mount("https://", adapter)
+        self._http.mount("http://", adapter)
+
         self.poly_client = PolymarketClient()
         self.poly_stream = PolymarketStream()
+
+        # Prefer the websocket push feed; fall back to REST polling if the
+        # connection can't be established
+        try:
+            await self.poly_stream.connect()
+            for market in self.watchlist:
+                await self.poly_stream.subscribe_to_market(
+                    market.polymarket_id,
+                    self._on_stream_update
+                )
+            self.streaming_enabled = True
+            print("✓ Polymarket streaming ready")
+        except Exception as e:
+            print(f"⚠ Polymarket WebSocket unavailable: {e}")
+            print("  Falling back to REST polling")
+            self.streaming_enabled = False
+
         print("✓ Polymarket client ready")
 
+        # Bind the hot per-market callable once so the polling loop skips
+        # repeated attribute resolution
+        self._compute_prob = self.poly_client.get_liquidity_weighted_probability
+
         # Layer 2: Sentiment & Confidence
         if self.sentiment_enabled:
             print("\n[Layer 2] Initializing sentiment layer...")
-            self.news_client = NewsClient()
+            self.news_client = NewsClient(session=self._http)
             self.sentiment_scorer = SentimentScorer(method="textblob")  # Can switch to "finbert"
             print("✓ Sentiment analysis ready")
         else:
             print("\n[Layer 2] Sentiment analysis DISABLED")
 
+
         # Layer 3: Execution Engine (if not analysis-only)
         if self.mode != "analysis-only":
             print("\n[Layer 3] Initializing execution engine...")
@@ -120,13 +208,19 @@ class UnifiedTradingBot:
 
                 self.contract_factory = ForecastExContractFactory(self.ibkr_client)
 
+                # Warm the contract cache for the whole watchlist so the
+                # execution layer's first cycle hits memory, not TWS
+                await self.contract_factory.prefetch(
+                    (m.description, m.strike, m.expiry_date, m.is_yes) for m in self.watchlist
+                )
+
                 execution_mode = "paper" if self.mode == "paper" else "live"
                 self.execution_engine = ExecutionEngine(
                     ibkr_client=self.ibkr_client,
                     contract_factory=self.contract_factory,
                     ledger=self.ledger,
                     mode=execution_mode,
-                    arb_threshold=0.02
+                    arb_threshold=self.arb_threshold
                 )
                 print(f"✓ Execution engine ready ({execution_mode} mode)")
 
@@ -178,36 +272,146 @@ class UnifiedTradingBot:
         finally:
             await self.cleanup()
 
+    async def _on_stream_update(self, data: Dict[str, Any]):
+        """Handle a single order book delta pushed over the websocket."""
+        market_id = data.get('market') or data.get('asset_id')
+        if not market_id:
+            return
+
+        market = self.markets_by_id.get(market_id)
+        if market is None:
+            return
+
+        # Recompute probability incrementally from the locally maintained book
+        probability = self.poly_stream.calculate_vwap(market_id)
+
+        if probability is not None:
+            idx = self._index_by_id[market_id]
+            # NaN-safe: any comparison with NaN is False, so a first
+            # signal always marks the market dirty. Epsilon is float32
+            # scale: the store field is f4, so round-trip error is ~1e-7
+            # at p~0.5 and a tighter bound would re-flag every cycle
+            if not (abs(probability - self._p_poly[idx]) < 1e-6):
+                self._dirty.add(market_id)
+                self._dirty_sent.add(market_id)
+            self._p_poly[idx] = probability
+            self._signal_ts[idx] = time.time_ns()
+            self.market_signals[market_id] = {
+                'probability': probability,
+                'order_book': self.poly_stream.get_current_order_book(market_id),
+                'updated_at': datetime.now(),
+                'market': market
+            }
+
+            log.info("[Signal] %s: %.1f%%", market.description, probability * 100)
+
     async def _run_signal_layer(self):
-        """Layer 1: Continuously update Polymarket signals."""
+        """
+        Layer 1: Continuously update Polymarket signals.
+
+        When streaming is available, signals update on each websocket book
+        delta and a slow REST pass every 10 minutes reconciles any drift.
+        Otherwise this falls back to REST polling every polling_interval.
+        """
         print("[Layer 1] Starting signal monitoring...")
 
+        if self.streaming_enabled:
+            # Event-driven path: updates arrive via _on_stream_update
+            reconcile_task = asyncio.create_task(self._run_signal_reconciliation())
+            try:
+                while self.running:
+                    await self.poly_stream.listen()
+                    if not self.running:
+                        return
+
+                    # Socket dropped: reconnect and resubscribe; on failure
+                    # degrade to REST polling for the rest of the run
+                    try:
+                        await asyncio.sleep(5)
+                        await self.poly_stream.connect()
+                        await self.poly_stream.subscribe_to_markets(
+                            [m.polymarket_id for m in self.watchlist],
+                            self._on_stream_update
+                        )
+                        print("[Layer 1] Websocket reconnected")
+                    except Exception as e:
+                        log.error("[Signal] Reconnect failed, falling back to REST polling: %s", e)
+                        self.streaming_enabled = False
+                        break
+            finally:
+                reconcile_task.cancel()
+
+        # REST polling fallback
+        await self._poll_signals_forever(self.polling_interval)
+
+    async def _run_signal_reconciliation(self, interval: int = 600):
+        """Periodic full REST refresh to reconcile streamed order books."""
+        await self._poll_signals_forever(interval)
+
+    async def _poll_signals_forever(self, interval: int, phase: float = 0.0):
+        """REST polling loop shared by the fallback and reconciliation paths."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + phase
+        if phase > 0:
+            await asyncio.sleep(phase)
+
+        # Bind hot attributes to locals once; LOAD_FAST beats repeated
+        # LOAD_ATTR chains in the per-market loop
+        get_ob = self.poly_client.get_order_book
+        compute_prob = self._compute_prob
+        signals = self.market_signals
+        watchlist = self.watchlist
+        index_by_id = self._index_by_id
+        p_poly_arr = self._p_poly
+
         while self.running:
             try:
-                for market in self.watchlist:
-                    market_id = market['polymarket_id']
+                # One clock read per cycle for every signal timestamp
+                now = datetime.now()
+
+                # Issue all order book requests concurrently so a slow market
+                # doesn't block the rest of the watchlist
+                results = await asyncio.gather(
+                    *[get_ob(m.polymarket_id, n_levels=3) for m in watchlist],
+                    return_exceptions=True
+                )
+
+                for market, order_book in zip(watchlist, results):
+                    market_id = market.polymarket_id
 
-                    # Fetch order book
-                    order_book = await self.poly_client.get_order_book(market_id, n_levels=3)
+                    if isinstance(order_book, Exception):
+                        log.warning("[Signal] Error for %s: %s", market.description, order_book)
+                        continue
 
-                    # Calculate probability
-                    probability = self.poly_client.get_liquidity_weighted_probability(order_book)
+                    # Calculate probability (callable bound once at init)
+                    probability = compute_prob(order_book)
 
                     if probability is not None:
-                        # Store signal
-                        self.market_signals[market_id] = {
+                        # Store signal and flag the change for the
+                        # sentiment/execution consumers (NaN-safe;
+                        # float32-scale epsilon to match the f4 store field)
+                        idx = index_by_id[market_id]
+                        if not (abs(probability - p_poly_arr[idx]) < 1e-6):
+                            self._dirty.add(market_id)
+                            self._dirty_sent.add(market_id)
+                        p_poly_arr[idx] = probability
+                        self._signal_ts[idx] = time.time_ns()
+                        signals[market_id] = {
                             'probability': probability,
                             'order_book': order_book,
-                            'updated_at': datetime.now(),
+                            'updated_at': now,
                             'market': market
                         }
 
-                        print(f"[Signal] {market['description']}: {probability:.1%}")
+                        log.info("[Signal] %s: %.1f%%", market.description, probability * 100)
 
             except Exception as e:
-                print(f"[Signal] Error: {e}")
+                log.error("[Signal] Error: %s", e)
 
-            await asyncio.sleep(self.polling_interval)
+            # Schedule against a monotonic deadline so the period stays
+            # `interval` regardless of how long the work took
+            deadline += interval
+            await asyncio.sleep(max(0.0, deadline - loop.time()))
 
     async def _run_sentiment_layer(self):
         """Layer 2: Periodically update sentiment scores."""
@@ -216,104 +420,206 @@ class UnifiedTradingBot:
         # Run less frequently than signals (e.g., every 10 minutes)
         sentiment_interval = max(self.polling_interval * 10, 600)
 
+        # Phase-offset from the signal layer so the layers don't burst
+        # onto the network at the same tick
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.polling_interval / 3
+        await asyncio.sleep(self.polling_interval / 3)
+
+        # Hot attributes bound to locals for the per-cycle loops
+        news_client = self.news_client
+        score_articles = self.sentiment_scorer.score_articles
+
         while self.running:
             try:
-                for market in self.watchlist:
-                    market_id = market['polymarket_id']
-
-                    # Fetch news
-                    keywords = market.get('keywords', [])
+                # Only markets whose signal changed since the last sentiment
+                # pass are worth re-fetching news for; a quiet cycle costs
+                # nothing
+                dirty, self._dirty_sent = self._dirty_sent, set()
+                if not dirty:
+                    deadline += sentiment_interval
+                    await asyncio.sleep(max(0.0, deadline - loop.time()))
+                    continue
+
+                # One clock read per cycle; every market shares the same
+                # from_date and update timestamp
+                now = datetime.now()
+                from_date = now - timedelta(days=3)
+
+                # Group markets by keyword set so shared keywords ("CPI",
+                # "inflation") cost one fetch and one scoring pass, not N
+                groups: Dict[tuple, List[Market]] = {}
+                for market_id in dirty:
+                    market = self.markets_by_id[market_id]
+                    keywords = market.keywords
                     if not keywords:
-                        keywords = self.news_client.match_event_to_keywords(market['description'])
-
-                    articles = self.news_client.fetch_news_for_event(
-                        keywords=keywords,
-                        from_date=datetime.now() - timedelta(days=3),
+                        keywords = news_client.match_event_to_keywords(market.description)
+                        market.keywords = keywords
+                    groups.setdefault(tuple(sorted(set(keywords))), []).append(market)
+
+                # One fetch per unique keyword set, all concurrent
+                # (fetch_news_for_event is blocking, so run it in threads)
+                results = await asyncio.gather(
+                    *[asyncio.to_thread(
+                        news_client.fetch_news_for_event,
+                        keywords=list(keywords),
+                        from_date=from_date,
                         max_results=5
-                    )
+                    ) for keywords in groups],
+                    return_exceptions=True
+                )
+
+                for markets, articles in zip(groups.values(), results):
+                    if isinstance(articles, Exception):
+                        for market in markets:
+                            log.warning("[Sentiment] Error for %s: %s", market.description, articles)
+                        continue
+
+                    # Dedupe articles by URL before scoring
+                    seen_urls = set()
+                    unique_articles = []
+                    for article in articles:
+                        url = article.url
+                        if url and url in seen_urls:
+                            continue
+                        seen_urls.add(url)
+                        unique_articles.append(article)
+
+                    if not unique_articles:
+                        continue
+
+                    # Score once per group, fan out to each member market
+                    sentiment_result = score_articles(unique_articles)
 
-                    if articles:
-                        # Score sentiment
-                        sentiment_result = self.sentiment_scorer.score_articles(articles)
+                    for market in markets:
+                        market_id = market.polymarket_id
+
+                        # Mirror into the columnar arrays the execution
+                        # layer's vectorized boost reads from
+                        i = self._index_by_id[market_id]
+                        self._sent_score[i] = sentiment_result['average_sentiment']
+                        self._sent_conf[i] = sentiment_result['confidence']
 
-                        # Store sentiment
                         if market_id in self.market_signals:
                             self.market_signals[market_id]['sentiment'] = sentiment_result
-                            self.market_signals[market_id]['sentiment_updated_at'] = datetime.now()
+                            self.market_signals[market_id]['sentiment_updated_at'] = now
 
-                            print(f"[Sentiment] {market['description']}: "
-                                  f"{sentiment_result['average_sentiment']:+.2f} "
-                                  f"(confidence: {sentiment_result['confidence']:.1%})")
+                            log.info("[Sentiment] %s: %+.2f (confidence: %.1f%%)",
+                                     market.description,
+                                     sentiment_result['average_sentiment'],
+                                     sentiment_result['confidence'] * 100)
 
             except Exception as e:
-                print(f"[Sentiment] Error: {e}")
+                log.error("[Sentiment] Error: %s", e)
+
+            deadline += sentiment_interval
+            await asyncio.sleep(max(0.0, deadline - loop.time()))
 
-            await asyncio.sleep(sentiment_interval)
+    def _log_cycle_error(self, layer: str, exc: Exception, suppress_secs: float = 30.0):
+        """
+        Log a cycle error with traceback, suppressing identical consecutive
+        errors for suppress_secs so one bad market can't spam every poll.
+        """
+        key = (layer, type(exc).__name__, str(exc))
+        now = time.monotonic()
+        if key == self._last_err_key and now - self._last_err_time < suppress_secs:
+            return
+        self._last_err_key = key
+        self._last_err_time = now
+        log.exception("%s error: %s", layer, exc)
 
     async def _run_execution_layer(self):
         """Layer 3: Evaluate opportunities and execute trades."""
         print("[Layer 3] Starting execution monitoring...")
 
+        # Phase-offset so signal/sentiment/execution cycles stay staggered
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + 2 * self.polling_interval / 3
+        await asyncio.sleep(2 * self.polling_interval / 3)
+
         while self.running:
             try:
-                for market in self.watchlist:
-                    market_id = market['polymarket_id']
+                # Claim the set of markets whose probability actually moved
+                # since the last evaluation; a quiet cycle does no work
+                dirty, self._dirty = self._dirty, set()
+                if not dirty:
+                    deadline += self.polling_interval
+                    await asyncio.sleep(max(0.0, deadline - loop.time()))
+                    continue
+
+                # Days to expiry for the whole watchlist in one vector op
+                now_ns = np.int64(datetime.now().timestamp() * 1e9)
+                days_to_expiry_arr = (self._expiry_ns - now_ns) // (86400 * 10**9)
+
+                # Confidence boost for the whole watchlist in one vector op.
+                # Markets without sentiment carry zero score/confidence and
+                # pass through unchanged; NaN means no signal yet.
+                p_poly_arr = self._p_poly
+                p_conf_arr = np.clip(
+                    p_poly_arr * (1.0 + self._sent_score * self._sent_conf * 0.20),
+                    0.0, 1.0
+                )
 
-                    # Get current signals
-                    if market_id not in self.market_signals:
+                # Only dirty markets with a live signal enter the Python loop
+                eligible = []
+                for market_id in dirty:
+                    idx = self._index_by_id[market_id]
+                    if np.isnan(p_poly_arr[idx]):
                         continue
+                    market = self.watchlist[idx]
+                    p_poly = float(p_poly_arr[idx])
+                    p_confidence = float(p_conf_arr[idx])
 
-                    signal = self.market_signals[market_id]
+                    if p_confidence != p_poly and log.isEnabledFor(logging.INFO):
+                        boost_pct = (p_confidence - p_poly) / p_poly * 100 if p_poly > 0 else 0
+                        log.info("[Execution] %s: Base %.1f%% → Boosted %.1f%% (%+.1f%%)",
+                                 market.description, p_poly * 100, p_confidence * 100, boost_pct)
 
-                    # Base probability from Polymarket
-                    p_poly = signal.get('probability')
-                    if p_poly is None:
+                    # Skip markets whose probability hasn't moved far enough
+                    # to possibly flip the arb decision
+                    last = self._last_p_eval.get(market.polymarket_id)
+                    if last is not None and abs(p_confidence - last) < self.arb_threshold * 0.25:
                         continue
 
-                    # Apply sentiment boost if available
-                    p_confidence = p_poly
-                    if 'sentiment' in signal and self.sentiment_enabled:
-                        sentiment = signal['sentiment']
-                        p_confidence = self.sentiment_scorer.calculate_confidence_boost(
-                            base_probability=p_poly,
-                            sentiment_score=sentiment['average_sentiment'],
-                            sentiment_confidence=sentiment['confidence'],
-                            max_boost=0.20
-                        )
-
-                        boost_pct = (p_confidence - p_poly) / p_poly * 100 if p_poly > 0 else 0
-                        print(f"[Execution] {market['description']}: "
-                              f"Base {p_poly:.1%} → Boosted {p_confidence:.1%} ({boost_pct:+.1f}%)")
-
-                    # Calculate days to expiry
-                    expiry_date = datetime.strptime(market['expiry_date'], "%Y-%m-%d")
-                    days_to_expiry = (expiry_date - datetime.now()).days
-
-                    # Evaluate opportunity (using confidence-boosted probability)
-                    trade_intent = await self.execution_engine.evaluate_arb_opportunity(
-                        description=market['description'],
-                        strike=market['strike'],
-                        expiry_date=market['expiry_date'],
-                        is_yes=market['is_yes'],
-                        p_poly=p_confidence,  # Use confidence-boosted probability
-                        days_to_expiry=days_to_expiry,
-                        quantity=10.0
+                    eligible.append((market, p_confidence, int(days_to_expiry_arr[idx])))
+
+                # Second pass: evaluate all opportunities concurrently
+                # (using confidence-boosted probabilities)
+                if eligible:
+                    trade_intents = await asyncio.gather(
+                        *[self.execution_engine.evaluate_arb_opportunity(
+                            description=market.description,
+                            strike=market.strike,
+                            expiry_date=market.expiry_date,
+                            is_yes=market.is_yes,
+                            p_poly=p_confidence,
+                            days_to_expiry=days_to_expiry,
+                            quantity=10.0
+                        ) for market, p_confidence, days_to_expiry in eligible],
+                        return_exceptions=True
                     )
 
-                    if trade_intent:
-                        # Execute trade
-                        success = await self.execution_engine.execute_trade_intent(trade_intent)
-                        if success:
-                            print(f"[Execution] ✓ Trade executed: {market['description']}")
-                        else:
-                            print(f"[Execution] ✗ Trade failed: {market['description']}")
+                    for (market, p_confidence, _), trade_intent in zip(eligible, trade_intents):
+                        if isinstance(trade_intent, Exception):
+                            log.warning("[Execution] Error for %s: %s", market.description, trade_intent)
+                            continue
+
+                        # Evaluation ran; remember the probability it saw
+                        self._last_p_eval[market.polymarket_id] = p_confidence
+
+                        if trade_intent:
+                            # Execute trade
+                            success = await self.execution_engine.execute_trade_intent(trade_intent)
+                            if success:
+                                log.info("[Execution] ✓ Trade executed: %s", market.description)
+                            else:
+                                log.warning("[Execution] ✗ Trade failed: %s", market.description)
 
             except Exception as e:
-                print(f"[Execution] Error: {e}")
-                import traceback
-                traceback.print_exc()
+                self._log_cycle_error("[Execution]", e)
 
-            await asyncio.sleep(self.polling_interval)
+            deadline += self.polling_interval
+            await asyncio.sleep(max(0.0, deadline - loop.time()))
 
     async def cleanup(self):
         """Cleanup and disconnect."""
@@ -324,6 +630,17 @@ class UnifiedTradingBot:
         if self.poly_stream:
             await self.poly_stream.disconnect()
 
+        if self.poly_client:
+            await self.poly_client.aclose()
+
+        if self._http:
+            self._http.close()
+
+        if self._signal_store:
+            # Release our field views first so the mapping can be freed
+            self._p_poly = self._sent_score = self._sent_conf = self._signal_ts = None
+            self._signal_store.close()
+
         if self.ibkr_client and self.ibkr_client._connected:
             self.ibkr_client.disconnect()
 
@@ -348,6 +665,12 @@ class UnifiedTradingBot:
 
 async def main():
     """Entry point."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s %(message)s",
+        handlers=[logging.StreamHandler()]
+    )
+
     parser = argparse.ArgumentParser(description="Unified Sentiment-Enhanced Trading Bot")
     parser.add_argument(
         "--mode",
@@ -393,6 +716,14 @@ async def main():
 
 
 if __name__ == "__main__":
+    # uvloop (libuv-backed event loop) gives a sizable throughput boost for
+    # an I/O-bound orchestrator; fall back to the stock loop if missing
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
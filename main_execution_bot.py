@@ -5,6 +5,7 @@ This bot pulls signals from Polymarket, prices from IBKR/ForecastEx,
 and executes trades based on yield-adjusted arbitrage opportunities.
 """
 import asyncio
+import logging
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 from src.execution.ibkr_client import IBKRClient
@@ -12,8 +13,12 @@ from src.execution.forecastex_contracts import ForecastExContractFactory
 from src.execution.forecastex_execution import ExecutionEngine
 from src.signal_server.polymarket_client import PolymarketClient
 from src.storage.ledger import TradeLedger
+from src.models.market import Market
 from src.signal_server.config import settings
 
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
 
 class ExecutionBot:
     """
@@ -49,15 +54,15 @@ class ExecutionBot:
 
         # Market watchlist: (description, strike, expiry, is_yes, polymarket_condition_id)
         # In production, this would be dynamically populated from Polymarket Gamma API
-        self.watchlist: List[Dict[str, Any]] = [
-            {
-                "description": "US CPI YoY",
-                "strike": 100.0,
-                "expiry_date": "2026-03-15",
-                "is_yes": True,
-                "condition_id": "example_cpi_condition_id",  # Placeholder
-                "tags": ["Economics"]
-            },
+        self.watchlist: List[Market] = [
+            Market(
+                description="US CPI YoY",
+                strike=100.0,
+                expiry_date="2026-03-15",
+                is_yes=True,
+                polymarket_id="example_cpi_condition_id",  # Placeholder
+                tags=["Economics"]
+            ),
             # Add more markets here as needed
         ]
 
@@ -89,6 +94,13 @@ class ExecutionBot:
         print("Initializing ForecastEx contract factory...")
         self.contract_factory = ForecastExContractFactory(self.ibkr_client)
 
+        # Warm the contract cache for the whole watchlist up front so the
+        # first evaluation cycle doesn't resolve contracts lazily one by one
+        resolved = await self.contract_factory.prefetch(
+            (m.description, m.strike, m.expiry_date, m.is_yes) for m in self.watchlist
+        )
+        print(f"Prefetched {resolved} ForecastEx contract(s) for the watchlist")
+
         # Initialize ledger
         print("Initializing trade ledger...")
         self.ledger = TradeLedger()
@@ -122,48 +134,46 @@ class ExecutionBot:
             print(f"Error fetching Polymarket probability for {condition_id}: {e}")
             return None
 
-    def calculate_days_to_expiry(self, expiry_date: str) -> int:
+    def calculate_days_to_expiry(self, expiry_dt: datetime) -> int:
         """
         Calculates days to expiry from current date.
         Args:
-            expiry_date: Expiry date in YYYY-MM-DD format.
+            expiry_dt: Expiry date as a datetime (parsed once in __init__).
         Returns:
             Number of days to expiry (minimum 0).
         """
-        expiry_dt = datetime.strptime(expiry_date, "%Y-%m-%d")
-        today = datetime.now()
-        delta = (expiry_dt - today).days
+        delta = (expiry_dt - datetime.now()).days
         return max(delta, 0)
 
-    async def process_market(self, market: Dict[str, Any]):
+    async def process_market(self, market: Market):
         """
         Processes a single market from the watchlist.
         Args:
-            market: Dictionary containing market details.
+            market: The watchlist Market entry.
         """
         print(f"\n{'='*60}")
-        print(f"Processing: {market['description']}")
+        print(f"Processing: {market.description}")
         print(f"{'='*60}")
 
         # Fetch Polymarket probability
-        p_poly = await self.fetch_polymarket_probability(market['condition_id'])
+        p_poly = await self.fetch_polymarket_probability(market.polymarket_id)
 
         if p_poly is None:
-            print(f"Skipping {market['description']} - could not fetch Polymarket probability.")
+            print(f"Skipping {market.description} - could not fetch Polymarket probability.")
             return
 
         print(f"Polymarket probability: {p_poly:.4f}")
 
         # Calculate days to expiry
-        days_to_expiry = self.calculate_days_to_expiry(market['expiry_date'])
+        days_to_expiry = self.calculate_days_to_expiry(market.expiry_dt)
         print(f"Days to expiry: {days_to_expiry}")
 
         # Evaluate arb opportunity
         trade_intent = await self.execution_engine.evaluate_arb_opportunity(
-            description=market['description'],
-            strike=market['strike'],
-            expiry_date=market['expiry_date'],
-            is_yes=market['is_yes'],
+            description=market.description,
+            strike=market.strike,
+            expiry_date=market.expiry_date,
+            is_yes=market.is_yes,
             p_poly=p_poly,
             days_to_expiry=days_to_expiry,
             quantity=10.0  # Configurable
@@ -171,14 +181,14 @@ class ExecutionBot:
 
         # Execute if opportunity exists
         if trade_intent:
-            print(f"\nExecuting trade for {market['description']}...")
+            print(f"\nExecuting trade for {market.description}...")
             success = await self.execution_engine.execute_trade_intent(trade_intent)
             if success:
                 print(f"✓ Trade executed successfully")
             else:
                 print(f"✗ Trade execution failed")
         else:
-            print(f"No arb opportunity for {market['description']}")
+            print(f"No arb opportunity for {market.description}")
 
     async def run(self):
         """Main execution loop."""
@@ -190,6 +200,14 @@ class ExecutionBot:
 
         iteration = 0
 
+        # Bound per-cycle concurrency so IBKR/Polymarket aren't hammered
+        # when the watchlist grows; tune per IBKR rate limits
+        sem = asyncio.Semaphore(8)
+
+        async def guarded_process(market: Market):
+            async with sem:
+                await self.process_market(market)
+
         try:
             while True:
                 iteration += 1
@@ -197,14 +215,16 @@ class ExecutionBot:
                 print(f"Iteration {iteration} - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
                 print(f"{'#'*60}")
 
-                # Process each market in the watchlist
-                for market in self.watchlist:
-                    try:
-                        await self.process_market(market)
-                    except Exception as e:
-                        print(f"Error processing market {market['description']}: {e}")
-                        import traceback
-                        traceback.print_exc()
+                # Process all markets in the watchlist concurrently (bounded
+                # by the semaphore) so a slow round-trip for one market
+                # doesn't delay the others
+                results = await asyncio.gather(
+                    *[guarded_process(market) for market in self.watchlist],
+                    return_exceptions=True
+                )
+                for market, result in zip(self.watchlist, results):
+                    if isinstance(result, Exception):
+                        print(f"Error processing market {market.description}: {result}")
 
                 # Check if we've reached max iterations
                 if self.max_iterations and iteration >= self.max_iterations:
@@ -218,9 +238,7 @@ class ExecutionBot:
         except KeyboardInterrupt:
             print("\n\nReceived Ctrl+C. Shutting down...")
         except Exception as e:
-            print(f"\n\nUnexpected error in main loop: {e}")
-            import traceback
-            traceback.print_exc()
+            log.exception("Unexpected error in main loop: %s", e)
         finally:
             await self.cleanup()
 
@@ -306,4 +324,12 @@ async def main():
 
 
 if __name__ == "__main__":
+    # uvloop (libuv-backed event loop) gives a sizable throughput boost for
+    # an I/O-bound orchestrator; fall back to the stock loop if missing
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     asyncio.run(main())
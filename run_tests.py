@@ -2,18 +2,35 @@
 """
 Master test runner for poly-bot.
 Runs unit tests and optionally integration tests.
+
+Independent suites run concurrently (each in its own subprocess) and the
+unit suite additionally fans out across CPU cores via pytest-xdist, so
+total wall time is max-of-suites instead of sum-of-suites.
 """
 import sys
 import subprocess
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+
+def _run_suite(banner: str, cmd: list) -> bool:
+    """
+    Run one suite in a subprocess, capturing its output so concurrently
+    running suites don't interleave on the terminal.
+    """
+    result = subprocess.run(cmd, capture_output=True, text=True)
+
+    output = "\n" + "=" * 70 + "\n" + banner + "\n" + "=" * 70 + "\n"
+    output += result.stdout
+    if result.stderr:
+        output += result.stderr
+    print(output, end="")
+
+    return result.returncode == 0
 
 
 def run_unit_tests():
     """Run unit tests (no external connections required)."""
-    print("\n" + "=" * 70)
-    print("RUNNING UNIT TESTS (No external connections)")
-    print("=" * 70)
-
     cmd = [
         sys.executable, "-m", "pytest",
         "tests/test_config.py",
@@ -21,33 +38,30 @@ def run_unit_tests():
         "tests/test_ledger.py",
         "tests/test_execution_engine.py",
         "-v",
-        "--tb=short"
+        "--tb=short",
+        # Spread test files across worker processes; loadfile keeps each
+        # file's tests together so shared fixtures aren't duplicated
+        "-n", "auto",
+        "--dist", "loadfile",
     ]
-
-    result = subprocess.run(cmd)
-    return result.returncode == 0
+    return _run_suite("RUNNING UNIT TESTS (No external connections)", cmd)
 
 
 def run_integration_tests_polymarket():
     """Run Polymarket integration tests (requires internet)."""
-    print("\n" + "=" * 70)
-    print("RUNNING POLYMARKET INTEGRATION TESTS (Requires internet)")
-    print("=" * 70)
-
-    cmd = [sys.executable, "tests/test_integration_polymarket.py"]
-    result = subprocess.run(cmd)
-    return result.returncode == 0
+    # Serial (-n 0): both tests share one session-scoped client/connection
+    cmd = [sys.executable, "-m", "pytest", "tests/test_integration_polymarket.py",
+           "-v", "-n", "0"]
+    return _run_suite("RUNNING POLYMARKET INTEGRATION TESTS (Requires internet)", cmd)
 
 
 def run_integration_tests_ibkr():
     """Run IBKR integration tests (requires TWS/Gateway running)."""
-    print("\n" + "=" * 70)
-    print("RUNNING IBKR INTEGRATION TESTS (Requires TWS/Gateway)")
-    print("=" * 70)
-
-    cmd = [sys.executable, "tests/test_integration_ibkr.py"]
-    result = subprocess.run(cmd)
-    return result.returncode == 0
+    # Serial (-n 0): concurrent TWS sessions with the same client ID stomp
+    # on each other
+    cmd = [sys.executable, "-m", "pytest", "tests/test_integration_ibkr.py",
+           "-v", "-n", "0"]
+    return _run_suite("RUNNING IBKR INTEGRATION TESTS (Requires TWS/Gateway)", cmd)
 
 
 def main():
@@ -75,28 +89,28 @@ def main():
 
     args = parser.parse_args()
 
-    results = {}
-
-    # Run unit tests
+    # Select suites
+    selected = {}
     if not args.integration_only:
-        results['unit_tests'] = run_unit_tests()
-    else:
-        results['unit_tests'] = None
-
-    # Run integration tests
+        selected['unit_tests'] = run_unit_tests
     if not args.unit_only:
         if not args.skip_polymarket:
-            results['polymarket_integration'] = run_integration_tests_polymarket()
-        else:
-            results['polymarket_integration'] = None
-
+            selected['polymarket_integration'] = run_integration_tests_polymarket
         if not args.skip_ibkr:
-            results['ibkr_integration'] = run_integration_tests_ibkr()
-        else:
-            results['ibkr_integration'] = None
-    else:
-        results['polymarket_integration'] = None
-        results['ibkr_integration'] = None
+            selected['ibkr_integration'] = run_integration_tests_ibkr
+
+    # Run the selected suites concurrently. Threads are enough here: the
+    # actual work happens in the child pytest/python processes, so each
+    # thread just blocks on its subprocess.
+    results = {
+        'unit_tests': None,
+        'polymarket_integration': None,
+        'ibkr_integration': None,
+    }
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        futures = {name: pool.submit(runner) for name, runner in selected.items()}
+        for name, future in futures.items():
+            results[name] = future.result()
 
     # Summary
     print("\n" + "=" * 70)
@@ -1,4 +1,4 @@
-#!/usr/bin/env python3
+#!/usr/bin/env -S python -O
 """
 ForecastEx Contract Discovery Script
 
@@ -6,17 +6,27 @@ This script connects to IBKR and discovers all available ForecastEx contracts.
 Run this once IBKR account is set up to find the "boring plumbing" symbols.
 
 Usage:
+    discover-forecastex              (after pip install -e .)
     python scripts/discover_forecastex_contracts.py
 """
 import sys
 import asyncio
 import csv
 from datetime import datetime
-sys.path.insert(0, '/Users/tippens/solarcode/repos/poly-bot')
+from operator import attrgetter
 
 from src.execution.ibkr_client import IBKRClient
 from src.signal_server.config import settings
-from ib_insync import Contract
+try:
+    from ib_async import Contract
+except ImportError:
+    from ib_insync import Contract
+
+# Pull the displayed contract fields in one C-level pass per contract
+# instead of repeated hasattr/getattr checks in the display loop
+_CONTRACT_FIELDS = attrgetter(
+    'symbol', 'localSymbol', 'secType', 'lastTradeDateOrContractMonth', 'strike', 'right'
+)
 
 
 async def discover_contracts():
@@ -77,12 +87,10 @@ async def discover_contracts():
 
         print()
 
-    # Deduplicate by contract ID
-    unique_contracts = {}
-    for detail in all_contracts:
-        contract = detail.contract
-        if hasattr(contract, 'conId') and contract.conId:
-            unique_contracts[contract.conId] = detail
+    # Deduplicate by contract ID in a single comprehension
+    unique_contracts = {
+        d.contract.conId: d for d in all_contracts if getattr(d.contract, 'conId', 0)
+    }
 
     print("=" * 70)
     print(f"DISCOVERY SUMMARY: Found {len(unique_contracts)} unique contracts")
@@ -107,56 +115,46 @@ async def discover_contracts():
         client.disconnect()
         return
 
-    # Display and save results
-    contracts_data = []
-
-    print("AVAILABLE CONTRACTS:")
-    print("-" * 70)
+    # Display results: build the whole listing first and flush it in one
+    # write instead of a couple of syscalls per contract
+    lines = ["AVAILABLE CONTRACTS:", "-" * 70]
 
     for i, (con_id, detail) in enumerate(unique_contracts.items(), 1):
-        contract = detail.contract
-
-        # Extract useful info
-        symbol = contract.symbol if hasattr(contract, 'symbol') else 'N/A'
-        local_symbol = contract.localSymbol if hasattr(contract, 'localSymbol') else 'N/A'
-        sec_type = contract.secType if hasattr(contract, 'secType') else 'N/A'
-        expiry = contract.lastTradeDateOrContractMonth if hasattr(contract, 'lastTradeDateOrContractMonth') else 'N/A'
-        strike = contract.strike if hasattr(contract, 'strike') else 'N/A'
-        right = contract.right if hasattr(contract, 'right') else 'N/A'
-        long_name = detail.longName if hasattr(detail, 'longName') else 'N/A'
-
-        print(f"{i}. {long_name}")
-        print(f"   Symbol: {symbol} | Local: {local_symbol}")
-        print(f"   Type: {sec_type} | Expiry: {expiry}")
-        if strike != 'N/A':
-            print(f"   Strike: {strike} | Right: {right}")
-        print(f"   Contract ID: {con_id}")
-        print()
-
-        contracts_data.append({
-            'contract_id': con_id,
-            'symbol': symbol,
-            'local_symbol': local_symbol,
-            'sec_type': sec_type,
-            'description': long_name,
-            'expiry': expiry,
-            'strike': strike,
-            'right': right,
-            'exchange': 'FORECASTX',
-            'currency': 'USD',
-            'discovered_at': datetime.now().isoformat()
-        })
-
-    # Save to CSV
+        # Extract useful info in one attrgetter pass
+        symbol, local_symbol, sec_type, expiry, strike, right = _CONTRACT_FIELDS(detail.contract)
+        long_name = getattr(detail, 'longName', 'N/A')
+
+        lines.append(f"{i}. {long_name}")
+        lines.append(f"   Symbol: {symbol} | Local: {local_symbol}")
+        lines.append(f"   Type: {sec_type} | Expiry: {expiry}")
+        if strike:
+            lines.append(f"   Strike: {strike} | Right: {right}")
+        lines.append(f"   Contract ID: {con_id}")
+        lines.append("")
+
+    lines.append("")
+    sys.stdout.write("\n".join(lines))
+
+    # Save to CSV: plain csv.writer over a tuple generator avoids the
+    # per-row dict building and key hashing DictWriter does
     output_file = 'data/contracts_available.csv'
     import os
     os.makedirs('data', exist_ok=True)
 
+    header = ('contract_id', 'symbol', 'local_symbol', 'sec_type', 'description',
+              'expiry', 'strike', 'right', 'exchange', 'currency', 'discovered_at')
+    now_iso = datetime.now().isoformat()
+
+    def rows():
+        for con_id, detail in unique_contracts.items():
+            symbol, local_symbol, sec_type, expiry, strike, right = _CONTRACT_FIELDS(detail.contract)
+            yield (con_id, symbol, local_symbol, sec_type, getattr(detail, 'longName', 'N/A'),
+                   expiry, strike, right, 'FORECASTX', 'USD', now_iso)
+
     with open(output_file, 'w', newline='') as f:
-        if contracts_data:
-            writer = csv.DictWriter(f, fieldnames=contracts_data[0].keys())
-            writer.writeheader()
-            writer.writerows(contracts_data)
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(rows())
 
     print("=" * 70)
     print(f"✓ Results saved to: {output_file}")
@@ -190,5 +188,10 @@ async def main():
         traceback.print_exc()
 
 
-if __name__ == "__main__":
+def cli():
+    """Synchronous console-script entry point (see pyproject [project.scripts])."""
     asyncio.run(main())
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+FinBERT ONNX Export Script
+
+Exports ProsusAI/finbert to an INT8-quantized ONNX model for the
+SentimentScorer "onnx" backend (see src/sentiment_layer/sentiment_scorer.py).
+Dynamic QOperator quantization targets AVX512-VNNI; onnxruntime falls back
+to plain AVX2 kernels on older CPUs.
+
+Usage:
+    python scripts/export_finbert_onnx.py
+
+Requires: pip install optimum[onnxruntime]
+"""
+import os
+import shutil
+
+MODEL_NAME = "ProsusAI/finbert"
+EXPORT_DIR = "models/finbert-onnx"
+OUTPUT_PATH = "models/finbert-int8.onnx"
+
+
+def main():
+    from optimum.onnxruntime import ORTModelForSequenceClassification, ORTQuantizer
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+
+    os.makedirs(EXPORT_DIR, exist_ok=True)
+
+    print(f"Exporting {MODEL_NAME} to ONNX...")
+    model = ORTModelForSequenceClassification.from_pretrained(MODEL_NAME, export=True)
+    model.save_pretrained(EXPORT_DIR)
+
+    print("Quantizing to INT8 (dynamic, avx512_vnni)...")
+    quantizer = ORTQuantizer.from_pretrained(EXPORT_DIR)
+    qconfig = AutoQuantizationConfig.avx512_vnni(is_static=False)
+    quantizer.quantize(save_dir=EXPORT_DIR, quantization_config=qconfig)
+
+    quantized = os.path.join(EXPORT_DIR, "model_quantized.onnx")
+    shutil.copyfile(quantized, OUTPUT_PATH)
+    print(f"✓ INT8 model written to {OUTPUT_PATH}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,21 +1,112 @@
-from ib_insync import Contract
-from typing import Dict, Any, Optional
+import asyncio
+import logging
+import os
+import pickle
+import sqlite3
+import time
+try:
+    from ib_async import Contract
+except ImportError:
+    from ib_insync import Contract
+from types import MappingProxyType
+from typing import Dict, Any, Final, Mapping, Optional, Tuple
 from src.execution.ibkr_client import IBKRClient
 
+# Frozen description -> symbol root resolution table, hoisted out of the hot
+# lookup path. This would be more robust in production.
+_SYMBOL_ROOT_MAP: Final[Mapping[str, str]] = MappingProxyType({
+    "US CPI YoY": "USCPI",
+    "BTC Quarterly": "BTCQ",
+    # Add more mappings as needed
+})
+
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
 class ForecastExContractFactory:
     """
-    Factory to find and map ForecastEx contracts (modeled as options) to ib_insync.Contract objects.
+    Factory to find and map ForecastEx contracts (modeled as options) to ib_async.Contract objects.
     ForecastEx contracts are assumed to be options (secType='OPT') on synthetic underlyings.
+
+    Resolved contracts are cached in memory and persisted to SQLite so a
+    bot restart doesn't re-issue rate-limited reqContractDetails calls
+    for contracts resolved within the TTL.
     """
 
-    def __init__(self, ibkr_client: IBKRClient):
+    # Bound on the in-memory cache so long-running discovery doesn't grow it forever
+    MAX_MEMORY_CACHE = 1024
+
+    def __init__(
+        self,
+        ibkr_client: IBKRClient,
+        cache_db_path: str = "data/contract_cache.db",
+        cache_ttl: float = 86400.0
+    ):
         """
         Initializes the factory with an IBKR client instance.
         Args:
             ibkr_client: An instance of IBKRClient.
+            cache_db_path: Path to the SQLite contract cache.
+            cache_ttl: Seconds a persisted contract stays valid (default 24h).
         """
         self.ibkr_client = ibkr_client
-        self._contract_cache: Dict[str, Contract] = {}
+        self.cache_db_path = cache_db_path
+        self.cache_ttl = cache_ttl
+        self._contract_cache: Dict[Tuple[str, float, str, str], Contract] = {}
+
+        # Ensure data directory exists
+        os.makedirs(os.path.dirname(cache_db_path), exist_ok=True)
+        self._init_cache_db()
+
+    def _init_cache_db(self):
+        """Initializes the SQLite contract cache with the required table."""
+        conn = sqlite3.connect(self.cache_db_path)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS contracts (
+                key TEXT PRIMARY KEY,
+                con_id INTEGER,
+                local_symbol TEXT,
+                pickled BLOB,
+                ts REAL
+            )
+        """)
+        conn.commit()
+        conn.close()
+
+    def _cache_load(self, cache_key: str) -> Optional[Contract]:
+        """Returns the persisted contract for cache_key if still within TTL."""
+        conn = sqlite3.connect(self.cache_db_path)
+        row = conn.execute(
+            "SELECT pickled, ts FROM contracts WHERE key = ?", (cache_key,)
+        ).fetchone()
+        conn.close()
+
+        if row and time.time() - row[1] < self.cache_ttl:
+            return pickle.loads(row[0])
+        return None
+
+    def _cache_store(self, cache_key: str, contract: Contract):
+        """Persists a resolved contract for future cold starts."""
+        conn = sqlite3.connect(self.cache_db_path)
+        conn.execute(
+            "INSERT OR REPLACE INTO contracts (key, con_id, local_symbol, pickled, ts) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (
+                cache_key,
+                getattr(contract, 'conId', None),
+                getattr(contract, 'localSymbol', ''),
+                pickle.dumps(contract),
+                time.time()
+            )
+        )
+        conn.commit()
+        conn.close()
+
+    def _remember(self, cache_key: Tuple[str, float, str, str], contract: Contract):
+        """Stores a contract in the bounded in-memory cache (FIFO eviction)."""
+        if len(self._contract_cache) >= self.MAX_MEMORY_CACHE:
+            self._contract_cache.pop(next(iter(self._contract_cache)))
+        self._contract_cache[cache_key] = contract
 
     def _find_contract(self, symbol_root: str, strike: float, expiry: str, right: str) -> Optional[Contract]:
         """
@@ -26,7 +117,7 @@ class ForecastExContractFactory:
             expiry: The expiry date in YYYYMMDD format.
             right: 'C' for Call (Yes) or 'P' for Put (No).
         Returns:
-            An ib_insync.Contract object if found, otherwise None.
+            An ib_async.Contract object if found, otherwise None.
         """
         contract = Contract(
             symbol=symbol_root,  # e.g., 'USCPI'
@@ -38,18 +129,105 @@ class ForecastExContractFactory:
             lastTradeDateOrContractMonth=expiry # YYYYMMDD
         )
 
-        print(f"Searching for ForecastEx contract: {symbol_root} {strike} {expiry} {right}")
+        log.debug("Searching for ForecastEx contract: %s %s %s %s", symbol_root, strike, expiry, right)
         details = self.ibkr_client.get_contract_details(contract)
 
         if details:
             # Assuming the first matching contract is sufficient for now.
             # In a real scenario, you might need more sophisticated matching logic.
-            print(f"Found contract: {details[0].conId} - {details[0].localSymbol}")
+            log.debug("Found contract: %s - %s", details[0].conId, details[0].localSymbol)
+            return details[0]
+        else:
+            log.warning("No ForecastEx contract found for %s %s %s %s", symbol_root, strike, expiry, right)
+            return None
+
+    async def _find_contract_async(self, symbol_root: str, strike: float, expiry: str, right: str) -> Optional[Contract]:
+        """
+        Async counterpart of _find_contract so multiple reqContractDetails
+        calls can be pipelined over one TWS session.
+        Args:
+            symbol_root: The underlying symbol root (e.g., 'USCPI').
+            strike: The strike price of the option.
+            expiry: The expiry date in YYYYMMDD format.
+            right: 'C' for Call (Yes) or 'P' for Put (No).
+        Returns:
+            An ib_async.Contract object if found, otherwise None.
+        """
+        contract = Contract(
+            symbol=symbol_root,
+            secType='OPT',
+            exchange='FORECASTX',
+            currency='USD',
+            right=right,
+            strike=strike,
+            lastTradeDateOrContractMonth=expiry
+        )
+
+        log.debug("Searching for ForecastEx contract: %s %s %s %s", symbol_root, strike, expiry, right)
+        details = await self.ibkr_client.get_contract_details_async(contract)
+
+        if details:
+            log.debug("Found contract: %s - %s", details[0].conId, details[0].localSymbol)
             return details[0]
         else:
-            print(f"No ForecastEx contract found for {symbol_root} {strike} {expiry} {right}")
+            log.warning("No ForecastEx contract found for %s %s %s %s", symbol_root, strike, expiry, right)
             return None
 
+    async def prefetch(self, queries) -> int:
+        """
+        Resolves a batch of contracts concurrently and warms both caches.
+
+        Called once at startup with the full watchlist so the first
+        evaluation cycle hits the in-memory cache instead of paying a
+        serial reqContractDetails round-trip per market. All uncached
+        lookups are fired together via asyncio.gather; TWS pipelines the
+        requests over the single session.
+
+        Args:
+            queries: Iterable of (description, strike, expiry_date, is_yes)
+                tuples matching the get_forecastex_contract signature.
+        Returns:
+            The number of contracts resolved from IBKR (cache hits excluded).
+        """
+        pending = []  # [(cache_key, db_key), ...] aligned with tasks
+        tasks = []
+        for description, strike, expiry_date, is_yes in queries:
+            symbol_root = _SYMBOL_ROOT_MAP.get(description)
+            if not symbol_root:
+                log.warning("Unknown description '%s' for ForecastEx contract mapping.", description)
+                continue
+
+            expiry_ibkr_format = expiry_date.replace('-', '')
+            right = ('P', 'C')[is_yes]
+            cache_key = (symbol_root, strike, expiry_ibkr_format, right)
+            if cache_key in self._contract_cache:
+                continue
+
+            db_key = f"{symbol_root}-{strike}-{expiry_ibkr_format}-{right}"
+            contract = self._cache_load(db_key)
+            if contract:
+                self._remember(cache_key, contract)
+                continue
+
+            pending.append((cache_key, db_key))
+            tasks.append(self._find_contract_async(*cache_key))
+
+        if not tasks:
+            return 0
+
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        resolved = 0
+        for (cache_key, db_key), contract in zip(pending, results):
+            if isinstance(contract, Exception):
+                log.warning("Prefetch failed for %s: %s", cache_key, contract)
+                continue
+            if contract:
+                self._remember(cache_key, contract)
+                self._cache_store(db_key, contract)
+                resolved += 1
+        return resolved
+
     def get_forecastex_contract(self, description: str, strike: float, expiry_date: str, is_yes: bool) -> Optional[Contract]:
         """
         Maps a human description to a specific ForecastEx Contract object.
@@ -59,31 +237,38 @@ class ForecastExContractFactory:
             expiry_date: The expiry date in 'YYYY-MM-DD' format. Will be converted to 'YYYYMMDD'.
             is_yes: True for a 'Yes' contract (Call), False for a 'No' contract (Put).
         Returns:
-            An ib_insync.Contract object if a matching ForecastEx contract is found, else None.
+            An ib_async.Contract object if a matching ForecastEx contract is found, else None.
         """
-        # Simple mapping from description to symbol_root. This would be more robust in production.
-        symbol_root_map = {
-            "US CPI YoY": "USCPI",
-            "BTC Quarterly": "BTCQ",
-            # Add more mappings as needed
-        }
-        symbol_root = symbol_root_map.get(description)
+        symbol_root = _SYMBOL_ROOT_MAP.get(description)
         if not symbol_root:
-            print(f"Error: Unknown description '{description}' for ForecastEx contract mapping.")
+            log.warning("Unknown description '%s' for ForecastEx contract mapping.", description)
             return None
-        
+
         # Convert expiry_date from YYYY-MM-DD to YYYYMMDD
         expiry_ibkr_format = expiry_date.replace('-', '')
-        right = 'C' if is_yes else 'P'
+        right = ('P', 'C')[is_yes]
+
+        # Tuple key hashes directly; no per-call string formatting
+        cache_key = (symbol_root, strike, expiry_ibkr_format, right)
+        cached = self._contract_cache.get(cache_key)
+        if cached is not None:
+            log.debug("Returning cached contract for %s", cache_key)
+            return cached
 
-        cache_key = f"{symbol_root}-{strike}-{expiry_ibkr_format}-{right}"
-        if cache_key in self._contract_cache:
-            print(f"Returning cached contract for {cache_key}")
-            return self._contract_cache[cache_key]
+        # Disk cache (string key, built only on the rare memory miss):
+        # survives restarts, so cold starts skip the reqContractDetails
+        # round-trip for recently resolved contracts
+        db_key = f"{symbol_root}-{strike}-{expiry_ibkr_format}-{right}"
+        contract = self._cache_load(db_key)
+        if contract:
+            log.debug("Returning persisted contract for %s", db_key)
+            self._remember(cache_key, contract)
+            return contract
 
         contract = self._find_contract(symbol_root, strike, expiry_ibkr_format, right)
         if contract:
-            self._contract_cache[cache_key] = contract
+            self._remember(cache_key, contract)
+            self._cache_store(db_key, contract)
         return contract
 
 # Example Usage (for testing)
@@ -123,5 +308,4 @@ async def main():
         ibkr_client.disconnect()
 
 if __name__ == "__main__":
-    import asyncio
     asyncio.run(main())
@@ -3,14 +3,35 @@ ForecastEx Execution Engine with yield-adjusted fair value calculation.
 Supports both paper and live trading modes.
 """
 import asyncio
-from typing import Optional, Dict, Any, List
+import enum
+import logging
+from functools import lru_cache
+from typing import Final, Optional, Dict, Any, List, Union
 from datetime import datetime, timezone
-from ib_insync import Contract, Order, Ticker
+import numpy as np
+try:
+    from ib_async import Contract, Order, Ticker
+except ImportError:
+    from ib_insync import Contract, Order, Ticker
 from src.execution.ibkr_client import IBKRClient
 from src.execution.forecastex_contracts import ForecastExContractFactory
 from src.models.trade_intent import TradeIntent
 from src.storage.ledger import TradeLedger
 from src.signal_server.config import settings
+from src.signal_server._kernels import arb_spreads
+
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+
+class Mode(str, enum.Enum):
+    """Trading mode; str-mixed so existing 'paper'/'live' comparisons hold."""
+    PAPER = 'paper'
+    LIVE = 'live'
+
+
+# Evaluated once at import; the hot path shouldn't hit settings per construction
+_LIVE_ALLOWED: Final = bool(settings.ALLOW_US_EXECUTION)
 
 
 class ExecutionEngine:
@@ -19,12 +40,15 @@ class ExecutionEngine:
     Supports both paper trading (default) and live execution.
     """
 
+    # Size of the precomputed yield factor table (10 years of daily factors)
+    YIELD_TABLE_DAYS = 3650
+
     def __init__(
         self,
         ibkr_client: IBKRClient,
         contract_factory: ForecastExContractFactory,
         ledger: TradeLedger,
-        mode: str = "paper",
+        mode: Union[Mode, str] = Mode.PAPER,
         arb_threshold: float = 0.02,
         risk_free_rate: Optional[float] = None
     ):
@@ -34,26 +58,47 @@ class ExecutionEngine:
             ibkr_client: An IBKRClient instance.
             contract_factory: A ForecastExContractFactory instance.
             ledger: A TradeLedger instance for recording trades.
-            mode: Trading mode ('paper' or 'live'). Default is 'paper'.
+            mode: Trading mode (Mode or 'paper'/'live' string). Default is paper.
             arb_threshold: Minimum spread for arb opportunities (e.g., 0.02 = 2%).
             risk_free_rate: Annual risk-free rate (e.g., 0.045 = 4.5%). Defaults to settings.
         """
+        # Normalize (and validate) the mode once; identity checks from here on
+        try:
+            mode = Mode(mode)
+        except ValueError:
+            raise ValueError(f"Invalid mode: {mode}. Must be 'paper' or 'live'.")
+
         self.ibkr_client = ibkr_client
         self.contract_factory = contract_factory
         self.ledger = ledger
         self.mode = mode
+        self._is_paper = mode is Mode.PAPER
+        # Mode dispatch bound once here; execute_trade_intent makes one
+        # bound-method call per trade instead of re-checking the mode
+        self._execute_impl = self._execute_paper if self._is_paper else self._execute_live
         self.arb_threshold = arb_threshold
         self.risk_free_rate = risk_free_rate if risk_free_rate is not None else settings.RISK_FREE_RATE
-
-        # Validate mode
-        if mode not in ['paper', 'live']:
-            raise ValueError(f"Invalid mode: {mode}. Must be 'paper' or 'live'.")
+        self._rebuild_yield_table()
 
         # Safety check for live mode
-        if mode == 'live' and not settings.ALLOW_US_EXECUTION:
+        if mode is Mode.LIVE and not _LIVE_ALLOWED:
             raise ValueError("Live execution is disabled in settings. Set ALLOW_US_EXECUTION=true to enable.")
 
-        print(f"ExecutionEngine initialized in {mode.upper()} mode with {arb_threshold*100:.1f}% arb threshold.")
+        print(f"ExecutionEngine initialized in {mode.value.upper()} mode with {arb_threshold*100:.1f}% arb threshold.")
+
+    def _rebuild_yield_table(self):
+        """Precomputes 1 + r*d/365 for every day offset at the current rate."""
+        days = np.arange(self.YIELD_TABLE_DAYS, dtype=np.float64)
+        self._yield_factor_table = 1.0 + self.risk_free_rate * days / 365.0
+
+    def set_risk_free_rate(self, r: float):
+        """
+        Updates the risk-free rate and rebuilds the yield factor table.
+        Args:
+            r: Annual risk-free rate (e.g., 0.045 = 4.5%).
+        """
+        self.risk_free_rate = r
+        self._rebuild_yield_table()
 
     def calculate_yield_adjusted_fair_value(
         self,
@@ -72,12 +117,22 @@ class ExecutionEngine:
         Returns:
             The yield-adjusted fair value (0-1).
         """
-        if r is None:
-            r = self.risk_free_rate
-
         if days_to_expiry < 0:
             days_to_expiry = 0
 
+        if r is None:
+            # Common case: O(1) table lookup instead of a multiply/divide
+            factor = self._yield_factor_table[min(days_to_expiry, self.YIELD_TABLE_DAYS - 1)]
+            return min(p_poly * factor, 1.0)
+
+        # Explicit rate: fall back to the memoized formula. Rounding the
+        # keys keeps near-identical probabilities from fragmenting the cache
+        return self._fair_value_cached(round(p_poly, 6), days_to_expiry, round(r, 6))
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _fair_value_cached(p_poly: float, days_to_expiry: int, r: float) -> float:
+        """Memoized core of the fair value formula (cap at 1.0)."""
         p_fx_fair = p_poly * (1 + r * days_to_expiry / 365)
 
         # Cap at 1.0 since probabilities can't exceed 100%
@@ -103,27 +158,107 @@ class ExecutionEngine:
 
         return spread
 
+    def calculate_arb_spreads_batch(
+        self,
+        p_poly: np.ndarray,
+        p_fx_market: np.ndarray,
+        days_to_expiry: np.ndarray
+    ) -> np.ndarray:
+        """
+        Vectorized calculate_arb_spread over whole candidate arrays.
+        One NumPy expression replaces N Python-level calls when the signal
+        loop fans out across the watchlist; select trade candidates with
+        `spreads > self.arb_threshold` on the result.
+
+        Args:
+            p_poly: Polymarket probabilities (0-1).
+            p_fx_market: ForecastEx market prices (0-1).
+            days_to_expiry: Days until expiry per contract.
+        Returns:
+            Array of arb spreads, clipped to [-1, 1].
+        """
+        # Single fused JIT'd loop: no intermediate fair-value/clip arrays
+        return arb_spreads(
+            np.ascontiguousarray(p_poly, dtype=np.float64),
+            np.ascontiguousarray(p_fx_market, dtype=np.float64),
+            np.ascontiguousarray(days_to_expiry, dtype=np.float64),
+            self.risk_free_rate
+        )
+
     async def get_contract_price(self, contract: Contract, timeout: int = 5) -> Optional[float]:
         """
         Gets the current market price (midpoint of bid/ask) for a contract.
         Args:
-            contract: The ib_insync.Contract to price.
+            contract: The ib_async.Contract to price.
             timeout: Seconds to wait for market data.
         Returns:
             The midpoint price or None if not available.
         """
         ticker = await self.ibkr_client.req_market_data(contract)
+        if ticker is None:
+            return None
+
+        try:
+            bid, ask = await self._wait_valid_tick(ticker, timeout)
+        except asyncio.TimeoutError:
+            log.warning("Could not get valid market data for %s within %ss", contract.localSymbol, timeout)
+            return None
 
-        # Wait for market data to arrive
-        for _ in range(timeout * 2):  # Check every 0.5 seconds
-            await asyncio.sleep(0.5)
-            if ticker.bid and ticker.ask and ticker.bid > 0 and ticker.ask > 0:
-                midpoint = (ticker.bid + ticker.ask) / 2.0
-                print(f"Contract {contract.localSymbol}: bid={ticker.bid:.4f}, ask={ticker.ask:.4f}, mid={midpoint:.4f}")
-                return midpoint
+        midpoint = (bid + ask) / 2.0
+        log.debug("Contract %s: bid=%.4f, ask=%.4f, mid=%.4f",
+                  contract.localSymbol, bid, ask, midpoint)
+        return midpoint
+
+    @staticmethod
+    async def _wait_valid_tick(ticker: Ticker, timeout: int) -> tuple:
+        """
+        Awaits the first valid (bid, ask) on a ticker, event-driven.
+
+        The quote is captured inside the update callback, so the returned
+        pair is the one that satisfied the validity check even if the book
+        moves again before we wake. Raises asyncio.TimeoutError if no valid
+        tick arrives within timeout seconds.
+        """
+        if ticker.bid and ticker.ask and ticker.bid > 0 and ticker.ask > 0:
+            return ticker.bid, ticker.ask
 
-        print(f"Warning: Could not get valid market data for {contract.localSymbol} within {timeout}s")
-        return None
+        fut = asyncio.get_running_loop().create_future()
+
+        def _on_update(t: Ticker):
+            if t.bid and t.ask and t.bid > 0 and t.ask > 0 and not fut.done():
+                fut.set_result((t.bid, t.ask))
+
+        ticker.updateEvent += _on_update
+        try:
+            return await asyncio.wait_for(fut, timeout)
+        finally:
+            ticker.updateEvent -= _on_update
+
+    async def evaluate_watchlist(
+        self,
+        items: List[Dict[str, Any]],
+        max_concurrency: int = 16
+    ) -> List[Optional[TradeIntent]]:
+        """
+        Evaluates many arb opportunities concurrently.
+
+        Each item pipelines its IBKR market-data round-trip with the others
+        (bounded by a semaphore so TWS isn't flooded), collapsing wall time
+        from N x RTT to roughly one RTT per batch of max_concurrency.
+
+        Args:
+            items: List of keyword-argument dicts for evaluate_arb_opportunity.
+            max_concurrency: Maximum simultaneous in-flight evaluations.
+        Returns:
+            One Optional[TradeIntent] per item, in input order.
+        """
+        sem = asyncio.Semaphore(max_concurrency)
+
+        async def _eval_one(query: Dict[str, Any]) -> Optional[TradeIntent]:
+            async with sem:
+                return await self.evaluate_arb_opportunity(**query)
+
+        return await asyncio.gather(*[_eval_one(query) for query in items])
 
     def create_trade_intent(
         self,
@@ -134,7 +269,8 @@ class ExecutionEngine:
         side: str,
         quantity: float,
         limit_price: float,
-        notes: Optional[str] = None
+        notes: Optional[str] = None,
+        contract: Optional[Contract] = None
     ) -> TradeIntent:
         """
         Creates a TradeIntent object for a ForecastEx trade.
@@ -147,16 +283,18 @@ class ExecutionEngine:
             quantity: Number of contracts.
             limit_price: Limit price (0-1).
             notes: Optional notes.
+            contract: Already-resolved Contract; skips a factory lookup.
         Returns:
-            A TradeIntent object.
+            A TradeIntent object (carrying the resolved contract).
         """
-        symbol_root = self.contract_factory.get_forecastex_contract(
-            description, strike, expiry_date, is_yes
-        )
-        if not symbol_root:
+        if contract is None:
+            contract = self.contract_factory.get_forecastex_contract(
+                description, strike, expiry_date, is_yes
+            )
+        if not contract:
             raise ValueError(f"Could not find contract for {description}")
 
-        symbol_root_str = symbol_root.symbol if hasattr(symbol_root, 'symbol') else description
+        symbol_root_str = contract.symbol if hasattr(contract, 'symbol') else description
 
         trade_intent = TradeIntent(
             venue="ForecastEx",
@@ -167,9 +305,10 @@ class ExecutionEngine:
             side=side,
             quantity=quantity,
             limit_price=limit_price,
-            mode=self.mode,
+            mode=self.mode.value,
             notes=notes
         )
+        trade_intent._contract = contract
 
         return trade_intent
 
@@ -181,25 +320,32 @@ class ExecutionEngine:
         Returns:
             True if successful, False otherwise.
         """
-        # Record the intent in the ledger
+        # Record the intent in the ledger, then dispatch to the mode
+        # implementation bound in __init__
         trade_id = self.ledger.record_trade(trade_intent)
+        return await self._execute_impl(trade_intent, trade_id)
+
+    async def _execute_paper(self, trade_intent: TradeIntent, trade_id: int) -> bool:
+        """Paper-mode execution: mark the recorded intent as executed."""
+        log.info("[PAPER] Simulating execution: %s %s %s @ %s",
+                 trade_intent.side, trade_intent.quantity, trade_intent.symbol_root, trade_intent.limit_price)
+        self.ledger.update_trade_status(
+            trade_id,
+            "EXECUTED",
+            transaction_id=f"PAPER-{trade_id}",
+            notes=f"Paper trade executed at {datetime.now(timezone.utc).isoformat()}"
+        )
+        return True
 
-        if self.mode == "paper":
-            # Paper trading: just log it as executed
-            print(f"[PAPER] Simulating execution: {trade_intent.side} {trade_intent.quantity} {trade_intent.symbol_root} @ {trade_intent.limit_price}")
-            self.ledger.update_trade_status(
-                trade_id,
-                "EXECUTED",
-                transaction_id=f"PAPER-{trade_id}",
-                notes=f"Paper trade executed at {datetime.now(timezone.utc).isoformat()}"
-            )
-            return True
-
-        elif self.mode == "live":
-            # Live trading: place actual order via IBKR
-            print(f"[LIVE] Placing order: {trade_intent.side} {trade_intent.quantity} {trade_intent.symbol_root} @ {trade_intent.limit_price}")
+    async def _execute_live(self, trade_intent: TradeIntent, trade_id: int) -> bool:
+        """Live-mode execution: place the actual order via IBKR."""
+        log.info("[LIVE] Placing order: %s %s %s @ %s",
+                 trade_intent.side, trade_intent.quantity, trade_intent.symbol_root, trade_intent.limit_price)
 
-            # Get the contract
+        # Prefer the contract resolved during evaluation; re-resolving by
+        # symbol_root/side here could even map to the wrong right
+        contract = trade_intent._contract
+        if contract is None:
             contract = self.contract_factory.get_forecastex_contract(
                 trade_intent.symbol_root,
                 trade_intent.strike,
@@ -207,39 +353,58 @@ class ExecutionEngine:
                 is_yes=(trade_intent.side == "BUY")  # Simplified assumption
             )
 
-            if not contract:
-                print(f"Error: Could not find contract for {trade_intent.symbol_root}")
-                self.ledger.update_trade_status(trade_id, "FAILED", notes="Contract not found")
+        if not contract:
+            log.error("Could not find contract for %s", trade_intent.symbol_root)
+            self.ledger.update_trade_status(trade_id, "FAILED", notes="Contract not found")
+            return False
+
+        # Create the order
+        order = Order(
+            action=trade_intent.side,
+            totalQuantity=trade_intent.quantity,
+            orderType=trade_intent.order_type,
+            lmtPrice=trade_intent.limit_price
+        )
+
+        # Place the order
+        try:
+            trade = self.ibkr_client.place_order(contract, order)
+            if trade:
+                self.ledger.update_trade_status(
+                    trade_id,
+                    "EXECUTED",
+                    transaction_id=str(trade.order.orderId),
+                    notes=f"Live order placed: {trade.orderStatus.status}"
+                )
+                return True
+            else:
+                self.ledger.update_trade_status(trade_id, "FAILED", notes="Order placement failed")
                 return False
+        except Exception as e:
+            log.error("Error placing order: %s", e)
+            self.ledger.update_trade_status(trade_id, "FAILED", notes=f"Exception: {str(e)}")
+            return False
 
-            # Create the order
-            order = Order(
-                action=trade_intent.side,
-                totalQuantity=trade_intent.quantity,
-                orderType=trade_intent.order_type,
-                lmtPrice=trade_intent.limit_price
-            )
+    async def execute_all(self, intents: List[TradeIntent]) -> List[bool]:
+        """
+        Executes a batch of TradeIntents inside one ledger transaction.
 
-            # Place the order
-            try:
-                trade = self.ibkr_client.place_order(contract, order)
-                if trade:
-                    self.ledger.update_trade_status(
-                        trade_id,
-                        "EXECUTED",
-                        transaction_id=str(trade.order.orderId),
-                        notes=f"Live order placed: {trade.orderStatus.status}"
-                    )
-                    return True
-                else:
-                    self.ledger.update_trade_status(trade_id, "FAILED", notes="Order placement failed")
-                    return False
-            except Exception as e:
-                print(f"Error placing order: {e}")
-                self.ledger.update_trade_status(trade_id, "FAILED", notes=f"Exception: {str(e)}")
-                return False
+        All record/status writes share a single SQLite commit instead of
+        two fsyncs per trade.
+
+        Args:
+            intents: TradeIntents to execute (None entries are skipped).
+        Returns:
+            One success flag per executed intent, in input order.
+        """
+        intents = [intent for intent in intents if intent is not None]
+        if not intents:
+            return []
 
-        return False
+        with self.ledger.batch():
+            return await asyncio.gather(
+                *[self.execute_trade_intent(intent) for intent in intents]
+            )
 
     async def evaluate_arb_opportunity(
         self,
@@ -270,28 +435,37 @@ class ExecutionEngine:
         )
 
         if not contract:
-            print(f"Warning: Could not find contract for {description}")
+            log.warning("Could not find contract for %s", description)
             return None
 
         # Get current market price
         p_fx_market = await self.get_contract_price(contract)
 
         if p_fx_market is None:
-            print(f"Warning: Could not get market price for {description}")
+            log.warning("Could not get market price for %s", description)
             return None
 
         # Calculate arb spread
         arb_spread = self.calculate_arb_spread(p_poly, p_fx_market, days_to_expiry)
 
-        print(f"\nArb Analysis for {description}:")
-        print(f"  Polymarket prob: {p_poly:.4f}")
-        print(f"  ForecastEx price: {p_fx_market:.4f}")
-        print(f"  Yield-adjusted fair: {self.calculate_yield_adjusted_fair_value(p_poly, days_to_expiry):.4f}")
-        print(f"  Arb spread: {arb_spread:.4f} ({arb_spread*100:.2f}%)")
+        # Guard the multi-line analysis block so the formatting work only
+        # happens when DEBUG output is actually emitted
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                "Arb Analysis for %s:\n"
+                "  Polymarket prob: %.4f\n"
+                "  ForecastEx price: %.4f\n"
+                "  Yield-adjusted fair: %.4f\n"
+                "  Arb spread: %.4f (%.2f%%)",
+                description, p_poly, p_fx_market,
+                self.calculate_yield_adjusted_fair_value(p_poly, days_to_expiry),
+                arb_spread, arb_spread * 100
+            )
 
         # Check if arb exceeds threshold
         if arb_spread > self.arb_threshold:
-            print(f"  -> ARB OPPORTUNITY DETECTED! Spread {arb_spread*100:.2f}% > threshold {self.arb_threshold*100:.2f}%")
+            log.info("ARB OPPORTUNITY DETECTED for %s! Spread %.2f%% > threshold %.2f%%",
+                     description, arb_spread * 100, self.arb_threshold * 100)
 
             # Create trade intent to buy at ForecastEx (it's undervalued)
             trade_intent = self.create_trade_intent(
@@ -302,12 +476,14 @@ class ExecutionEngine:
                 side="BUY",
                 quantity=quantity,
                 limit_price=p_fx_market,
-                notes=f"Arb opp: spread={arb_spread*100:.2f}%, poly={p_poly:.4f}, fx={p_fx_market:.4f}"
+                notes=f"Arb opp: spread={arb_spread*100:.2f}%, poly={p_poly:.4f}, fx={p_fx_market:.4f}",
+                contract=contract
             )
 
             return trade_intent
         else:
-            print(f"  -> No arb: spread {arb_spread*100:.2f}% < threshold {self.arb_threshold*100:.2f}%")
+            log.debug("No arb for %s: spread %.2f%% < threshold %.2f%%",
+                      description, arb_spread * 100, self.arb_threshold * 100)
             return None
 
 
@@ -1,15 +1,73 @@
 import asyncio
-from ib_insync import IB, Contract, Order, Position, Ticker
+import functools
+import logging
+# ib_async is the actively maintained fork of ib_insync with the same API;
+# fall back for environments that still have the old package
+try:
+    from ib_async import IB, Contract, Order, Position, Ticker
+except ImportError:
+    from ib_insync import IB, Contract, Order, Position, Ticker
 from typing import List, Optional, Callable, Any
 from src.signal_server.config import settings
 
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+
+class NotConnectedError(ConnectionError):
+    """Raised when an IBKR operation is attempted without a connection."""
+
+
+def _requires_connection(fn):
+    """Gates a sync method on the connection state in one place."""
+    @functools.wraps(fn)
+    def wrapper(self, *args, **kwargs):
+        if not self._connected:
+            raise NotConnectedError(fn.__name__)
+        return fn(self, *args, **kwargs)
+    return wrapper
+
+
+def _requires_connection_async(fn):
+    """Async variant of _requires_connection."""
+    @functools.wraps(fn)
+    async def wrapper(self, *args, **kwargs):
+        if not self._connected:
+            raise NotConnectedError(fn.__name__)
+        return await fn(self, *args, **kwargs)
+    return wrapper
+
+
 class IBKRClient:
-    """Client for interacting with Interactive Brokers TWS API via ib_insync."""
+    """Client for interacting with Interactive Brokers TWS API via ib_async."""
 
     def __init__(self):
         """Initializes the IBKRClient but does not connect immediately."""
         self.ib = IB()
         self._connected = False
+        # Contract-details cache: repeated lookups for the same search
+        # criteria (common when placing orders) skip the TWS round-trip
+        self._cd_cache: dict = {}
+        # Fully-qualified contracts (conId resolved), keyed like _cd_cache,
+        # so repeat requests skip TWS-side re-resolution
+        self._qualified: dict = {}
+        # Per-contract tick handlers, fanned out from one
+        # pendingTickersEvent hook (registered lazily on first subscribe)
+        self._handlers: dict = {}
+        self._tickers_hooked = False
+
+    @staticmethod
+    def _cd_key(contract: Contract) -> tuple:
+        """Hashable cache key from a Contract's search criteria."""
+        return (
+            contract.symbol,
+            contract.secType,
+            contract.exchange,
+            contract.currency,
+            contract.lastTradeDateOrContractMonth,
+            contract.strike,
+            contract.right,
+        )
 
     async def connect(self, host: str = None, port: int = None, client_id: int = None):
         """
@@ -27,112 +85,293 @@ class IBKRClient:
             client_id = settings.IB_CLIENT_ID
 
         if not self._connected:
-            print(f"Connecting to IBKR at {host}:{port} with client ID {client_id}...")
+            log.info("Connecting to IBKR at %s:%s with client ID %s...", host, port, client_id)
             try:
-                self.ib.connect(host, port, client_id)
+                # connectAsync keeps the event loop running during the TWS
+                # handshake; the sync connect() would block every other task
+                await self.ib.connectAsync(host, port, clientId=client_id, timeout=10)
                 self._connected = True
-                print("Connected to IBKR successfully.")
+                # TWS-initiated drops must clear the flag too, or the
+                # decorator gate would drift from the real socket state
+                self.ib.disconnectedEvent += self._on_disconnected
+                log.info("Connected to IBKR successfully.")
             except Exception as e:
-                print(f"Error connecting to IBKR: {e}")
+                log.error("Error connecting to IBKR: %s", e)
                 self._connected = False
         else:
-            print("Already connected to IBKR.")
+            log.debug("Already connected to IBKR.")
+
+    def _on_disconnected(self):
+        """Keeps the connection flag in sync when TWS drops the session."""
+        self._connected = False
 
     def disconnect(self):
         """
         Disconnects from the IBKR TWS or Gateway.
         """
         if self._connected:
-            print("Disconnecting from IBKR...")
+            log.info("Disconnecting from IBKR...")
             self.ib.disconnect()
             self._connected = False
-            print("Disconnected from IBKR.")
+            log.info("Disconnected from IBKR.")
 
+    @_requires_connection
     def get_contract_details(self, contract: Contract) -> List[Contract]:
         """
         Requests contract details for a given contract object.
         Args:
-            contract: An ib_insync.Contract object with search criteria.
+            contract: An ib_async.Contract object with search criteria.
         Returns:
-            A list of matching ib_insync.Contract objects.
+            A list of matching ib_async.Contract objects.
         """
-        if not self._connected:
-            print("Not connected to IBKR. Cannot get contract details.")
-            return []
-        print(f"Requesting contract details for {contract.symbol} {contract.secType}@{contract.exchange}...")
+        key = self._cd_key(contract)
+        cached = self._cd_cache.get(key)
+        if cached is not None:
+            return cached
+        log.debug("Requesting contract details for %s %s@%s...", contract.symbol, contract.secType, contract.exchange)
         details = self.ib.reqContractDetails(contract)
-        return [d.contract for d in details]
+        contracts = [d.contract for d in details]
+        self._cd_cache[key] = contracts
+        return contracts
+
+    @_requires_connection_async
+    async def get_contract_details_async(self, contract: Contract) -> List[Contract]:
+        """
+        Async variant of get_contract_details; multiple calls can be kept
+        in flight concurrently since TWS pipelines reqContractDetails.
+        Args:
+            contract: An ib_async.Contract object with search criteria.
+        Returns:
+            A list of matching ib_async.Contract objects.
+        """
+        key = self._cd_key(contract)
+        cached = self._cd_cache.get(key)
+        if cached is not None:
+            return cached
+        details = await self.ib.reqContractDetailsAsync(contract)
+        contracts = [d.contract for d in details]
+        self._cd_cache[key] = contracts
+        return contracts
+
+    @_requires_connection_async
+    async def get_contract_details_many(self, contracts: List[Contract]) -> List[List[Contract]]:
+        """
+        Resolves many contracts at once: cache hits are returned directly
+        and all misses are fired as concurrent reqContractDetailsAsync
+        calls, turning N serial round-trips into one pipelined batch.
+        Args:
+            contracts: ib_async.Contract objects with search criteria.
+        Returns:
+            One list of matching Contracts per input, in input order.
+        """
+        results: List[Optional[List[Contract]]] = []
+        misses: dict = {}  # key -> (contract, [result indices])
+        for contract in contracts:
+            key = self._cd_key(contract)
+            cached = self._cd_cache.get(key)
+            results.append(cached)
+            if cached is None:
+                misses.setdefault(key, (contract, []))[1].append(len(results) - 1)
+
+        if misses:
+            fetched = await asyncio.gather(
+                *[self.ib.reqContractDetailsAsync(c) for c, _ in misses.values()]
+            )
+            for (key, (_, indices)), details in zip(misses.items(), fetched):
+                resolved = [d.contract for d in details]
+                self._cd_cache[key] = resolved
+                for idx in indices:
+                    results[idx] = resolved
+
+        return results
 
+    async def qualify(self, contract: Contract) -> Contract:
+        """
+        Returns the fully-qualified version of a contract (conId set),
+        resolving via TWS only on the first request per search key.
+        Args:
+            contract: An ib_async.Contract object, raw or already qualified.
+        Returns:
+            The qualified Contract (the input itself if it already has a conId).
+        """
+        if contract.conId:
+            return contract
+        key = self._cd_key(contract)
+        cached = self._qualified.get(key)
+        if cached is not None:
+            return cached
+        qualified = await self.ib.qualifyContractsAsync(contract)
+        if not qualified:
+            log.warning("Could not qualify contract %s %s@%s",
+                        contract.symbol, contract.secType, contract.exchange)
+            return contract
+        self._qualified[key] = qualified[0]
+        return qualified[0]
+
+    @_requires_connection_async
     async def req_market_data(self, contract: Contract, handler: Optional[Callable[[Ticker], None]] = None) -> Ticker:
         """
         Requests streaming market data for a contract.
-        Note: ib_insync automatically manages subscriptions and provides a ticker object.
+        Note: ib_async automatically manages subscriptions and provides a ticker object.
         For continuous streaming, you'd typically process the `ib.pendingTickersEvent` or attach handlers to ticker.updateEvent.
         This method sets up the request and can attach a handler to the contract's ticker.
         Args:
-            contract: The ib_insync.Contract object for which to request data.
+            contract: The ib_async.Contract object for which to request data.
             handler: An optional callable that takes a Ticker object and processes it.
         Returns:
             The Ticker object for the contract.
         """
-        if not self._connected:
-            print("Not connected to IBKR. Cannot request market data.")
-            return None
-        print(f"Requesting market data for {contract.symbol} {contract.secType}@{contract.exchange}...")
+        contract = await self.qualify(contract)
+        log.debug("Requesting market data for %s %s@%s...", contract.symbol, contract.secType, contract.exchange)
         self.ib.reqMktData(contract, '', False, False)
         ticker = self.ib.ticker(contract)
 
         if handler:
             # Attach a handler to the ticker's update event
             ticker.updateEvent += handler
-            print(f"Attached update handler to ticker for {contract.symbol}")
+            log.debug("Attached update handler to ticker for %s", contract.symbol)
+
+        return ticker
+
+
+    @_requires_connection_async
+    async def subscribe_market_data(self, contracts: List[Contract], handler: Callable[[Ticker], None]) -> List[Ticker]:
+        """
+        Subscribes to streaming market data for a batch of contracts.
+
+        All contracts are qualified in one qualifyContractsAsync call and
+        the reqMktData requests are issued back to back (no await between
+        them), so the whole batch goes out in one network flush. Updates
+        are delivered through a single pendingTickersEvent hook that fans
+        out to the per-contract handler, instead of one callback
+        registration (and event-loop wakeup) per ticker.
+
+        Args:
+            contracts: The ib_async.Contract objects to subscribe to.
+            handler: A callable invoked with the Ticker on each update.
+        Returns:
+            The Ticker objects for the contracts, in input order.
+        """
+        # Only round-trip for contracts not already qualified, and feed the
+        # results into the qualification cache for later single requests
+        unqualified = [c for c in contracts if not c.conId]
+        if unqualified:
+            await self.ib.qualifyContractsAsync(*unqualified)
+            for contract in unqualified:
+                if contract.conId:
+                    self._qualified[self._cd_key(contract)] = contract
+
+        tickers = []
+        for contract in contracts:
+            self.ib.reqMktData(contract, '', False, False)
+            self._handlers[contract.conId] = handler
+            tickers.append(self.ib.ticker(contract))
+
+        if not self._tickers_hooked:
+            self.ib.pendingTickersEvent += self._on_tickers
+            self._tickers_hooked = True
+
+        log.info("Subscribed to market data for %d contract(s)", len(contracts))
+        return tickers
+
+    @_requires_connection
+    def req_tick_by_tick(self, contract: Contract, tick_type: str = 'BidAsk', handler: Optional[Callable[[Ticker], None]] = None) -> Optional[Ticker]:
+        """
+        Requests raw tick-by-tick data for a contract.
+
+        reqMktData delivers 250 ms aggregated snapshots; for
+        latency-sensitive signal paths this subscribes to raw ticks
+        instead, removing that aggregation floor.
+
+        Args:
+            contract: The ib_async.Contract object to subscribe to.
+            tick_type: One of 'Last', 'AllLast', 'BidAsk', 'MidPoint'.
+            handler: An optional callable invoked with the Ticker on each tick.
+        Returns:
+            The Ticker object for the contract, or None if not connected.
+        """
+        if tick_type not in ('Last', 'AllLast', 'BidAsk', 'MidPoint'):
+            raise ValueError(f"Invalid tick_type: {tick_type}. Must be 'Last', 'AllLast', 'BidAsk' or 'MidPoint'.")
+        log.debug("Requesting tick-by-tick %s data for %s...", tick_type, contract.symbol)
+        # numberOfTicks=0 requests a live stream rather than a historical snapshot
+        ticker = self.ib.reqTickByTickData(contract, tick_type, 0, False)
+
+        if handler:
+            ticker.updateEvent += handler
 
         return ticker
 
+    def _on_tickers(self, tickers):
+        """Fans pending ticker updates out to the registered handlers."""
+        for ticker in tickers:
+            handler = self._handlers.get(ticker.contract.conId)
+            if handler:
+                handler(ticker)
 
+    @_requires_connection
     def place_order(self, contract: Contract, order: Order) -> Optional[Any]: # OrderState or Trade
         """
         Places an order with IBKR.
         Args:
-            contract: The ib_insync.Contract object for the order.
-            order: The ib_insync.Order object to place.
+            contract: The ib_async.Contract object for the order.
+            order: The ib_async.Order object to place.
         Returns:
             The Trade object if successful, None otherwise.
         """
-        if not self._connected:
-            print("Not connected to IBKR. Cannot place order.")
-            return None
-        print(f"Placing order: {order.action} {order.totalQuantity} {contract.symbol} at {order.lmtPrice}...")
+        log.debug("Placing order: %s %s %s at %s...", order.action, order.totalQuantity, contract.symbol, order.lmtPrice)
         trade = self.ib.placeOrder(contract, order)
         if trade.isDone():
-            print(f"Order {trade.order.orderId} for {trade.contract.symbol} is done. Status: {trade.orderStatus.status}")
+            log.info("Order %s for %s is done. Status: %s", trade.order.orderId, trade.contract.symbol, trade.orderStatus.status)
         else:
-            print(f"Order {trade.order.orderId} for {trade.contract.symbol} placed. Current status: {trade.orderStatus.status}")
+            log.info("Order %s for %s placed. Current status: %s", trade.order.orderId, trade.contract.symbol, trade.orderStatus.status)
         return trade
 
-    def req_positions(self) -> List[Position]:
+    @_requires_connection
+    def place_orders(self, orders: List) -> List[Any]:
         """
-        Requests current open positions from IBKR.
+        Places a basket of orders in one pass.
+
+        ib_async's placeOrder is non-blocking and returns a Trade
+        immediately, so issuing all legs back to back fills the client's
+        send queue and lets it flush them in one socket write instead of
+        paying a round-trip per leg. Await trade.filledEvent on the
+        returned Trades if fills need to be tracked.
+
+        Args:
+            orders: (Contract, Order) pairs to submit.
         Returns:
-            A list of ib_insync.Position objects.
+            The Trade objects, in input order.
         """
-        if not self._connected:
-            print("Not connected to IBKR. Cannot request positions.")
-            return []
-        print("Requesting open positions...")
+        trades = [self.ib.placeOrder(contract, order) for contract, order in orders]
+        log.info("Placed %d order(s)", len(trades))
+        return trades
+
+    @_requires_connection
+    def req_positions(self, limit: Optional[int] = None) -> List[Position]:
+        """
+        Returns current open positions from IBKR.
+
+        ib_async keeps the position list synchronized locally after the
+        initial subscription, so this is a cache read, not a round-trip.
+        Args:
+            limit: Optional cap on the number of positions returned.
+        Returns:
+            A list of ib_async.Position objects.
+        """
+        log.debug("Requesting open positions...")
         positions = self.ib.positions()
+        if limit is not None:
+            return positions[:limit]
         return positions
 
+    @_requires_connection
     def get_next_order_id(self) -> int:
         """
         Gets the next valid order ID from IBKR.
         Returns:
             An integer representing the next available order ID.
         """
-        if not self._connected:
-            print("Not connected to IBKR. Cannot get next order ID.")
-            return -1 # Or raise an error
-        # ib_insync automatically manages client.nextValidOrderId
+        # ib_async automatically manages client.nextValidOrderId
         return self.ib.client.getReqId()
 
 
@@ -161,4 +400,12 @@ async def main():
     client.disconnect()
 
 if __name__ == "__main__":
+    # uvloop cuts per-wakeup overhead on the socket-heavy IBKR callback
+    # traffic; same opt-in pattern as the bot entrypoints
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     asyncio.run(main())
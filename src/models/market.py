@@ -0,0 +1,25 @@
+import sys
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List
+
+# slots=True keeps Market instances __dict__-free but only exists on
+# Python 3.10+; the 3.9 floor gets the plain dataclass layout
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
+class Market:
+    """A watchlist entry mapping a Polymarket market to a ForecastEx contract."""
+    polymarket_id: str   # Polymarket condition ID
+    description: str     # Human description (e.g., "US CPI YoY")
+    strike: float
+    expiry_date: str     # YYYY-MM-DD format
+    is_yes: bool
+    keywords: List[str] = field(default_factory=list)
+    tags: List[str] = field(default_factory=list)
+    expiry_dt: datetime = field(init=False)
+
+    def __post_init__(self):
+        # Parse once; the hot loops only ever read the datetime
+        self.expiry_dt = datetime.strptime(self.expiry_date, "%Y-%m-%d")
@@ -1,9 +1,16 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 from datetime import datetime, timezone
-from typing import Literal, Optional
+from typing import Any, Literal, Optional
 
 class TradeIntent(BaseModel):
-    """Pydantic model for a trade intention, used for paper trading and logging."""
+    """
+    Pydantic model for a trade intention, used for paper trading and logging.
+
+    Frozen: intents are immutable once created (and therefore hashable);
+    status lives in the ledger, which is the system of record for updates.
+    """
+    model_config = ConfigDict(frozen=True)
+
     venue: str
     market_type: str # e.g., "Binary Option", "Prediction Market"
     symbol_root: str # e.g., "USCPI", "BTCQ"
@@ -11,7 +18,7 @@ class TradeIntent(BaseModel):
     expiry: str      # YYYYMMDD format
     side: Literal['BUY', 'SELL']
     quantity: float
-    limit_price: float
+    limit_price: float = Field(ge=0.0, le=1.0)
     order_type: Literal['LMT'] = 'LMT'
     mode: Literal['paper', 'live']
     timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
@@ -19,3 +26,40 @@ class TradeIntent(BaseModel):
     transaction_id: Optional[str] = None # IBKR orderId or similar
     notes: Optional[str] = None
 
+    # Transient: the already-resolved IBKR Contract, carried through so
+    # execution doesn't re-resolve it. Excluded from dumps/ledger rows.
+    _contract: Optional[Any] = PrivateAttr(default=None)
+
+    # Transient: memoized ledger insert row (intents are frozen, so the
+    # tuple can never go stale)
+    _db_row: Optional[tuple] = PrivateAttr(default=None)
+
+    def as_db_row(self) -> tuple:
+        """
+        Flattens the intent into the ledger INSERT parameter tuple.
+
+        Built once per intent: repeat inserts of the same intent (batch
+        replays, retries) reuse the cached tuple instead of re-running
+        fourteen attribute reads and an isoformat().
+        """
+        row = self._db_row
+        if row is None:
+            row = (
+                self.venue,
+                self.market_type,
+                self.symbol_root,
+                self.strike,
+                self.expiry,
+                self.side,
+                self.quantity,
+                self.limit_price,
+                self.order_type,
+                self.mode,
+                self.timestamp.isoformat(),
+                self.status,
+                self.transaction_id,
+                self.notes
+            )
+            self._db_row = row
+        return row
+
@@ -2,10 +2,76 @@
 News API client for fetching financial news related to prediction market events.
 Supports NewsAPI and Alpha Vantage.
 """
+import asyncio
+import logging
+import re
 import requests
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from requests.adapters import HTTPAdapter, Retry
+from typing import List, Dict, Any, NamedTuple, Optional
 from datetime import datetime, timedelta
 import os
+import time
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    # orjson decodes news payloads several times faster than stdlib json
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    import json
+    _loads = json.loads
+
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+
+class Article(NamedTuple):
+    """
+    One normalized news article. A NamedTuple keeps each record in a
+    single contiguous slot array (vs ~200+ bytes per dict) and makes
+    field access a C-level index fetch for the sentiment scorer's loops.
+    sentiment_score is None unless the provider pre-scored the article
+    (Alpha Vantage does).
+    """
+    title: str = ''
+    description: str = ''
+    content: str = ''
+    source: str = 'Unknown'
+    publishedAt: str = ''
+    url: str = ''
+    sentiment_score: Optional[float] = None
+    sentiment_label: str = 'Neutral'
+
+# Keyword-extraction constants hoisted out of match_event_to_keywords so
+# each call skips the regex compile and dict/frozenset rebuild
+_PUNCT_RE = re.compile(r'[^\w\s]')
+_STOPWORDS = frozenset(('will', 'than', 'above', 'below', 'before', 'after', 'this', 'that'))
+_ECON_KEYWORDS = {
+    'cpi': ['CPI', 'inflation', 'consumer price'],
+    'gdp': ['GDP', 'economic growth', 'gross domestic product'],
+    'unemployment': ['unemployment', 'jobless', 'employment rate'],
+    'fed': ['Federal Reserve', 'Fed rate', 'interest rate', 'FOMC'],
+    'jobs': ['jobs report', 'nonfarm payroll', 'employment'],
+    'pce': ['PCE', 'personal consumption', 'core inflation'],
+    'housing': ['housing', 'home sales', 'real estate'],
+    'retail': ['retail sales', 'consumer spending'],
+    'manufacturing': ['manufacturing', 'PMI', 'factory orders']
+}
+
+
+@lru_cache(maxsize=256)
+def _join_query(keys_tuple: tuple) -> str:
+    """
+    Memoized NewsAPI query string for a (sorted) keyword tuple. Repeated
+    polls for the same watchlist keywords skip the per-call join; URL
+    encoding is left to the HTTP client so nothing is double-escaped.
+    """
+    return ' OR '.join(keys_tuple)
 
 
 class NewsClient:
@@ -14,27 +80,87 @@ class NewsClient:
     Free tier limitations: NewsAPI allows 100 requests/day, 7-day history.
     """
 
-    def __init__(self, newsapi_key: Optional[str] = None, alphavantage_key: Optional[str] = None):
+    # Identical queries within this window return the cached response
+    # instead of burning free-tier quota (NewsAPI: 100 requests/day)
+    CACHE_TTL = 300.0
+    MAX_CACHE_ENTRIES = 256
+
+    def __init__(
+        self,
+        newsapi_key: Optional[str] = None,
+        alphavantage_key: Optional[str] = None,
+        session: Optional[requests.Session] = None
+    ):
         """
         Initialize news clients.
 
         Args:
             newsapi_key: NewsAPI key (get free at https://newsapi.org)
             alphavantage_key: Alpha Vantage key (get free at https://www.alphavantage.co)
+            session: Optional shared requests.Session for connection pooling.
         """
         self.newsapi_key = newsapi_key or os.getenv('NEWSAPI_KEY')
         self.alphavantage_key = alphavantage_key or os.getenv('ALPHAVANTAGE_KEY')
 
+        if session is None:
+            # Keep-alive pool so repeat calls to the same provider skip the
+            # TCP+TLS handshake, with bounded retries on transient errors
+            session = requests.Session()
+            session.mount('https://', HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=16,
+                max_retries=Retry(
+                    total=2,
+                    backoff_factor=0.2,
+                    status_forcelist=[429, 500, 502, 503, 504]
+                )
+            ))
+        self.session = session
+
         self.newsapi_base = "https://newsapi.org/v2"
         self.alphavantage_base = "https://www.alphavantage.co/query"
 
+        # Lazily created inside the running event loop by afetch_news_for_event
+        self._async_session = None
+
+        # TTL response cache, shared by the sync and async fetch paths
+        self._cache: Dict[tuple, tuple] = {}
+
+    def _cache_get(self, key: tuple) -> Optional[List[Article]]:
+        """Returns the cached article list for key if still within TTL."""
+        entry = self._cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < self.CACHE_TTL:
+            return entry[1]
+        return None
+
+    def _cache_put(self, key: tuple, articles: List[Article]):
+        """Caches a provider response, evicting the oldest entry when full."""
+        if len(self._cache) >= self.MAX_CACHE_ENTRIES:
+            self._cache.pop(next(iter(self._cache)))
+        self._cache[key] = (time.monotonic(), articles)
+
+    async def _ensure_async_session(self):
+        """Creates the shared aiohttp session on first async use."""
+        if aiohttp is None:
+            raise RuntimeError("aiohttp is required for async news fetching")
+        if self._async_session is None or self._async_session.closed:
+            self._async_session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=10)
+            )
+        return self._async_session
+
+    async def aclose(self):
+        """Closes the async session if one was created."""
+        if self._async_session is not None and not self._async_session.closed:
+            await self._async_session.close()
+
     def fetch_news_for_event(
         self,
         keywords: List[str],
         from_date: Optional[datetime] = None,
         language: str = "en",
         max_results: int = 10
-    ) -> List[Dict[str, Any]]:
+    ) -> List[Article]:
         """
         Fetch news articles related to an event.
 
@@ -45,7 +171,7 @@ class NewsClient:
             max_results: Maximum number of articles to return
 
         Returns:
-            List of news articles with title, description, source, publishedAt
+            List of Article records (title, description, source, publishedAt, ...)
         """
         if not from_date:
             from_date = datetime.now() - timedelta(days=7)
@@ -58,7 +184,7 @@ class NewsClient:
                 newsapi_articles = self._fetch_from_newsapi(keywords, from_date, language, max_results)
                 articles.extend(newsapi_articles)
             except Exception as e:
-                print(f"NewsAPI fetch failed: {e}")
+                log.warning("NewsAPI fetch failed: %s", e)
 
         # Fallback to Alpha Vantage news sentiment
         if len(articles) < max_results and self.alphavantage_key:
@@ -66,7 +192,7 @@ class NewsClient:
                 av_articles = self._fetch_from_alphavantage(keywords, max_results - len(articles))
                 articles.extend(av_articles)
             except Exception as e:
-                print(f"Alpha Vantage fetch failed: {e}")
+                log.warning("Alpha Vantage fetch failed: %s", e)
 
         return articles[:max_results]
 
@@ -76,16 +202,19 @@ class NewsClient:
         from_date: datetime,
         language: str,
         max_results: int
-    ) -> List[Dict[str, Any]]:
+    ) -> List[Article]:
         """Fetch from NewsAPI."""
         if not self.newsapi_key:
             return []
 
-        # Build query
-        query = " OR ".join(keywords)
+        keys = tuple(sorted(keywords))
+        cache_key = ('newsapi', keys, from_date.date(), language, max_results)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
 
         params = {
-            'q': query,
+            'q': _join_query(keys),
             'from': from_date.strftime('%Y-%m-%d'),
             'language': language,
             'sortBy': 'publishedAt',
@@ -93,32 +222,41 @@ class NewsClient:
             'apiKey': self.newsapi_key
         }
 
-        response = requests.get(f"{self.newsapi_base}/everything", params=params, timeout=10)
+        response = self.session.get(f"{self.newsapi_base}/everything", params=params, timeout=10)
         response.raise_for_status()
 
-        data = response.json()
+        articles = self._parse_newsapi_response(_loads(response.content))
+        self._cache_put(cache_key, articles)
+        return articles
 
+    @staticmethod
+    def _parse_newsapi_response(data: Dict[str, Any]) -> List[Article]:
+        """Converts a NewsAPI JSON payload to Article records."""
         if data.get('status') != 'ok':
             raise Exception(f"NewsAPI error: {data.get('message', 'Unknown error')}")
 
-        articles = []
-        for article in data.get('articles', []):
-            articles.append({
-                'title': article.get('title', ''),
-                'description': article.get('description', ''),
-                'content': article.get('content', ''),
-                'source': article.get('source', {}).get('name', 'Unknown'),
-                'publishedAt': article.get('publishedAt', ''),
-                'url': article.get('url', '')
-            })
-
-        return articles
-
-    def _fetch_from_alphavantage(self, keywords: List[str], max_results: int) -> List[Dict[str, Any]]:
+        # Single comprehension with dict.get bound locally: skips the
+        # per-article method lookups in the projection loop
+        get = dict.get
+        return [Article(
+            title=get(a, 'title', ''),
+            description=get(a, 'description', ''),
+            content=get(a, 'content', ''),
+            source=get(get(a, 'source') or {}, 'name', 'Unknown'),
+            publishedAt=get(a, 'publishedAt', ''),
+            url=get(a, 'url', '')
+        ) for a in get(data, 'articles', ())]
+
+    def _fetch_from_alphavantage(self, keywords: List[str], max_results: int) -> List[Article]:
         """Fetch from Alpha Vantage news sentiment API."""
         if not self.alphavantage_key:
             return []
 
+        cache_key = ('alphavantage', tuple(sorted(keywords)), max_results)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
         # Alpha Vantage uses tickers or topics
         # For general events, use topics
         topics = ','.join(keywords[:5])  # Limit to 5 topics
@@ -130,29 +268,127 @@ class NewsClient:
             'limit': max_results
         }
 
-        response = requests.get(self.alphavantage_base, params=params, timeout=10)
+        response = self.session.get(self.alphavantage_base, params=params, timeout=10)
         response.raise_for_status()
 
-        data = response.json()
+        articles = self._parse_alphavantage_response(_loads(response.content), max_results)
+        self._cache_put(cache_key, articles)
+        return articles
 
+    @staticmethod
+    def _parse_alphavantage_response(data: Dict[str, Any], max_results: int) -> List[Article]:
+        """Converts an Alpha Vantage JSON payload to Article records."""
         if 'feed' not in data:
             raise Exception(f"Alpha Vantage error: {data.get('Note', 'Unknown error')}")
 
-        articles = []
-        for item in data['feed'][:max_results]:
-            articles.append({
-                'title': item.get('title', ''),
-                'description': item.get('summary', ''),
-                'content': item.get('summary', ''),
-                'source': ', '.join([s['name'] for s in item.get('authors', [])]),
-                'publishedAt': item.get('time_published', ''),
-                'url': item.get('url', ''),
-                'sentiment_score': float(item.get('overall_sentiment_score', 0.0)),  # Already scored!
-                'sentiment_label': item.get('overall_sentiment_label', 'Neutral')
-            })
+        get = dict.get
+        return [Article(
+            title=get(item, 'title', ''),
+            description=get(item, 'summary', ''),
+            content=get(item, 'summary', ''),
+            source=', '.join([s['name'] for s in get(item, 'authors', ())]),
+            publishedAt=get(item, 'time_published', ''),
+            url=get(item, 'url', ''),
+            sentiment_score=float(get(item, 'overall_sentiment_score', 0.0)),  # Already scored!
+            sentiment_label=get(item, 'overall_sentiment_label', 'Neutral')
+        ) for item in data['feed'][:max_results]]
+
+    async def _afetch_newsapi(
+        self,
+        keywords: List[str],
+        from_date: datetime,
+        language: str,
+        max_results: int
+    ) -> List[Article]:
+        """Async variant of _fetch_from_newsapi."""
+        if not self.newsapi_key:
+            return []
+
+        keys = tuple(sorted(keywords))
+        cache_key = ('newsapi', keys, from_date.date(), language, max_results)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        params = {
+            'q': _join_query(keys),
+            'from': from_date.strftime('%Y-%m-%d'),
+            'language': language,
+            'sortBy': 'publishedAt',
+            'pageSize': min(max_results, 100),
+            'apiKey': self.newsapi_key
+        }
+
+        session = await self._ensure_async_session()
+        async with session.get(f"{self.newsapi_base}/everything", params=params) as response:
+            response.raise_for_status()
+            data = _loads(await response.read())
+
+        articles = self._parse_newsapi_response(data)
+        self._cache_put(cache_key, articles)
+        return articles
+
+    async def _afetch_alphavantage(self, keywords: List[str], max_results: int) -> List[Article]:
+        """Async variant of _fetch_from_alphavantage."""
+        if not self.alphavantage_key:
+            return []
+
+        cache_key = ('alphavantage', tuple(sorted(keywords)), max_results)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
 
+        params = {
+            'function': 'NEWS_SENTIMENT',
+            'topics': ','.join(keywords[:5]),
+            'apikey': self.alphavantage_key,
+            'limit': max_results
+        }
+
+        session = await self._ensure_async_session()
+        async with session.get(self.alphavantage_base, params=params) as response:
+            response.raise_for_status()
+            data = _loads(await response.read())
+
+        articles = self._parse_alphavantage_response(data, max_results)
+        self._cache_put(cache_key, articles)
         return articles
 
+    async def afetch_news_for_event(
+        self,
+        keywords: List[str],
+        from_date: Optional[datetime] = None,
+        language: str = "en",
+        max_results: int = 10
+    ) -> List[Article]:
+        """
+        Async version of fetch_news_for_event that queries both providers
+        concurrently, so wall time is max(provider latency) rather than
+        the sum. Provider failures are logged and the other provider's
+        results are still returned.
+
+        Args same as fetch_news_for_event.
+        Returns:
+            List of Article records (title, description, source, publishedAt, ...)
+        """
+        if not from_date:
+            from_date = datetime.now() - timedelta(days=7)
+
+        results = await asyncio.gather(
+            self._afetch_newsapi(keywords, from_date, language, max_results),
+            self._afetch_alphavantage(keywords, max_results),
+            return_exceptions=True
+        )
+
+        articles = []
+        for name, result in zip(("NewsAPI", "Alpha Vantage"), results):
+            if isinstance(result, Exception):
+                log.warning("%s fetch failed: %s", name, result)
+            else:
+                articles.extend(result)
+
+        return articles[:max_results]
+
     def match_event_to_keywords(self, event_description: str) -> List[str]:
         """
         Extract relevant keywords from an event description.
@@ -163,35 +399,20 @@ class NewsClient:
         Returns:
             List of keywords for news search
         """
-        # Common economic indicators
-        economic_keywords = {
-            'cpi': ['CPI', 'inflation', 'consumer price'],
-            'gdp': ['GDP', 'economic growth', 'gross domestic product'],
-            'unemployment': ['unemployment', 'jobless', 'employment rate'],
-            'fed': ['Federal Reserve', 'Fed rate', 'interest rate', 'FOMC'],
-            'jobs': ['jobs report', 'nonfarm payroll', 'employment'],
-            'pce': ['PCE', 'personal consumption', 'core inflation'],
-            'housing': ['housing', 'home sales', 'real estate'],
-            'retail': ['retail sales', 'consumer spending'],
-            'manufacturing': ['manufacturing', 'PMI', 'factory orders']
-        }
-
         # Convert to lowercase for matching
         desc_lower = event_description.lower()
 
         keywords = []
 
         # Check for economic indicators
-        for indicator, terms in economic_keywords.items():
+        for indicator, terms in _ECON_KEYWORDS.items():
             if indicator in desc_lower:
                 keywords.extend(terms)
 
-        # Also add the event description itself (cleaned)
-        # Remove common words and special characters
-        import re
-        cleaned = re.sub(r'[^\w\s]', ' ', event_description)
-        words = [w for w in cleaned.split() if len(w) > 3 and w.lower() not in
-                 ['will', 'than', 'above', 'below', 'before', 'after', 'this', 'that']]
+        # Also add the event description itself (cleaned):
+        # remove common words and special characters
+        cleaned = _PUNCT_RE.sub(' ', event_description)
+        words = [w for w in cleaned.split() if len(w) > 3 and w.lower() not in _STOPWORDS]
         keywords.extend(words[:3])  # Add top 3 significant words
 
         return list(set(keywords))  # Remove duplicates
@@ -225,11 +446,11 @@ if __name__ == "__main__":
 
     print(f"Found {len(articles)} articles:")
     for i, article in enumerate(articles, 1):
-        print(f"\n{i}. {article['title']}")
-        print(f"   Source: {article['source']}")
-        print(f"   Published: {article['publishedAt']}")
-        if 'sentiment_score' in article:
-            print(f"   Sentiment: {article['sentiment_label']} ({article['sentiment_score']:.3f})")
+        print(f"\n{i}. {article.title}")
+        print(f"   Source: {article.source}")
+        print(f"   Published: {article.publishedAt}")
+        if article.sentiment_score is not None:
+            print(f"   Sentiment: {article.sentiment_label} ({article.sentiment_score:.3f})")
 
     # Example 2: Fetch Fed news
     print("\n" + "=" * 70)
@@ -243,5 +464,5 @@ if __name__ == "__main__":
 
     print(f"Found {len(articles)} articles:")
     for i, article in enumerate(articles, 1):
-        print(f"\n{i}. {article['title'][:80]}...")
-        print(f"   Source: {article['source']}")
+        print(f"\n{i}. {article.title[:80]}...")
+        print(f"   Source: {article.source}")
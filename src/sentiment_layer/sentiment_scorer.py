@@ -2,54 +2,257 @@
 Sentiment scoring engine using FinBERT or alternative sentiment models.
 Converts news articles into sentiment scores for confidence boosting.
 """
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+import asyncio
+import functools
 import re
 
+import numpy as np
+
+from src.signal_server._kernels import NUMBA_AVAILABLE, agg_scores, kw_hits
+
+_POSITIVE_KEYWORDS = (
+    'surge', 'jump', 'rise', 'gain', 'increase', 'growth', 'expansion',
+    'boom', 'rally', 'soar', 'climb', 'advance', 'bullish', 'optimistic',
+    'beat expectations', 'exceed', 'strong', 'robust', 'positive'
+)
+
+_NEGATIVE_KEYWORDS = (
+    'fall', 'drop', 'decline', 'decrease', 'plunge', 'crash', 'slump',
+    'weak', 'recession', 'downturn', 'bearish', 'pessimistic', 'concern',
+    'miss expectations', 'disappoint', 'worse', 'negative', 'poor'
+)
+
+
+def _keyword_pattern(keywords) -> "re.Pattern":
+    """
+    Compiles one alternation over all keywords (longest first, so
+    re's leftmost-first matching mirrors independent substring checks),
+    turning the O(text x keywords) Python scan into a single C-level pass.
+    """
+    ordered = sorted(keywords, key=len, reverse=True)
+    return re.compile('|'.join(map(re.escape, ordered)))
+
+
+_POS_RE = _keyword_pattern(_POSITIVE_KEYWORDS)
+_NEG_RE = _keyword_pattern(_NEGATIVE_KEYWORDS)
+
+# Individual words from both keyword lists, used by the fast_neutral
+# prefilter to spot texts worth a full model pass
+_FINANCE_VOCAB = frozenset(
+    word
+    for phrase in _POSITIVE_KEYWORDS + _NEGATIVE_KEYWORDS
+    for word in phrase.split()
+)
+
+_TOKEN_STRIP = '.,!?;:"\'()'
+
+
+def _hash_token(token: str) -> int:
+    """32-bit token hash for the JIT'd keyword-hit kernel."""
+    return hash(token) & 0xFFFFFFFF
+
+
+# Sorted keyword-hash arrays for kw_hits (hash() is salted per process,
+# so these must be built at import time, alongside the token hashing)
+_POS_HASHES = np.sort(np.fromiter(
+    (_hash_token(k) for k in _POSITIVE_KEYWORDS), dtype=np.uint32
+))
+_NEG_HASHES = np.sort(np.fromiter(
+    (_hash_token(k) for k in _NEGATIVE_KEYWORDS), dtype=np.uint32
+))
+
 
 class SentimentScorer:
     """
     Sentiment scorer that can use multiple backends:
     1. FinBERT (via transformers) - Best for financial news
-    2. TextBlob - Simple, fast, no dependencies
-    3. Pre-scored (from Alpha Vantage API)
+    2. Distilled FinBERT - 6-layer financial model, ~2x faster at
+       comparable accuracy (stacks with INT8 quantization)
+    3. ONNX FinBERT - Same model via onnxruntime INT8, fastest on CPU
+    4. VADER - Compiled lexicon lookup, fastest per article
+    5. TextBlob - Simple, fast, no dependencies
+    6. Pre-scored (from Alpha Vantage API)
     """
 
-    def __init__(self, method: str = "textblob"):
+    # Pre-exported INT8 FinBERT (see scripts/export_finbert_onnx.py)
+    ONNX_MODEL_PATH = "models/finbert-int8.onnx"
+
+    # Default checkpoints per transformer method
+    FINBERT_MODEL = "ProsusAI/finbert"
+    DISTIL_FINBERT_MODEL = "mrm8488/distilroberta-finetuned-financial-news-sentiment"
+
+    def __init__(self, method: str = "textblob", quantize: bool = True,
+                 model_name: Optional[str] = None, fast_neutral: bool = False):
         """
         Initialize sentiment scorer.
 
         Args:
-            method: Scoring method ("finbert", "textblob", "prescored")
+            method: Scoring method ("finbert", "distil_finbert", "onnx",
+                "vader", "textblob", "prescored")
+            quantize: For FinBERT on CPU, apply dynamic INT8 quantization to
+                the Linear layers at load time (~2-4x faster inference,
+                roughly half the model footprint). Ignored on GPU.
+            model_name: Optional HF checkpoint override for the transformer
+                methods (defaults per method; label order is read from the
+                model config, so alternates with different pos/neg ordering
+                work unchanged).
+            fast_neutral: Opt-in heuristic: short texts (<20 tokens) with
+                no financial vocabulary score 0.0 without a backend pass.
+                Cuts most forward passes on noisy feeds at the cost of
+                missing sentiment phrased outside the keyword lists.
         """
         self.method = method
+        self.quantize = quantize
+        self.fast_neutral = fast_neutral
         self.model = None
         self.tokenizer = None
+        self.device = "cpu"
+
+        # Per-instance LRU: the same headline recurs across polling ticks
+        # and queries, so repeat scores skip the backend entirely. The
+        # cache is bound to this instance, so a method change (new scorer)
+        # starts clean.
+        self._score_text_cached = functools.lru_cache(maxsize=4096)(
+            self._score_text_uncached
+        )
 
         if method == "finbert":
-            self._init_finbert()
+            self._init_finbert(model_name or self.FINBERT_MODEL)
+        elif method == "distil_finbert":
+            self._init_finbert(model_name or self.DISTIL_FINBERT_MODEL)
+        elif method == "onnx":
+            self._init_onnx()
+        elif method == "vader":
+            self._init_vader()
         elif method == "textblob":
             self._init_textblob()
 
-    def _init_finbert(self):
-        """Initialize FinBERT model (requires transformers + torch)."""
+    def _init_finbert(self, model_name: str = FINBERT_MODEL):
+        """Initialize a FinBERT-family model (requires transformers + torch)."""
         try:
             from transformers import AutoTokenizer, AutoModelForSequenceClassification
             import torch
 
-            model_name = "ProsusAI/finbert"
-            self.tokenizer = AutoTokenizer.from_pretrained(model_name)
-            self.model = AutoModelForSequenceClassification.from_pretrained(model_name)
+            self.device = "cuda" if torch.cuda.is_available() else "cpu"
+            # FP16 on GPU halves memory traffic and roughly doubles throughput
+            dtype = torch.float16 if self.device == "cuda" else torch.float32
+
+            # use_fast pins the Rust-backed tokenizer; some installs would
+            # otherwise silently pick the slow Python implementation
+            self.tokenizer = AutoTokenizer.from_pretrained(model_name, use_fast=True)
+            self.model = AutoModelForSequenceClassification.from_pretrained(
+                model_name, torch_dtype=dtype
+            ).to(self.device)
             self.model.eval()
 
-            print(f"✓ FinBERT model loaded: {model_name}")
+            # Label order differs between checkpoints (FinBERT is
+            # [positive, negative, neutral]; distilled variants vary), so
+            # resolve the pos/neg logit columns from the config by name
+            id2label = getattr(self.model.config, 'id2label', None) or {}
+            labels = {str(v).lower(): int(k) for k, v in id2label.items()}
+            self._pos_idx = labels.get('positive', 0)
+            self._neg_idx = labels.get('negative', 1)
+
+            if self.device == "cpu":
+                import os
+                # All cores on the intra-op matmuls, single inter-op queue:
+                # one forward pass at a time, so inter-op parallelism only
+                # adds scheduling overhead
+                torch.set_num_threads(os.cpu_count())
+                try:
+                    torch.set_num_interop_threads(1)
+                except RuntimeError:
+                    pass  # Already set once parallel work has started
+
+            if self.quantize and self.device == "cpu":
+                # Dynamic INT8: Linear layers run through fbgemm (x86) or
+                # qnnpack (ARM) kernels; softmax/LayerNorm stay FP32
+                engines = torch.backends.quantized.supported_engines
+                if 'fbgemm' in engines:
+                    torch.backends.quantized.engine = 'fbgemm'
+                elif 'qnnpack' in engines:
+                    torch.backends.quantized.engine = 'qnnpack'
+                self.model = torch.quantization.quantize_dynamic(
+                    self.model, {torch.nn.Linear}, dtype=torch.qint8
+                )
+                print(f"✓ FinBERT model loaded: {model_name} (cpu, int8)")
+            else:
+                print(f"✓ FinBERT model loaded: {model_name} ({self.device})")
 
         except ImportError:
             print("⚠ FinBERT requires: pip install transformers torch")
-            print("  Falling back to TextBlob")
-            self.method = "textblob"
-            self._init_textblob()
+            print("  Falling back to VADER")
+            self.method = "vader"
+            self._init_vader()
         except Exception as e:
             print(f"⚠ Error loading FinBERT: {e}")
+            print("  Falling back to VADER")
+            self.method = "vader"
+            self._init_vader()
+
+    def _init_onnx(self):
+        """
+        Initialize the ONNX Runtime FinBERT backend.
+
+        Runs the pre-exported INT8 model (scripts/export_finbert_onnx.py)
+        through onnxruntime with full graph optimization: fused attention
+        kernels beat even quantized PyTorch by avoiding per-op dispatch.
+        """
+        try:
+            import os
+            import onnxruntime
+            from transformers import AutoTokenizer
+
+            if not os.path.exists(self.ONNX_MODEL_PATH):
+                raise FileNotFoundError(
+                    f"{self.ONNX_MODEL_PATH} not found. "
+                    "Run scripts/export_finbert_onnx.py first."
+                )
+
+            sess_options = onnxruntime.SessionOptions()
+            sess_options.graph_optimization_level = (
+                onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+            )
+            sess_options.intra_op_num_threads = os.cpu_count()
+
+            self.tokenizer = AutoTokenizer.from_pretrained(
+                self.FINBERT_MODEL, use_fast=True
+            )
+            self._onnx_session = onnxruntime.InferenceSession(
+                self.ONNX_MODEL_PATH,
+                sess_options,
+                providers=["CPUExecutionProvider"]
+            )
+            self._onnx_input_names = {
+                i.name for i in self._onnx_session.get_inputs()
+            }
+
+            print(f"✓ ONNX FinBERT loaded: {self.ONNX_MODEL_PATH}")
+
+        except ImportError:
+            print("⚠ ONNX backend requires: pip install onnxruntime transformers")
+            print("  Falling back to VADER")
+            self.method = "vader"
+            self._init_vader()
+        except Exception as e:
+            print(f"⚠ Error loading ONNX FinBERT: {e}")
+            print("  Falling back to VADER")
+            self.method = "vader"
+            self._init_vader()
+
+    def _init_vader(self):
+        """
+        Initialize VADER (lexicon-based, no tree parse per text).
+        A VADER compound score is a dict lookup per token, typically orders
+        of magnitude cheaper than TextBlob's parse.
+        """
+        try:
+            from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+            self._sia = SentimentIntensityAnalyzer()
+            print("✓ VADER sentiment analyzer ready")
+        except ImportError:
+            print("⚠ VADER not available: pip install vaderSentiment")
             print("  Falling back to TextBlob")
             self.method = "textblob"
             self._init_textblob()
@@ -78,8 +281,23 @@ class SentimentScorer:
         if not text or len(text.strip()) == 0:
             return 0.0
 
-        if self.method == "finbert":
+        if self.fast_neutral:
+            # Early exit: a short headline with no financial vocabulary is
+            # overwhelmingly likely to score neutral anyway
+            tokens = text.lower().split()
+            if len(tokens) < 20 and not (_FINANCE_VOCAB & set(tokens)):
+                return 0.0
+
+        return self._score_text_cached(text)
+
+    def _score_text_uncached(self, text: str) -> float:
+        """Dispatch to the active backend (bypasses the LRU cache)."""
+        if self.method in ("finbert", "distil_finbert"):
             return self._score_finbert(text)
+        elif self.method == "onnx":
+            return self._score_onnx_batch([text])[0]
+        elif self.method == "vader":
+            return self._score_vader(text)
         elif self.method == "textblob":
             return self._score_textblob(text)
         elif self.method == "keywords":
@@ -87,27 +305,104 @@ class SentimentScorer:
         else:
             return 0.0
 
+    # Texts per FinBERT forward pass; bounds padded-batch memory while
+    # keeping the matmuls batched (GEMM rather than per-text GEMV)
+    FINBERT_BATCH_SIZE = 16
+
+    def score_texts_batch(self, texts: List[str]) -> List[float]:
+        """
+        Score many texts at once.
+
+        For FinBERT this stacks texts into padded batches (of at most
+        FINBERT_BATCH_SIZE) and runs one forward pass per batch under
+        inference mode, which is far cheaper than per-text calls
+        (especially on GPU). Other methods fall back to a per-text loop
+        since they have no batch advantage.
+
+        Args:
+            texts: List of texts to analyze
+
+        Returns:
+            List of sentiment scores (-1.0 to +1.0), one per text
+        """
+        if not texts:
+            return []
+
+        if self.method == "onnx":
+            scores: List[float] = []
+            for start in range(0, len(texts), self.FINBERT_BATCH_SIZE):
+                scores.extend(self._score_onnx_batch(texts[start:start + self.FINBERT_BATCH_SIZE]))
+            return scores
+
+        if self.method not in ("finbert", "distil_finbert"):
+            return [self.score_text(text) for text in texts]
+
+        import torch
+
+        scores: List[float] = []
+        for start in range(0, len(texts), self.FINBERT_BATCH_SIZE):
+            chunk = texts[start:start + self.FINBERT_BATCH_SIZE]
+            inputs = self.tokenizer(
+                chunk, padding=True, truncation=True, max_length=256, return_tensors="pt"
+            ).to(self.device)
+
+            with torch.inference_mode():
+                logits = self.model(**inputs).logits
+                predictions = torch.nn.functional.softmax(logits, dim=-1).float().cpu().numpy()
+
+            # Positive minus negative probability, columns per model config
+            scores.extend(
+                (predictions[:, self._pos_idx] - predictions[:, self._neg_idx]).tolist()
+            )
+
+        return scores
+
     def _score_finbert(self, text: str) -> float:
         """Score using FinBERT model."""
         import torch
 
         # Tokenize
-        inputs = self.tokenizer(text, return_tensors="pt", truncation=True, max_length=512)
+        inputs = self.tokenizer(
+            text, return_tensors="pt", truncation=True, max_length=512
+        ).to(self.device)
 
-        # Get prediction
-        with torch.no_grad():
+        # Get prediction (inference_mode skips autograd bookkeeping that
+        # no_grad still performs, e.g. version counters)
+        with torch.inference_mode():
             outputs = self.model(**inputs)
-            predictions = torch.nn.functional.softmax(outputs.logits, dim=-1)
+            predictions = torch.nn.functional.softmax(outputs.logits, dim=-1).float()
 
-        # FinBERT outputs: [positive, negative, neutral]
         # Convert to single score: positive_prob - negative_prob
-        pos_prob = predictions[0][0].item()
-        neg_prob = predictions[0][1].item()
+        # (columns resolved from the model config at init)
+        pos_prob = predictions[0][self._pos_idx].item()
+        neg_prob = predictions[0][self._neg_idx].item()
 
         score = pos_prob - neg_prob  # Range: -1 to +1
 
         return score
 
+    def _score_onnx_batch(self, texts: List[str]) -> List[float]:
+        """Score a batch of texts through the ONNX Runtime session."""
+        import numpy as np
+
+        encoded = self.tokenizer(
+            texts, padding=True, truncation=True, max_length=256, return_tensors="np"
+        )
+        feeds = {k: v for k, v in encoded.items() if k in self._onnx_input_names}
+
+        logits = self._onnx_session.run(None, feeds)[0]
+
+        # Numerically stable softmax over [positive, negative, neutral]
+        logits = logits - logits.max(axis=-1, keepdims=True)
+        exp = np.exp(logits)
+        probs = exp / exp.sum(axis=-1, keepdims=True)
+
+        return (probs[:, 0] - probs[:, 1]).tolist()
+
+    def _score_vader(self, text: str) -> float:
+        """Score using VADER's compound polarity (-1 to +1)."""
+        return self._sia.polarity_scores(text)['compound']
+
     def _score_textblob(self, text: str) -> float:
         """Score using TextBlob polarity."""
         blob = self.textblob(text)
@@ -121,20 +416,21 @@ class SentimentScorer:
         """
         text_lower = text.lower()
 
-        positive_keywords = [
-            'surge', 'jump', 'rise', 'gain', 'increase', 'growth', 'expansion',
-            'boom', 'rally', 'soar', 'climb', 'advance', 'bullish', 'optimistic',
-            'beat expectations', 'exceed', 'strong', 'robust', 'positive'
-        ]
-
-        negative_keywords = [
-            'fall', 'drop', 'decline', 'decrease', 'plunge', 'crash', 'slump',
-            'weak', 'recession', 'downturn', 'bearish', 'pessimistic', 'concern',
-            'miss expectations', 'disappoint', 'worse', 'negative', 'poor'
-        ]
-
-        pos_count = sum(1 for keyword in positive_keywords if keyword in text_lower)
-        neg_count = sum(1 for keyword in negative_keywords if keyword in text_lower)
+        if NUMBA_AVAILABLE:
+            # Hash tokens (words plus bigrams, so phrase keywords still
+            # match) and count hits in the JIT'd kernel; rare hash
+            # collisions are an accepted accuracy tradeoff
+            words = [w.strip(_TOKEN_STRIP) for w in text_lower.split()]
+            grams = words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+            tokens = np.fromiter(
+                (_hash_token(g) for g in grams), dtype=np.uint32, count=len(grams)
+            )
+            pos_count, neg_count = kw_hits(tokens, _POS_HASHES, _NEG_HASHES)
+        else:
+            # One compiled regex pass per polarity; distinct keywords
+            # counted once, matching the old per-keyword membership checks
+            pos_count = len(set(_POS_RE.findall(text_lower)))
+            neg_count = len(set(_NEG_RE.findall(text_lower)))
 
         total = pos_count + neg_count
         if total == 0:
@@ -144,12 +440,13 @@ class SentimentScorer:
         score = (pos_count - neg_count) / total
         return score
 
-    def score_articles(self, articles: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def score_articles(self, articles: List[Any]) -> Dict[str, Any]:
         """
         Score multiple articles and return aggregate sentiment.
 
         Args:
-            articles: List of article dicts with 'title', 'description', 'content'
+            articles: List of Article records from NewsClient (title,
+                description, content, optional provider sentiment_score)
 
         Returns:
             Dict with:
@@ -158,34 +455,66 @@ class SentimentScorer:
                 - confidence: How confident we are (based on agreement)
                 - article_count: Number of articles analyzed
         """
-        if not articles:
-            return {
-                'average_sentiment': 0.0,
-                'sentiment_scores': [],
-                'confidence': 0.0,
-                'article_count': 0
-            }
+        # Split articles into pre-scored (from Alpha Vantage) and texts that
+        # still need scoring, then score the latter in one batched pass
+        # instead of a per-article call.
+        prescored, texts = self._split_articles(articles)
+        return self._aggregate_scores(prescored + self.score_texts_batch(texts))
 
-        scores = []
+    async def score_articles_async(self, articles: List[Any]) -> Dict[str, Any]:
+        """
+        Async variant of score_articles that keeps the event loop free.
+
+        Transformer backends run their batched pass on one worker thread
+        (batching beats a thread per text); lighter backends fan each text
+        out via asyncio.to_thread so scorings overlap while the GIL is
+        released.
+
+        Args:
+            articles: List of Article records from NewsClient
+
+        Returns:
+            Same aggregate dict as score_articles.
+        """
+        prescored, texts = self._split_articles(articles)
+
+        if not texts:
+            scored: List[float] = []
+        elif self.method in ("finbert", "distil_finbert", "onnx"):
+            scored = await asyncio.to_thread(self.score_texts_batch, texts)
+        else:
+            scored = list(await asyncio.gather(
+                *(asyncio.to_thread(self.score_text, text) for text in texts)
+            ))
+
+        return self._aggregate_scores(prescored + scored)
+
+    @staticmethod
+    def _split_articles(articles: List[Any]) -> Tuple[List[float], List[str]]:
+        """Partitions articles into provider-scored values and texts to score."""
+        prescored = []
+        texts = []
 
         for article in articles:
-            # Check if already scored (from Alpha Vantage)
-            if 'sentiment_score' in article and article['sentiment_score'] is not None:
-                scores.append(float(article['sentiment_score']))
+            if article.sentiment_score is not None:
+                prescored.append(float(article.sentiment_score))
                 continue
 
-            # Otherwise, score the text
             # Combine title + description for best signal
-            text = f"{article.get('title', '')} {article.get('description', '')}"
+            text = f"{article.title} {article.description}"
 
             # If still empty, try content
-            if len(text.strip()) < 10 and 'content' in article:
-                text = article['content']
+            if len(text.strip()) < 10:
+                text = article.content
 
             if len(text.strip()) > 0:
-                score = self.score_text(text)
-                scores.append(score)
+                texts.append(text)
+
+        return prescored, texts
 
+    @staticmethod
+    def _aggregate_scores(scores: List[float]) -> Dict[str, Any]:
+        """Builds the aggregate sentiment dict from individual scores."""
         if not scores:
             return {
                 'average_sentiment': 0.0,
@@ -194,18 +523,9 @@ class SentimentScorer:
                 'article_count': 0
             }
 
-        # Calculate statistics
-        avg_sentiment = sum(scores) / len(scores)
-
-        # Confidence based on agreement (low variance = high confidence)
-        import statistics
-        if len(scores) > 1:
-            std_dev = statistics.stdev(scores)
-            # High std dev (0.5+) = low confidence
-            # Low std dev (0.1-) = high confidence
-            confidence = max(0.0, 1.0 - std_dev)
-        else:
-            confidence = 0.5  # Moderate confidence with single article
+        # Aggregate via the JIT'd kernel: mean sentiment plus a confidence
+        # derived from agreement (low variance = high confidence)
+        avg_sentiment, confidence = agg_scores(np.asarray(scores, dtype=np.float64))
 
         return {
             'average_sentiment': avg_sentiment,
@@ -244,11 +564,43 @@ class SentimentScorer:
             boost_factor = 0.5 × 0.8 × 0.20 = 0.08
             boosted = 0.48 × (1 + 0.08) = 0.5184 (51.84%)
         """
-        boost_factor = sentiment_score * sentiment_confidence * max_boost
-        boosted_prob = base_probability * (1 + boost_factor)
+        boosted_prob = base_probability * (
+            1.0 + sentiment_score * sentiment_confidence * max_boost
+        )
+
+        # Cap at valid probability range; conditional expressions skip the
+        # max()/min() call overhead on this hot scalar path
+        return 0.0 if boosted_prob < 0.0 else (1.0 if boosted_prob > 1.0 else boosted_prob)
+
+    def calculate_confidence_boost_batch(
+        self,
+        base_probs,
+        sentiment_scores,
+        sentiment_confidences,
+        max_boost: float = 0.20
+    ) -> np.ndarray:
+        """
+        Vectorized calculate_confidence_boost over arrays of markets.
+
+        Applies the same formula as calculate_confidence_boost to every
+        element in one NumPy pass instead of a Python loop. The scalar
+        method is kept as-is for hot single-item use.
+
+        Args:
+            base_probs: Array-like of base probabilities (0-1)
+            sentiment_scores: Array-like of sentiment scores (-1 to +1)
+            sentiment_confidences: Array-like of sentiment confidences (0-1)
+            max_boost: Maximum boost multiplier (default: 20%)
+
+        Returns:
+            np.ndarray of confidence-boosted probabilities (capped at 0-1)
+        """
+        base = np.asarray(base_probs, dtype=np.float64)
+        s = np.asarray(sentiment_scores, dtype=np.float64)
+        c = np.asarray(sentiment_confidences, dtype=np.float64)
 
-        # Cap at valid probability range
-        return max(0.0, min(1.0, boosted_prob))
+        boosted = base * (1.0 + s * c * max_boost)
+        return np.clip(boosted, 0.0, 1.0)
 
 
 # Example usage
@@ -262,22 +614,23 @@ if __name__ == "__main__":
     scorer = SentimentScorer(method="textblob")
 
     # Example articles about CPI
+    from src.sentiment_layer.news_client import Article
     articles = [
-        {
-            'title': 'CPI Surges Above Expectations, Inflation Concerns Rise',
-            'description': 'Consumer price index jumped 0.5% in latest report, exceeding forecasts.',
-            'source': 'Reuters'
-        },
-        {
-            'title': 'Fed Officials Express Concern Over Persistent Inflation',
-            'description': 'Central bank signals potential rate hikes if CPI remains elevated.',
-            'source': 'Bloomberg'
-        },
-        {
-            'title': 'Economists Worried About Rising Food and Energy Costs',
-            'description': 'Core inflation metrics show continued upward pressure on prices.',
-            'source': 'WSJ'
-        }
+        Article(
+            title='CPI Surges Above Expectations, Inflation Concerns Rise',
+            description='Consumer price index jumped 0.5% in latest report, exceeding forecasts.',
+            source='Reuters'
+        ),
+        Article(
+            title='Fed Officials Express Concern Over Persistent Inflation',
+            description='Central bank signals potential rate hikes if CPI remains elevated.',
+            source='Bloomberg'
+        ),
+        Article(
+            title='Economists Worried About Rising Food and Energy Costs',
+            description='Core inflation metrics show continued upward pressure on prices.',
+            source='WSJ'
+        )
     ]
 
     # Score the articles
@@ -285,8 +638,8 @@ if __name__ == "__main__":
     print()
 
     for i, article in enumerate(articles, 1):
-        score = scorer.score_text(f"{article['title']} {article['description']}")
-        print(f"{i}. {article['title'][:60]}...")
+        score = scorer.score_text(f"{article.title} {article.description}")
+        print(f"{i}. {article.title[:60]}...")
         print(f"   Sentiment: {score:+.3f} ({'Positive' if score > 0 else 'Negative' if score < 0 else 'Neutral'})")
         print()
 
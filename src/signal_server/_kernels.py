@@ -0,0 +1,181 @@
+"""
+JIT-compiled numeric kernels for the per-market hot path.
+Falls back to pure Python/NumPy if numba is not installed.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op decorator so the package imports without numba."""
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrapper(func):
+            return func
+        return wrapper
+
+
+@njit(cache=True, fastmath=True)
+def lwp(bid_px, bid_sz, ask_px, ask_sz):
+    """
+    Liquidity-weighted probability (VWAP midpoint) over top-N book levels.
+    Args:
+        bid_px, bid_sz: float64 arrays of bid prices and sizes.
+        ask_px, ask_sz: float64 arrays of ask prices and sizes.
+    Returns:
+        The VWAP midpoint, or -1.0 if there is no liquidity on either side.
+    """
+    total_bid_value = 0.0
+    total_bid_size = 0.0
+    for i in range(bid_px.shape[0]):
+        total_bid_value += bid_px[i] * bid_sz[i]
+        total_bid_size += bid_sz[i]
+
+    total_ask_value = 0.0
+    total_ask_size = 0.0
+    for i in range(ask_px.shape[0]):
+        total_ask_value += ask_px[i] * ask_sz[i]
+        total_ask_size += ask_sz[i]
+
+    if total_bid_size == 0.0 and total_ask_size == 0.0:
+        return -1.0
+
+    vwap_bid = total_bid_value / total_bid_size if total_bid_size > 0.0 else 0.0
+    vwap_ask = total_ask_value / total_ask_size if total_ask_size > 0.0 else 0.0
+
+    if total_bid_size > 0.0 and total_ask_size > 0.0:
+        return (vwap_bid + vwap_ask) / 2.0
+    elif total_bid_size > 0.0:
+        return vwap_bid
+    else:
+        return vwap_ask
+
+
+@njit(cache=True, fastmath=True)
+def book_sums(ticks, sizes, tick_scale):
+    """
+    Value/size sums over one book side, from integer tick keys.
+    Args:
+        ticks: float64 array of tick-scaled prices.
+        sizes: float64 array of level sizes.
+        tick_scale: divisor converting ticks back to prices.
+    Returns:
+        (value_sum, size_sum) for seeding the incremental VWAP sums.
+    """
+    value = 0.0
+    size = 0.0
+    for i in range(ticks.shape[0]):
+        value += (ticks[i] / tick_scale) * sizes[i]
+        size += sizes[i]
+    return value, size
+
+
+@njit(cache=True, fastmath=True)
+def agg_scores(scores):
+    """
+    Aggregate per-article sentiment scores into (mean, confidence).
+    Confidence is 1 - stdev, floored at 0 (low variance = high agreement).
+    Args:
+        scores: float64 array of sentiment scores (-1 to +1).
+    Returns:
+        Tuple of (average_sentiment, confidence).
+    """
+    n = scores.shape[0]
+    if n == 0:
+        return 0.0, 0.0
+
+    mean = 0.0
+    for i in range(n):
+        mean += scores[i]
+    mean /= n
+
+    if n == 1:
+        return mean, 0.5
+
+    var = 0.0
+    for i in range(n):
+        d = scores[i] - mean
+        var += d * d
+    std_dev = np.sqrt(var / (n - 1))
+
+    confidence = 1.0 - std_dev
+    if confidence < 0.0:
+        confidence = 0.0
+
+    return mean, confidence
+
+
+@njit(cache=True, fastmath=True)
+def arb_spreads(p_poly, p_fx, days, r):
+    """
+    Batch arb spreads: min(p_poly*(1 + r*days/365), 1) - p_fx, clipped to [-1, 1].
+    Args:
+        p_poly: float64 array of Polymarket probabilities (0-1).
+        p_fx: float64 array of ForecastEx market prices (0-1).
+        days: float64 array of days to expiry (negatives treated as 0).
+        r: Annual risk-free rate.
+    Returns:
+        float64 array of arb spreads.
+    """
+    out = np.empty_like(p_poly)
+    for i in range(p_poly.shape[0]):
+        d = days[i]
+        if d < 0.0:
+            d = 0.0
+        fair = p_poly[i] * (1.0 + r * d / 365.0)
+        if fair > 1.0:
+            fair = 1.0
+        spread = fair - p_fx[i]
+        if spread > 1.0:
+            spread = 1.0
+        elif spread < -1.0:
+            spread = -1.0
+        out[i] = spread
+    return out
+
+
+@njit(cache=True)
+def kw_hits(tokens, pos_keys, neg_keys):
+    """
+    Count distinct token hashes present in the keyword hash arrays.
+    Args:
+        tokens: uint32 array of token hashes (any order, repeats allowed).
+        pos_keys, neg_keys: sorted uint32 arrays of keyword hashes.
+    Returns:
+        Tuple of (positive_hits, negative_hits), each counting distinct
+        matched tokens.
+    """
+    n = tokens.shape[0]
+    if n == 0:
+        return 0, 0
+
+    toks = np.sort(tokens)
+    pos = 0
+    neg = 0
+    for i in range(n):
+        t = toks[i]
+        if i > 0 and t == toks[i - 1]:
+            continue
+        j = np.searchsorted(pos_keys, t)
+        if j < pos_keys.shape[0] and pos_keys[j] == t:
+            pos += 1
+        j = np.searchsorted(neg_keys, t)
+        if j < neg_keys.shape[0] and neg_keys[j] == t:
+            neg += 1
+    return pos, neg
+
+
+def warmup():
+    """Trigger JIT compilation with dummy inputs (no-op without numba)."""
+    buf = np.asarray([0.5], dtype=np.float64)
+    lwp(buf, buf, buf, buf)
+    book_sums(buf, buf, 10000.0)
+    agg_scores(buf)
+    arb_spreads(buf, buf, buf, 0.045)
+    keys = np.asarray([1], dtype=np.uint32)
+    kw_hits(keys, keys, keys)
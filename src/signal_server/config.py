@@ -1,7 +1,8 @@
+import functools
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from dotenv import load_dotenv
 
-load_dotenv()
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
@@ -18,4 +19,17 @@ class Settings(BaseSettings):
     IB_CLIENT_ID: int = 1
     RISK_FREE_RATE: float = 0.045
 
-settings = Settings()
+
+@functools.lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Builds the Settings singleton on first use (one validation pass)."""
+    load_dotenv()
+    return Settings()
+
+
+def __getattr__(name):
+    # Keeps `from src.signal_server.config import settings` working while
+    # deferring dotenv loading and pydantic validation to first access
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,11 +1,52 @@
 import asyncio
-from typing import Optional
+import time
+from typing import Dict, Optional, Tuple
 from fastmcp import FastMCP
 from src.signal_server.polymarket_client import PolymarketClient
-from src.signal_server.config import settings
+from src.signal_server.config import get_settings
 
 mcp_server = FastMCP(name="polymarket_signal_server")
 
+# Shared client: ClobClient setup is expensive, so one instance serves all
+# resource calls instead of re-initializing per request
+_client: Optional[PolymarketClient] = None
+
+# Short-TTL order-book cache: under polling the same condition_id is
+# requested many times a second, so a 2s window absorbs most RPC traffic
+ORDER_BOOK_TTL = 2.0
+_order_book_cache: Dict[str, Tuple[float, dict]] = {}
+_order_book_locks: Dict[str, asyncio.Lock] = {}
+
+
+def _get_client() -> PolymarketClient:
+    """Returns the shared PolymarketClient, creating it on first use."""
+    global _client
+    if _client is None:
+        _client = PolymarketClient()
+    return _client
+
+
+async def _get_order_book_cached(condition_id: str) -> dict:
+    """
+    Fetches an order book through the shared client with a short TTL cache.
+    A per-key lock ensures concurrent misses trigger a single fetch.
+    """
+    entry = _order_book_cache.get(condition_id)
+    if entry is not None and time.monotonic() - entry[0] < ORDER_BOOK_TTL:
+        return entry[1]
+
+    lock = _order_book_locks.setdefault(condition_id, asyncio.Lock())
+    async with lock:
+        # Re-check: another task may have refreshed while we waited
+        entry = _order_book_cache.get(condition_id)
+        if entry is not None and time.monotonic() - entry[0] < ORDER_BOOK_TTL:
+            return entry[1]
+
+        order_book = await _get_client().get_order_book(condition_id)
+        _order_book_cache[condition_id] = (time.monotonic(), order_book)
+        return order_book
+
+
 @mcp_server.resource("polymarket://probability/{condition_id}")
 async def get_polymarket_probability(condition_id: str) -> Optional[float]:
     """
@@ -15,12 +56,11 @@ async def get_polymarket_probability(condition_id: str) -> Optional[float]:
     Returns:
         The liquidity-weighted probability (0-1) or None if not found/calculated.
     """
-    client = PolymarketClient()
     # In a real scenario, you might need to map condition_id to a market ID that get_markets can use,
     # or directly query the order book if condition_id is directly usable by the CLOB client.
     # For this example, let's assume we can directly use condition_id as market_id for order book fetching.
-    order_book = await client.get_order_book(condition_id) # Assuming condition_id works as market_id
-    probability = client.get_liquidity_weighted_probability(order_book)
+    order_book = await _get_order_book_cached(condition_id)  # Assuming condition_id works as market_id
+    probability = _get_client().get_liquidity_weighted_probability(order_book)
     print(f"Polymarket probability for {condition_id}: {probability}")
     return probability
 
@@ -40,7 +80,7 @@ async def get_arb_spread(event_id: str, regulated_price: float, days_to_expiry:
         return None
 
     # Calculate yield-adjusted fair value for regulated venue
-    r = settings.RISK_FREE_RATE
+    r = get_settings().RISK_FREE_RATE
     t_days = days_to_expiry
     p_fx_fair = p_poly * (1 + r * t_days / 365)
 
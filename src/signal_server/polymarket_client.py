@@ -1,7 +1,14 @@
-import requests
+import numpy as np
 from typing import Dict, Any, List, Optional
 import asyncio
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - declared dependency
+    aiohttp = None
+
 from py_clob_client.clob_client import ClobClient
+from src.signal_server._kernels import lwp
 
 class PolymarketClient:
     """Client for interacting with Polymarket Gamma API and CLOB public endpoints (read-only)."""
@@ -14,8 +21,25 @@ class PolymarketClient:
     CLOB_RPC_URL = "https://rpc-mainnet.maticvigil.com/"
     CLOB_EXCHANGE_ADDRESS = "0x..."  # Placeholder, usually depends on Polymarket's deployed contracts
 
-    def __init__(self):
-        """Initializes the PolymarketClient in read-only mode."""
+    # Bound on in-flight order-book fetches so batch fan-outs do not
+    # overwhelm the CLOB RPC endpoint
+    MAX_CONCURRENT_BOOKS = 16
+
+    def __init__(self, session: Optional["aiohttp.ClientSession"] = None):
+        """
+        Initializes the PolymarketClient in read-only mode.
+        Args:
+            session: Optional shared aiohttp.ClientSession for connection
+                pooling across clients.
+        """
+        # A shared session keeps TCP/TLS connections alive across requests
+        # (and across clients, when the caller passes one in); created
+        # lazily so __init__ stays usable outside a running event loop
+        self._session = session
+        self._owns_session = session is None
+        # Created lazily so the semaphore binds to the running loop
+        self._book_semaphore: Optional[asyncio.Semaphore] = None
+
         # py-clob-client in read-only mode does not require a private key
         # For this example, we'll instantiate it without a signer.
         # A real read-only client might connect to a specific public node.
@@ -25,22 +49,47 @@ class PolymarketClient:
             print(f"Warning: Could not initialize ClobClient. It might not be fully functional for all read operations without proper configuration. Error: {e}")
             self.clob_client = None
 
-    def get_markets(self, closed: bool = False, tags: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    async def _ensure_session(self) -> "aiohttp.ClientSession":
+        """Creates the shared aiohttp session on first use."""
+        if aiohttp is None:
+            raise RuntimeError("aiohttp is required for PolymarketClient")
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=5),
+                connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=30)
+            )
+            self._owns_session = True
+        return self._session
+
+    async def aclose(self):
+        """Closes the HTTP session if this client created it."""
+        if self._owns_session and self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    async def get_markets(self, closed: bool = False, tags: Optional[List[str]] = None,
+                          limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Fetches markets from the Polymarket Gamma API.
+
+        Runs on the shared pooled session so calls from async code no
+        longer block the event loop and can fan out concurrently.
         Args:
             closed: Whether to include closed markets.
             tags: List of tags to filter markets by (e.g., ["Crypto", "Economics"]).
+            limit: Optional maximum number of markets to return.
         Returns:
             A list of market dictionaries.
         """
         params = {"closed": "true" if closed else "false"}
         if tags:
             params["tags"] = ",".join(tags)
+        if limit is not None:
+            params["limit"] = str(limit)
 
-        response = requests.get(f"{self.GAMMA_API_BASE_URL}/markets", params=params)
-        response.raise_for_status()
-        return response.json()
+        session = await self._ensure_session()
+        async with session.get(f"{self.GAMMA_API_BASE_URL}/markets", params=params) as response:
+            response.raise_for_status()
+            return await response.json()
 
     async def get_order_book(self, market_id: str, n_levels: int = 3) -> Dict[str, Any]:
         """
@@ -49,7 +98,8 @@ class PolymarketClient:
             market_id: The unique identifier of the market.
             n_levels: Number of top levels to fetch.
         Returns:
-            A dictionary containing 'bids' and 'asks', each a list of [price, size].
+            A dictionary containing 'bids' and 'asks', each an (n, 2)
+            float64 array of [price, size] rows (best level first).
         """
         if not self.clob_client:
             print("ClobClient not initialized, cannot fetch order book.")
@@ -65,15 +115,63 @@ class PolymarketClient:
             # For now, simulate with a dummy market hash if clob_client needs it, or assume
             # clob_client can resolve directly by a string ID if designed that way.
             # Let's assume a simplified method for demonstration.
-            order_book_data = await self.clob_client.get_market_order_book(market_id) # Simplified
+            if self._book_semaphore is None:
+                self._book_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_BOOKS)
+            async with self._book_semaphore:
+                order_book_data = await self.clob_client.get_market_order_book(market_id) # Simplified
 
-            bids = sorted([[float(o['price']), float(o['size'])] for o in order_book_data.get('bids', [])], key=lambda x: x[0], reverse=True)[:n_levels]
-            asks = sorted([[float(o['price']), float(o['size'])] for o in order_book_data.get('asks', [])], key=lambda x: x[0])[:n_levels]
+            bids = self._top_levels(order_book_data.get('bids', []), n_levels, best_high=True)
+            asks = self._top_levels(order_book_data.get('asks', []), n_levels, best_high=False)
             return {"bids": bids, "asks": asks}
         except Exception as e:
             print(f"Error fetching order book for market {market_id}: {e}")
             return {"bids": [], "asks": []}
 
+    async def get_order_books(self, market_ids: List[str], n_levels: int = 3) -> Dict[str, Any]:
+        """
+        Fetches order books for many markets concurrently.
+
+        Fan-out is bounded by MAX_CONCURRENT_BOOKS via the shared
+        semaphore inside get_order_book.
+        Args:
+            market_ids: Market identifiers to fetch.
+            n_levels: Number of top levels per book.
+        Returns:
+            Dict mapping each market_id to its order book (or the raised
+            exception, when a fetch failed).
+        """
+        results = await asyncio.gather(
+            *(self.get_order_book(market_id, n_levels) for market_id in market_ids),
+            return_exceptions=True
+        )
+        return dict(zip(market_ids, results))
+
+    @staticmethod
+    def _top_levels(raw: List[Dict[str, Any]], n_levels: int, best_high: bool) -> np.ndarray:
+        """
+        Bulk-casts raw {'price', 'size'} levels to float64 and extracts the
+        best n_levels in one vectorized pass (no per-level float() calls,
+        no full sort: argpartition is O(N) plus an O(k log k) ordering).
+        Args:
+            raw: List of level dicts from the CLOB response.
+            n_levels: Number of levels to keep.
+            best_high: True for bids (highest price first), False for asks.
+        Returns:
+            An (n, 2) float64 array of [price, size] rows, best level first.
+        """
+        if not raw:
+            return np.empty((0, 2), dtype=np.float64)
+
+        arr = np.array([(o['price'], o['size']) for o in raw], dtype=np.float64)
+        key = -arr[:, 0] if best_high else arr[:, 0]
+
+        if arr.shape[0] > n_levels:
+            idx = np.argpartition(key, n_levels - 1)[:n_levels]
+            arr = arr[idx]
+            key = key[idx]
+
+        return arr[np.argsort(key)]
+
     def get_liquidity_weighted_probability(self, order_book: Dict[str, Any], n_levels: int = 3) -> Optional[float]:
         """
         Computes a liquidity-weighted probability metric (VWAP) from the order book.
@@ -86,44 +184,41 @@ class PolymarketClient:
         bids = order_book.get('bids', [])[:n_levels]
         asks = order_book.get('asks', [])[:n_levels]
 
-        total_bid_value = sum(price * size for price, size in bids)
-        total_bid_size = sum(size for _, size in bids)
-
-        total_ask_value = sum(price * size for price, size in asks)
-        total_ask_size = sum(size for _, size in asks)
-
-        if total_bid_size == 0 and total_ask_size == 0:
-            return None
+        # Flatten the book into float64 buffers and run the JIT'd kernel
+        bid_arr = np.asarray(bids, dtype=np.float64).reshape(-1, 2)
+        ask_arr = np.asarray(asks, dtype=np.float64).reshape(-1, 2)
 
-        # Simple average of bid and ask VWAP, or just one if the other is empty
-        vwap_bid = total_bid_value / total_bid_size if total_bid_size > 0 else 0
-        vwap_ask = total_ask_value / total_ask_size if total_ask_size > 0 else 0
+        result = lwp(
+            np.ascontiguousarray(bid_arr[:, 0]),
+            np.ascontiguousarray(bid_arr[:, 1]),
+            np.ascontiguousarray(ask_arr[:, 0]),
+            np.ascontiguousarray(ask_arr[:, 1])
+        )
 
-        if total_bid_size > 0 and total_ask_size > 0:
-            # Average the VWAP of best N bids and asks to get a midpoint probability
-            return (vwap_bid + vwap_ask) / 2
-        elif total_bid_size > 0:
-            return vwap_bid
-        elif total_ask_size > 0:
-            return vwap_ask
-        else:
-            return None
+        # The kernel signals "no liquidity" with -1.0
+        return result if result >= 0.0 else None
 
 # Example usage (for testing purposes)
 async def main():
     client = PolymarketClient()
     print("Fetching open markets...")
-    markets = client.get_markets(closed=False, tags=["Crypto", "Economics"])
+    markets = await client.get_markets(closed=False, tags=["Crypto", "Economics"])
     if markets:
         print(f"Found {len(markets)} open markets.")
-        for market in markets[:2]: # Just process first 2 for brevity
+        sample = markets[:2]  # Just process first 2 for brevity
+        order_books = await client.get_order_books([m['id'] for m in sample])
+        for market in sample:
             print(f"\nMarket: {market['question']} (ID: {market['id']})")
-            order_book = await client.get_order_book(market['id'])
+            order_book = order_books[market['id']]
+            if isinstance(order_book, Exception):
+                print(f"Order book fetch failed: {order_book}")
+                continue
             print(f"Order Book: {order_book}")
             prob = client.get_liquidity_weighted_probability(order_book)
             print(f"Liquidity-weighted probability: {prob:.4f}")
     else:
         print("No open markets found.")
+    await client.aclose()
 
 if __name__ == "__main__":
     asyncio.run(main())
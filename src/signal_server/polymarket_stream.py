@@ -4,9 +4,82 @@ Streams live order book updates for continuous VWAP calculation.
 """
 import asyncio
 import json
+import logging
+import time
+from itertools import islice
+from operator import neg
+
+import numpy as np
 import websockets
+from sortedcontainers import SortedDict
 from typing import Dict, Any, Optional, Callable, List
-from datetime import datetime
+from datetime import datetime, timedelta
+
+from src.signal_server._kernels import lwp, book_sums, warmup
+
+# Compile (or load the on-disk cache of) the book kernels now, so the
+# first live frame doesn't pay JIT latency
+warmup()
+
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+try:
+    # orjson parses CLOB frames several times faster than stdlib json
+    # (and takes bytes frames without a str decode)
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _loads = json.loads
+    _dumps = json.dumps
+
+try:
+    # Optional alternate transport: aiohttp's WebSocket client rides its
+    # C-accelerated HTTP stack and pairs well with uvloop's batched I/O
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+
+class _AiohttpWebSocket:
+    """
+    Adapts an aiohttp WebSocket to the subset of the websockets API this
+    module uses (send / close / async iteration over text frames), so the
+    listen loop is transport-agnostic.
+    """
+
+    def __init__(self, session: "aiohttp.ClientSession", ws: "aiohttp.ClientWebSocketResponse"):
+        self._session = session
+        self._ws = ws
+
+    async def send(self, data: str):
+        await self._ws.send_str(data)
+
+    async def close(self):
+        await self._ws.close()
+        await self._session.close()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        msg = await self._ws.receive()
+        if msg.type in (aiohttp.WSMsgType.TEXT, aiohttp.WSMsgType.BINARY):
+            return msg.data
+        raise StopAsyncIteration
+
+
+# Prices are keyed as integer ticks (price * 10000) so level lookups are
+# exact dict hits instead of float comparisons with tolerance
+_TICK_SCALE = 10000.0
+
+# Maps the wire 'side' field straight to the book key, replacing the
+# membership test + f-string construction per update
+_SIDE_KEYS = {'bid': 'bids', 'ask': 'asks'}
 
 
 class PolymarketStream:
@@ -16,26 +89,54 @@ class PolymarketStream:
     WebSocket endpoint: wss://ws-subscriptions-clob.polymarket.com/ws
     """
 
-    def __init__(self, url: str = "wss://ws-subscriptions-clob.polymarket.com/ws"):
+    # Bounded frame buffer between the socket reader and the parse worker;
+    # overflow drops frames rather than stalling the socket drain
+    QUEUE_MAXSIZE = 10000
+
+    def __init__(self, url: str = "wss://ws-subscriptions-clob.polymarket.com/ws",
+                 transport: str = "websockets"):
         """
         Initialize Polymarket streaming client.
 
         Args:
             url: WebSocket endpoint URL
+            transport: "websockets" (default) or "aiohttp" to connect via
+                aiohttp's WebSocket client instead
         """
+        if transport not in ("websockets", "aiohttp"):
+            raise ValueError(f"Unknown transport: {transport}")
+        if transport == "aiohttp" and aiohttp is None:
+            log.warning("aiohttp not installed, falling back to websockets transport")
+            transport = "websockets"
+        self.transport = transport
         self.url = url
         self.ws = None
         self.subscriptions: Dict[str, Dict[str, Any]] = {}
         self.running = False
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._dropped = 0
 
     async def connect(self):
         """Establish WebSocket connection."""
         try:
-            self.ws = await websockets.connect(self.url)
+            if self.transport == "aiohttp":
+                session = aiohttp.ClientSession()
+                ws = await session.ws_connect(self.url, compress=0, max_msg_size=2 ** 20)
+                self.ws = _AiohttpWebSocket(session, ws)
+            else:
+                # CLOB frames are small JSON: permessage-deflate costs more
+                # CPU per frame than the bytes it saves, so disable it and
+                # cap frame/buffer sizes to sane bounds for book updates
+                self.ws = await websockets.connect(
+                    self.url,
+                    compression=None,
+                    max_size=2 ** 20,
+                )
             self.running = True
-            print(f"✓ Connected to Polymarket WebSocket: {self.url}")
+            log.info("Connected to Polymarket WebSocket: %s", self.url)
         except Exception as e:
-            print(f"✗ Failed to connect to Polymarket WebSocket: {e}")
+            log.error("Failed to connect to Polymarket WebSocket: %s", e)
             raise
 
     async def disconnect(self):
@@ -43,7 +144,7 @@ class PolymarketStream:
         self.running = False
         if self.ws:
             await self.ws.close()
-            print("Disconnected from Polymarket WebSocket")
+            log.info("Disconnected from Polymarket WebSocket")
 
     async def subscribe_to_market(
         self,
@@ -65,7 +166,7 @@ class PolymarketStream:
         }
         """
         if not self.ws or not self.running:
-            print("Not connected. Call connect() first.")
+            log.warning("Not connected. Call connect() first.")
             return
 
         subscription_msg = {
@@ -73,16 +174,54 @@ class PolymarketStream:
             "market": market_id
         }
 
-        await self.ws.send(json.dumps(subscription_msg))
+        await self.ws.send(_dumps(subscription_msg))
 
         self.subscriptions[market_id] = {
             'callback': callback,
             'subscribed_at': datetime.now(),
-            'last_update': None,
-            'order_book': {'bids': [], 'asks': []}
+            'last_update_ns': None,
+            'order_book': self._empty_book()
         }
 
-        print(f"✓ Subscribed to market: {market_id}")
+        log.debug("Subscribed to market: %s", market_id)
+
+    async def subscribe_to_markets(
+        self,
+        market_ids: List[str],
+        callback: Optional[Callable[[Dict[str, Any]], None]] = None
+    ):
+        """
+        Subscribe to many markets in one fan-out.
+
+        All subscribe frames are queued onto the socket together (one
+        gather instead of a send round-trip per market) and the
+        subscription state is registered in a single dict update.
+
+        Args:
+            market_ids: Market IDs to subscribe to
+            callback: Function to call when updates arrive (shared)
+        """
+        if not self.ws or not self.running:
+            log.warning("Not connected. Call connect() first.")
+            return
+
+        await asyncio.gather(*(
+            self.ws.send(_dumps({"type": "subscribe", "market": market_id}))
+            for market_id in market_ids
+        ))
+
+        now = datetime.now()
+        self.subscriptions.update({
+            market_id: {
+                'callback': callback,
+                'subscribed_at': now,
+                'last_update_ns': None,
+                'order_book': self._empty_book()
+            }
+            for market_id in market_ids
+        })
+
+        log.debug("Subscribed to %d markets", len(market_ids))
 
     async def unsubscribe_from_market(self, market_id: str):
         """Unsubscribe from a market."""
@@ -94,33 +233,57 @@ class PolymarketStream:
             "market": market_id
         }
 
-        await self.ws.send(json.dumps(unsubscribe_msg))
+        await self.ws.send(_dumps(unsubscribe_msg))
 
         if market_id in self.subscriptions:
             del self.subscriptions[market_id]
 
-        print(f"Unsubscribed from market: {market_id}")
+        log.debug("Unsubscribed from market: %s", market_id)
 
     async def listen(self):
         """
         Listen for incoming WebSocket messages and dispatch to callbacks.
         This should run in a background task.
+
+        The socket reader only enqueues raw frames; parsing and book
+        updates happen on a separate worker task, so the drain rate stays
+        independent of Python parse cost under burst load.
         """
         if not self.ws:
-            print("Not connected. Call connect() first.")
+            log.warning("Not connected. Call connect() first.")
             return
 
-        print("Listening for market updates...")
+        self._queue = asyncio.Queue(maxsize=self.QUEUE_MAXSIZE)
+        self._worker = asyncio.create_task(self._consume())
+
+        log.info("Listening for market updates...")
 
         try:
             async for message in self.ws:
-                await self._handle_message(message)
+                try:
+                    self._queue.put_nowait(message)
+                except asyncio.QueueFull:
+                    self._dropped += 1
+                    log.warning("Frame queue full, dropped message (%d total)", self._dropped)
         except websockets.exceptions.ConnectionClosed:
-            print("WebSocket connection closed")
+            log.info("WebSocket connection closed")
             self.running = False
         except Exception as e:
-            print(f"Error in listen loop: {e}")
+            log.error("Error in listen loop: %s", e)
             self.running = False
+        finally:
+            # Let the worker drain what's queued, then stop it
+            await self._queue.put(None)
+            await self._worker
+            self._worker = None
+
+    async def _consume(self):
+        """Worker loop: parse and apply queued frames until sentinel."""
+        while True:
+            message = await self._queue.get()
+            if message is None:
+                break
+            await self._handle_message(message)
 
     async def _handle_message(self, message: str):
         """
@@ -132,7 +295,7 @@ class PolymarketStream:
         - update: Order book update (add/remove orders)
         """
         try:
-            data = json.loads(message)
+            data = _loads(message)
 
             msg_type = data.get('type')
             market_id = data.get('market')
@@ -141,15 +304,16 @@ class PolymarketStream:
                 return
 
             subscription = self.subscriptions[market_id]
-            subscription['last_update'] = datetime.now()
+            # One clock read per frame; datetime construction is deferred
+            # to last_update_time() for the rare external reader
+            subscription['last_update_ns'] = time.monotonic_ns()
 
             # Update local order book
             if msg_type == 'orderbook':
                 # Full snapshot
-                subscription['order_book'] = {
-                    'bids': data.get('bids', []),
-                    'asks': data.get('asks', [])
-                }
+                subscription['order_book'] = self._make_book(
+                    data.get('bids', []), data.get('asks', [])
+                )
             elif msg_type == 'update':
                 # Incremental update
                 self._apply_order_book_update(subscription['order_book'], data)
@@ -158,12 +322,50 @@ class PolymarketStream:
             if subscription['callback']:
                 await subscription['callback'](data)
 
-        except json.JSONDecodeError:
-            print(f"Failed to parse message: {message[:100]}...")
+        except ValueError:
+            log.warning("Failed to parse message: %.100s...", message)
         except Exception as e:
-            print(f"Error handling message: {e}")
+            log.error("Error handling message: %s", e)
+
+    @staticmethod
+    def _empty_book() -> Dict[str, Any]:
+        """
+        Fresh order-book state: per-side tick-keyed books (bids iterate
+        best/highest price first) plus running value/size sums maintained
+        incrementally for O(1) whole-book VWAP.
+        """
+        return {
+            'bids': SortedDict(neg), 'asks': SortedDict(),
+            'bid_value_sum': 0.0, 'bid_size_sum': 0.0,
+            'ask_value_sum': 0.0, 'ask_size_sum': 0.0
+        }
 
-    def _apply_order_book_update(self, order_book: Dict[str, List], update: Dict[str, Any]):
+    @staticmethod
+    def _book_side(levels: List, bids: bool) -> SortedDict:
+        """Builds one side's tick-keyed SortedDict from snapshot levels."""
+        side = SortedDict(neg) if bids else SortedDict()
+        for price, size in levels:
+            side[round(float(price) * _TICK_SCALE)] = float(size)
+        return side
+
+    @classmethod
+    def _make_book(cls, bid_levels: List, ask_levels: List) -> Dict[str, Any]:
+        """Builds full book state (sides + running sums) from a snapshot."""
+        book = cls._empty_book()
+        book['bids'] = cls._book_side(bid_levels, bids=True)
+        book['asks'] = cls._book_side(ask_levels, bids=False)
+        for side, prefix in (('bids', 'bid'), ('asks', 'ask')):
+            levels = book[side]
+            value, size = book_sums(
+                np.fromiter(levels.keys(), dtype=np.float64, count=len(levels)),
+                np.fromiter(levels.values(), dtype=np.float64, count=len(levels)),
+                _TICK_SCALE
+            )
+            book[prefix + '_value_sum'] = value
+            book[prefix + '_size_sum'] = size
+        return book
+
+    def _apply_order_book_update(self, order_book: Dict[str, SortedDict], update: Dict[str, Any]):
         """
         Apply incremental order book update.
 
@@ -171,36 +373,51 @@ class PolymarketStream:
         - Add order: {'side': 'bid', 'price': '0.52', 'size': '100'}
         - Remove order: {'side': 'ask', 'price': '0.54', 'size': '0'}
         - Modify order: {'side': 'bid', 'price': '0.52', 'size': '50'}
-        """
-        side = update.get('side', '').lower()
-        price = float(update.get('price', 0))
-        size = float(update.get('size', 0))
 
-        if side not in ['bid', 'ask']:
+        Each case is an O(log n) upsert/delete on the tick-keyed book —
+        no level scan and no re-sort per tick.
+        """
+        side_key = _SIDE_KEYS.get(update.get('side', '').lower())
+        if side_key is None:
             return
 
-        orders = order_book.get(f"{side}s", [])
+        book = order_book[side_key]
+        tick = round(float(update.get('price', 0)) * _TICK_SCALE)
+        size = float(update.get('size', 0))
 
-        # Find existing order at this price
-        existing_index = None
-        for i, order in enumerate(orders):
-            if abs(float(order[0]) - price) < 0.0001:  # Price match with tolerance
-                existing_index = i
-                break
+        # Fold the level delta into the running sums (price derived from
+        # the tick so it matches the snapshot accounting exactly)
+        old_size = book.get(tick, 0.0)
+        delta = size - old_size
+        prefix = 'bid' if side_key == 'bids' else 'ask'
+        order_book[prefix + '_value_sum'] += (tick / _TICK_SCALE) * delta
+        order_book[prefix + '_size_sum'] += delta
 
-        if size == 0:
-            # Remove order
-            if existing_index is not None:
-                orders.pop(existing_index)
+        if size == 0.0:
+            book.pop(tick, None)
         else:
-            # Add or update order
-            if existing_index is not None:
-                orders[existing_index] = [price, size]
-            else:
-                orders.append([price, size])
-                # Re-sort
-                reverse = (side == 'bid')  # Bids descending, asks ascending
-                orders.sort(key=lambda x: x[0], reverse=reverse)
+            book[tick] = size
+
+    def last_update_time(self, market_id: str) -> Optional[datetime]:
+        """
+        Wall-clock time of the last update for a market.
+
+        The hot path stores a raw monotonic_ns stamp; the datetime is
+        reconstructed here on demand by offsetting the current wall clock
+        by the monotonic age of the stamp.
+
+        Args:
+            market_id: The market ID
+
+        Returns:
+            Approximate datetime of the last update, or None if no update
+            has arrived yet
+        """
+        subscription = self.subscriptions.get(market_id)
+        if not subscription or subscription['last_update_ns'] is None:
+            return None
+        age_s = (time.monotonic_ns() - subscription['last_update_ns']) / 1e9
+        return datetime.now() - timedelta(seconds=age_s)
 
     def get_current_order_book(self, market_id: str, n_levels: int = 3) -> Dict[str, List]:
         """
@@ -212,6 +429,7 @@ class PolymarketStream:
 
         Returns:
             Dict with 'bids' and 'asks', each a list of [price, size]
+            (best level first)
         """
         if market_id not in self.subscriptions:
             return {'bids': [], 'asks': []}
@@ -219,44 +437,127 @@ class PolymarketStream:
         order_book = self.subscriptions[market_id]['order_book']
 
         return {
-            'bids': order_book['bids'][:n_levels],
-            'asks': order_book['asks'][:n_levels]
+            'bids': [[tick / _TICK_SCALE, size]
+                     for tick, size in islice(order_book['bids'].items(), n_levels)],
+            'asks': [[tick / _TICK_SCALE, size]
+                     for tick, size in islice(order_book['asks'].items(), n_levels)]
         }
 
-    def calculate_vwap(self, market_id: str, n_levels: int = 3) -> Optional[float]:
+    def calculate_vwap(self, market_id: str, n_levels: Optional[int] = 3) -> Optional[float]:
         """
         Calculate VWAP from current order book.
 
         Args:
             market_id: Market ID
-            n_levels: Number of levels for VWAP calculation
+            n_levels: Number of levels for VWAP calculation, or None to
+                use the incrementally maintained whole-book sums (O(1)
+                per call — preferred when emitting VWAP on every tick)
 
         Returns:
             VWAP probability (0-1) or None if no liquidity
         """
-        order_book = self.get_current_order_book(market_id, n_levels)
+        if market_id not in self.subscriptions:
+            return None
 
-        bids = order_book['bids']
-        asks = order_book['asks']
+        order_book = self.subscriptions[market_id]['order_book']
 
-        total_bid_value = sum(float(price) * float(size) for price, size in bids)
-        total_bid_size = sum(float(size) for _, size in bids)
+        if n_levels is None:
+            bid_size = order_book['bid_size_sum']
+            ask_size = order_book['ask_size_sum']
 
-        total_ask_value = sum(float(price) * float(size) for price, size in asks)
-        total_ask_size = sum(float(size) for _, size in asks)
+            if bid_size <= 0.0 and ask_size <= 0.0:
+                return None
 
-        if total_bid_size == 0 and total_ask_size == 0:
-            return None
+            vwap_bid = order_book['bid_value_sum'] / bid_size if bid_size > 0.0 else 0.0
+            vwap_ask = order_book['ask_value_sum'] / ask_size if ask_size > 0.0 else 0.0
 
-        vwap_bid = total_bid_value / total_bid_size if total_bid_size > 0 else 0
-        vwap_ask = total_ask_value / total_ask_size if total_ask_size > 0 else 0
+            if bid_size > 0.0 and ask_size > 0.0:
+                return (vwap_bid + vwap_ask) / 2
+            return vwap_bid if bid_size > 0.0 else vwap_ask
 
-        if total_bid_size > 0 and total_ask_size > 0:
-            return (vwap_bid + vwap_ask) / 2
-        elif total_bid_size > 0:
-            return vwap_bid
-        else:
-            return vwap_ask
+        # Materialize the top levels straight into float64 buffers and run
+        # the JIT'd kernel instead of four generator sums per call
+        bids = list(islice(order_book['bids'].items(), n_levels))
+        asks = list(islice(order_book['asks'].items(), n_levels))
+
+        result = lwp(
+            np.fromiter((tick / _TICK_SCALE for tick, _ in bids), dtype=np.float64, count=len(bids)),
+            np.fromiter((size for _, size in bids), dtype=np.float64, count=len(bids)),
+            np.fromiter((tick / _TICK_SCALE for tick, _ in asks), dtype=np.float64, count=len(asks)),
+            np.fromiter((size for _, size in asks), dtype=np.float64, count=len(asks))
+        )
+
+        # The kernel signals "no liquidity" with -1.0
+        return result if result >= 0.0 else None
+
+
+class PolymarketStreamPool:
+    """
+    Pool of PolymarketStream connections sharing one event loop.
+
+    A single connection is fine until the server's per-connection
+    subscription cap (or frame rate) becomes the bottleneck; the pool
+    round-robin-shards market IDs across n_connections child streams
+    and drives all their listen() loops with one asyncio.gather.
+    """
+
+    def __init__(self, n_connections: int = 2,
+                 url: str = "wss://ws-subscriptions-clob.polymarket.com/ws"):
+        """
+        Initialize the connection pool.
+
+        Args:
+            n_connections: Number of child WebSocket connections
+            url: WebSocket endpoint URL (shared by all children)
+        """
+        self.streams = [PolymarketStream(url) for _ in range(n_connections)]
+        self._next = 0
+
+    async def connect(self):
+        """Connect all child streams concurrently."""
+        await asyncio.gather(*(stream.connect() for stream in self.streams))
+
+    async def disconnect(self):
+        """Disconnect all child streams concurrently."""
+        await asyncio.gather(*(stream.disconnect() for stream in self.streams))
+
+    def stream_for(self, market_id: str) -> Optional[PolymarketStream]:
+        """Returns the child stream holding a market's subscription."""
+        for stream in self.streams:
+            if market_id in stream.subscriptions:
+                return stream
+        return None
+
+    async def subscribe_to_markets(
+        self,
+        market_ids: List[str],
+        callback: Optional[Callable[[Dict[str, Any]], None]] = None
+    ):
+        """
+        Round-robin the markets across child connections.
+
+        Args:
+            market_ids: Market IDs to subscribe to
+            callback: Function to call when updates arrive (shared)
+        """
+        shards: List[List[str]] = [[] for _ in self.streams]
+        for market_id in market_ids:
+            shards[self._next].append(market_id)
+            self._next = (self._next + 1) % len(self.streams)
+
+        await asyncio.gather(*(
+            stream.subscribe_to_markets(shard, callback)
+            for stream, shard in zip(self.streams, shards) if shard
+        ))
+
+    async def run(self):
+        """Drive every child's listen() loop until all close."""
+        await asyncio.gather(*(stream.listen() for stream in self.streams))
+
+    def calculate_vwap(self, market_id: str, n_levels: Optional[int] = 3) -> Optional[float]:
+        """VWAP for a market, whichever child connection holds it."""
+        stream = self.stream_for(market_id)
+        return stream.calculate_vwap(market_id, n_levels) if stream else None
 
 
 # Example usage
@@ -269,11 +570,15 @@ async def main():
 
     stream = PolymarketStream()
 
+    start_ns = time.monotonic_ns()
+
     # Callback for market updates
     async def on_market_update(data: Dict[str, Any]):
         market_id = data.get('market', 'unknown')[:8]
         msg_type = data.get('type', 'unknown')
-        print(f"[{datetime.now().strftime('%H:%M:%S')}] Market {market_id}... - Type: {msg_type}")
+        # Cheap monotonic offset instead of a datetime + strftime per message
+        elapsed_s = (time.monotonic_ns() - start_ns) / 1e9
+        print(f"[+{elapsed_s:8.2f}s] Market {market_id}... - Type: {msg_type}")
 
         # Calculate and print VWAP
         vwap = stream.calculate_vwap(data.get('market'))
@@ -290,8 +595,7 @@ async def main():
             # Add more markets here
         ]
 
-        for market_id in example_markets:
-            await stream.subscribe_to_market(market_id, on_market_update)
+        await stream.subscribe_to_markets(example_markets, on_market_update)
 
         # Listen for updates (this runs continuously)
         print()
@@ -309,4 +613,12 @@ async def main():
 
 
 if __name__ == "__main__":
+    # uvloop's libuv selector keeps up with bursty CLOB frame rates far
+    # better than the stock loop; same opt-in pattern as the bot entrypoints
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     asyncio.run(main())
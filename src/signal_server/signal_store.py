@@ -0,0 +1,74 @@
+"""
+Shared-memory signal store for multi-process scale-out.
+
+Holds the hot numeric signal state (probability, sentiment, timestamps) in a
+fixed-size structure-of-arrays record block backed by
+multiprocessing.shared_memory, so the signal layer can write and sentiment /
+execution consumers — in this process or a separate one — can read the same
+buffer with zero copies and no pickling.
+"""
+from multiprocessing import shared_memory
+from typing import Optional
+
+import numpy as np
+
+# One record per watchlist market. Field views of this array are what the
+# layers operate on; keep it compact so a large watchlist stays cache-friendly.
+RECORD_DTYPE = np.dtype([
+    ('p', 'f4'),      # liquidity-weighted probability (NaN = no signal yet)
+    ('sent', 'f4'),   # average sentiment score (-1 to +1)
+    ('conf', 'f4'),   # sentiment confidence (0 to 1)
+    ('ts', 'i8'),     # last update, ns since epoch
+])
+
+
+class SharedSignalStore:
+    """
+    Fixed-size ring of per-market signal records in shared memory.
+
+    The creating process (the signal layer) passes create=True; a reader in
+    another process attaches with create=False and the creator's name.
+    """
+
+    def __init__(self, n_markets: int, name: Optional[str] = None, create: bool = True):
+        """
+        Initialize or attach the store.
+
+        Args:
+            n_markets: Number of watchlist markets (fixed for the store's life).
+            name: Shared memory segment name (required when attaching).
+            create: Whether to create the segment (True) or attach (False).
+        """
+        self.n_markets = n_markets
+        size = n_markets * RECORD_DTYPE.itemsize
+
+        if create:
+            self._shm = shared_memory.SharedMemory(create=True, size=size, name=name)
+        else:
+            self._shm = shared_memory.SharedMemory(name=name)
+
+        self._owner = create
+        self.records = np.ndarray((n_markets,), dtype=RECORD_DTYPE, buffer=self._shm.buf)
+
+        if create:
+            self.records['p'] = np.nan
+            self.records['sent'] = 0.0
+            self.records['conf'] = 0.0
+            self.records['ts'] = 0
+
+    @property
+    def name(self) -> str:
+        """Segment name; pass to another process to attach."""
+        return self._shm.name
+
+    def close(self):
+        """Detach from the segment; the owner also unlinks it."""
+        # Drop the numpy view first, otherwise the exported buffer keeps
+        # SharedMemory.close() from releasing the mapping
+        self.records = None
+        self._shm.close()
+        if self._owner:
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
@@ -2,18 +2,58 @@
 Ledger module for recording and querying paper trades and PnL.
 Supports both SQLite database and CSV exports.
 """
+import asyncio
+import functools
+import logging
 import sqlite3
 import csv
 import os
+import threading
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from typing import List, Optional, Dict, Any
 from pathlib import Path
 from src.models.trade_intent import TradeIntent
 
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+
+@functools.lru_cache(maxsize=4)
+def _update_sql(has_transaction_id: bool, has_notes: bool) -> str:
+    """Builds (and memoizes) the UPDATE statement for the present fields."""
+    fields = ["status = ?"]
+    if has_transaction_id:
+        fields.append("transaction_id = ?")
+    if has_notes:
+        fields.append("notes = ?")
+    return f"UPDATE trades SET {', '.join(fields)} WHERE id = ?"
+
+
+@functools.lru_cache(maxsize=8)
+def _select_sql(has_status: bool, has_venue: bool, has_symbol_root: bool) -> str:
+    """Builds (and memoizes) the filtered SELECT for get_trades."""
+    query = "SELECT * FROM trades WHERE 1=1"
+    if has_status:
+        query += " AND status = ?"
+    if has_venue:
+        query += " AND venue = ?"
+    if has_symbol_root:
+        query += " AND symbol_root = ?"
+    return query + " ORDER BY timestamp DESC LIMIT ?"
+
 
 class TradeLedger:
     """Manages storage and retrieval of trade intents for paper trading."""
 
+    _INSERT_SQL = """
+        INSERT INTO trades (
+            venue, market_type, symbol_root, strike, expiry,
+            side, quantity, limit_price, order_type, mode,
+            timestamp, status, transaction_id, notes
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
     def __init__(self, db_path: str = "data/trades.db", csv_path: str = "data/trades.csv"):
         """
         Initializes the TradeLedger with SQLite and CSV backends.
@@ -24,15 +64,59 @@ class TradeLedger:
         self.db_path = db_path
         self.csv_path = csv_path
 
+        # One persistent connection per thread: avoids paying connection
+        # setup, page-cache warmup and journal negotiation on every call.
+        # The batch() flag lives here too, so only the batching thread
+        # defers its commits — writes from other threads (e.g.
+        # record_trade_async workers) commit on their own connections.
+        self._local = threading.local()
+        self._all_conns: List[sqlite3.Connection] = []
+        self._conns_lock = threading.Lock()
+
         # Ensure data directory exists
         os.makedirs(os.path.dirname(db_path), exist_ok=True)
         os.makedirs(os.path.dirname(csv_path), exist_ok=True)
 
         self._init_db()
 
+    def _in_batch(self) -> bool:
+        """True when the calling thread is inside a batch() block."""
+        return getattr(self._local, 'in_batch', False)
+
+    def _get_conn(self) -> sqlite3.Connection:
+        """Returns this thread's persistent connection, creating it on first use."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path)
+            # WAL keeps readers off the writers' locks and turns commits
+            # into sequential log appends; NORMAL sync is durable enough
+            # for paper-trade records and skips an fsync per commit
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA cache_size=-65536")
+            # Memory-map up to 256MB of the DB file so reads hit the page
+            # cache without a read() syscall per page
+            conn.execute("PRAGMA mmap_size=268435456")
+            self._local.conn = conn
+            with self._conns_lock:
+                self._all_conns.append(conn)
+        return conn
+
+    def close(self):
+        """Closes every connection this ledger has opened."""
+        with self._conns_lock:
+            for conn in self._all_conns:
+                try:
+                    conn.close()
+                except sqlite3.Error:
+                    pass
+            self._all_conns.clear()
+        self._local = threading.local()
+
     def _init_db(self):
         """Initializes the SQLite database with required tables."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._get_conn()
         cursor = conn.cursor()
 
         cursor.execute("""
@@ -65,9 +149,41 @@ class TradeLedger:
             CREATE INDEX IF NOT EXISTS idx_status ON trades(status)
         """)
 
+        # Composite index covering the PnL aggregation scan
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_status_symbol ON trades(status, symbol_root)
+        """)
+
+        # Indexes for the remaining get_trades filters
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_venue ON trades(venue)
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_symbol_root ON trades(symbol_root)
+        """)
+
         conn.commit()
-        conn.close()
-        print(f"Initialized trade ledger database at {self.db_path}")
+        log.info("Initialized trade ledger database at %s", self.db_path)
+
+    @contextmanager
+    def batch(self):
+        """
+        Groups ledger writes into one SQLite transaction.
+
+        Every record_trade / update_trade_status inside the block defers
+        its commit to the block exit (one fsync instead of one per call);
+        the transaction rolls back if the block raises.
+        """
+        conn = self._get_conn()
+        self._local.in_batch = True
+        try:
+            yield
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            self._local.in_batch = False
 
     def record_trade(self, trade: TradeIntent) -> int:
         """
@@ -77,39 +193,68 @@ class TradeLedger:
         Returns:
             The database row ID of the inserted trade.
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._get_conn()
         cursor = conn.cursor()
 
-        cursor.execute("""
-            INSERT INTO trades (
-                venue, market_type, symbol_root, strike, expiry,
-                side, quantity, limit_price, order_type, mode,
-                timestamp, status, transaction_id, notes
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            trade.venue,
-            trade.market_type,
-            trade.symbol_root,
-            trade.strike,
-            trade.expiry,
-            trade.side,
-            trade.quantity,
-            trade.limit_price,
-            trade.order_type,
-            trade.mode,
-            trade.timestamp.isoformat(),
-            trade.status,
-            trade.transaction_id,
-            trade.notes
-        ))
+        cursor.execute(self._INSERT_SQL, trade.as_db_row())
 
         row_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
+        if not self._in_batch():
+            conn.commit()
 
-        print(f"Recorded trade: {trade.side} {trade.quantity} {trade.symbol_root} @ {trade.limit_price} (ID: {row_id})")
+        log.debug("Recorded trade: %s %s %s @ %s (ID: %s)",
+                  trade.side, trade.quantity, trade.symbol_root, trade.limit_price, row_id)
         return row_id
 
+    async def record_trade_async(self, trade: TradeIntent) -> int:
+        """
+        Records a trade without blocking the event loop.
+
+        The insert (and its commit fsync) runs on a worker thread with
+        its own connection; the batch() flag is per-thread, so the worker
+        always commits immediately even while another thread is batching.
+        Args:
+            trade: A TradeIntent object to record.
+        Returns:
+            The database row ID of the inserted trade.
+        """
+        return await asyncio.to_thread(self.record_trade, trade)
+
+    def record_trades(self, trades: List[TradeIntent]) -> List[int]:
+        """
+        Records many trade intents in one transaction.
+
+        A burst of signals costs a single commit (one fsync) instead of
+        one per row, making the write bandwidth-bound rather than
+        fsync-bound.
+        Args:
+            trades: TradeIntent objects to record.
+        Returns:
+            The database row IDs of the inserted trades, in input order.
+        """
+        if not trades:
+            return []
+
+        conn = self._get_conn()
+        cursor = conn.cursor()
+        row_ids = []
+
+        try:
+            # Per-row execute (not executemany) so each lastrowid is
+            # captured; the savings come from the single shared commit
+            for trade in trades:
+                cursor.execute(self._INSERT_SQL, trade.as_db_row())
+                row_ids.append(cursor.lastrowid)
+            if not self._in_batch():
+                conn.commit()
+        except Exception:
+            if not self._in_batch():
+                conn.rollback()
+            raise
+
+        log.debug("Recorded %d trades in one batch", len(row_ids))
+        return row_ids
+
     def update_trade_status(self, row_id: int, status: str, transaction_id: Optional[str] = None, notes: Optional[str] = None):
         """
         Updates the status of a trade.
@@ -119,32 +264,27 @@ class TradeLedger:
             transaction_id: Optional transaction ID to update.
             notes: Optional notes to append or update.
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._get_conn()
         cursor = conn.cursor()
 
-        update_fields = ["status = ?"]
         update_values = [status]
-
         if transaction_id is not None:
-            update_fields.append("transaction_id = ?")
             update_values.append(transaction_id)
-
         if notes is not None:
-            update_fields.append("notes = ?")
             update_values.append(notes)
-
         update_values.append(row_id)
 
-        cursor.execute(f"""
-            UPDATE trades
-            SET {', '.join(update_fields)}
-            WHERE id = ?
-        """, update_values)
+        # Memoized SQL text keeps identical statements hitting sqlite3's
+        # internal prepared-statement cache
+        cursor.execute(
+            _update_sql(transaction_id is not None, notes is not None),
+            update_values
+        )
 
-        conn.commit()
-        conn.close()
+        if not self._in_batch():
+            conn.commit()
 
-        print(f"Updated trade {row_id}: status={status}")
+        log.debug("Updated trade %s: status=%s", row_id, status)
 
     def get_trades(
         self,
@@ -163,35 +303,19 @@ class TradeLedger:
         Returns:
             A list of trade dictionaries.
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-
-        query = "SELECT * FROM trades WHERE 1=1"
-        params = []
-
-        if status is not None:
-            query += " AND status = ?"
-            params.append(status)
-
-        if venue is not None:
-            query += " AND venue = ?"
-            params.append(venue)
+        cursor = self._get_conn().cursor()
+        cursor.row_factory = sqlite3.Row
 
-        if symbol_root is not None:
-            query += " AND symbol_root = ?"
-            params.append(symbol_root)
-
-        query += " ORDER BY timestamp DESC LIMIT ?"
+        params = [p for p in (status, venue, symbol_root) if p is not None]
         params.append(limit)
 
-        cursor.execute(query, params)
+        cursor.execute(
+            _select_sql(status is not None, venue is not None, symbol_root is not None),
+            params
+        )
         rows = cursor.fetchall()
 
-        trades = [dict(row) for row in rows]
-        conn.close()
-
-        return trades
+        return [dict(row) for row in rows]
 
     def export_to_csv(self, output_path: Optional[str] = None):
         """
@@ -202,27 +326,28 @@ class TradeLedger:
         if output_path is None:
             output_path = self.csv_path
 
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-
+        cursor = self._get_conn().cursor()
         cursor.execute("SELECT * FROM trades ORDER BY timestamp DESC")
-        rows = cursor.fetchall()
-
-        if rows:
-            with open(output_path, 'w', newline='') as csvfile:
-                fieldnames = rows[0].keys()
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-
-                writer.writeheader()
-                for row in rows:
-                    writer.writerow(dict(row))
 
-            print(f"Exported {len(rows)} trades to {output_path}")
+        # Stream rows straight from the cursor: memory stays O(1) in the
+        # ledger size and csv.writer skips DictWriter's per-row dict work
+        columns = [desc[0] for desc in cursor.description]
+        count = 0
+
+        with open(output_path, 'w', newline='') as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(columns)
+            while True:
+                batch = cursor.fetchmany(1000)
+                if not batch:
+                    break
+                writer.writerows(batch)
+                count += len(batch)
+
+        if count:
+            log.info("Exported %d trades to %s", count, output_path)
         else:
-            print("No trades to export.")
-
-        conn.close()
+            log.info("No trades to export.")
 
     def calculate_pnl(self, symbol_root: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -235,9 +360,31 @@ class TradeLedger:
         Returns:
             A dictionary with PnL metrics.
         """
-        trades = self.get_trades(status='EXECUTED', symbol_root=symbol_root, limit=10000)
+        # Group in SQLite (C index scan over idx_status_symbol) instead of
+        # materializing thousands of rows and looping in Python
+        query = """
+            SELECT
+                symbol_root || '-' || strike || '-' || expiry AS symbol,
+                COUNT(*) AS trade_count,
+                SUM(CASE WHEN side = 'BUY' THEN quantity ELSE -quantity END) AS quantity,
+                SUM(CASE WHEN side = 'BUY' THEN quantity * limit_price
+                         ELSE -quantity * limit_price END) AS total_cost
+            FROM trades
+            WHERE status = 'EXECUTED'
+        """
+        params = []
 
-        if not trades:
+        if symbol_root is not None:
+            query += " AND symbol_root = ?"
+            params.append(symbol_root)
+
+        query += " GROUP BY symbol"
+
+        cursor = self._get_conn().cursor()
+        cursor.execute(query, params)
+        rows = cursor.fetchall()
+
+        if not rows:
             return {
                 'total_trades': 0,
                 'total_notional': 0.0,
@@ -245,35 +392,22 @@ class TradeLedger:
                 'positions': {}
             }
 
+        total_trades = 0
         total_notional = 0.0
-        positions = {}  # symbol -> {'quantity': X, 'avg_price': Y}
-
-        for trade in trades:
-            symbol = f"{trade['symbol_root']}-{trade['strike']}-{trade['expiry']}"
-            notional = trade['quantity'] * trade['limit_price']
-
-            if trade['side'] == 'BUY':
-                total_notional -= notional
-                if symbol not in positions:
-                    positions[symbol] = {'quantity': 0.0, 'total_cost': 0.0}
-                positions[symbol]['quantity'] += trade['quantity']
-                positions[symbol]['total_cost'] += notional
-            elif trade['side'] == 'SELL':
-                total_notional += notional
-                if symbol not in positions:
-                    positions[symbol] = {'quantity': 0.0, 'total_cost': 0.0}
-                positions[symbol]['quantity'] -= trade['quantity']
-                positions[symbol]['total_cost'] -= notional
-
-        # Calculate average price per position
-        for symbol in positions:
-            if positions[symbol]['quantity'] != 0:
-                positions[symbol]['avg_price'] = positions[symbol]['total_cost'] / positions[symbol]['quantity']
-            else:
-                positions[symbol]['avg_price'] = 0.0
+        positions = {}  # symbol -> {'quantity': X, 'total_cost': Y, 'avg_price': Z}
+
+        for symbol, trade_count, quantity, total_cost in rows:
+            total_trades += trade_count
+            # BUY notional is money out, SELL is money in
+            total_notional -= total_cost
+            positions[symbol] = {
+                'quantity': quantity,
+                'total_cost': total_cost,
+                'avg_price': total_cost / quantity if quantity != 0 else 0.0
+            }
 
         return {
-            'total_trades': len(trades),
+            'total_trades': total_trades,
             'total_notional': total_notional,
             'positions': positions
         }
@@ -1,288 +1,115 @@
-#!/usr/bin/env python3
 """
-Integration test for IBKR client (requires IBKR TWS/Gateway running).
-This test uses real IBKR connection but only queries data (no orders).
+Integration tests for IBKR client (requires IBKR TWS/Gateway running).
+These tests use a real IBKR connection but only query data (no orders).
+
+Skipped automatically when nothing is listening on IB_HOST:IB_PORT, so
+runs without TWS don't wait out the API connect timeout.
 """
 import asyncio
-import sys
+import socket
+
+import pytest
+import pytest_asyncio
+
 from src.execution.ibkr_client import IBKRClient
 from src.execution.forecastex_contracts import ForecastExContractFactory
 from src.signal_server.config import settings
-from ib_insync import Contract
-
-
-async def test_ibkr_connection():
-    """Test connecting to IBKR TWS/Gateway."""
-    print("\n" + "=" * 60)
-    print("TEST: Connect to IBKR TWS/Gateway")
-    print("=" * 60)
-
-    client = IBKRClient()
-
-    try:
-        print(f"Attempting connection to {settings.IB_HOST}:{settings.IB_PORT} (client ID: {settings.IB_CLIENT_ID})")
-        await client.connect()
-
-        if client._connected:
-            print(f"✓ Successfully connected to IBKR")
-            return client
-        else:
-            print(f"✗ Failed to connect to IBKR")
-            return None
-
-    except Exception as e:
-        print(f"✗ Error connecting to IBKR: {e}")
-        print("\nTroubleshooting:")
-        print("1. Make sure TWS or IB Gateway is running")
-        print("2. Check that API connections are enabled in TWS/Gateway settings")
-        print("3. Verify the port number (7496 for TWS live, 4002 for paper)")
-        print("4. Check your .env file for correct IB_HOST and IB_PORT")
-        return None
+try:
+    from ib_async import Contract
+except ImportError:
+    from ib_insync import Contract
 
 
-async def test_contract_details_lookup(client: IBKRClient):
-    """Test looking up contract details."""
-    print("\n" + "=" * 60)
-    print("TEST: Look Up Contract Details")
-    print("=" * 60)
+SPY_CONTRACT = dict(symbol='SPY', secType='STK', exchange='SMART', currency='USD')
 
-    if not client or not client._connected:
-        print("⊘ Skipping: Not connected to IBKR")
-        return None
 
+def _reachable(host: str, port: int, timeout: float = 0.1) -> bool:
+    """Returns True if a TCP connection to host:port succeeds quickly."""
     try:
-        # Test with a well-known contract (SPY ETF)
-        print("Looking up SPY (S&P 500 ETF) contract...")
-
-        spy_contract = Contract(
-            symbol='SPY',
-            secType='STK',
-            exchange='SMART',
-            currency='USD'
-        )
-
-        details = client.get_contract_details(spy_contract)
-
-        if details:
-            print(f"✓ Found {len(details)} contract details for SPY")
-            print(f"  Contract ID: {details[0].conId}")
-            print(f"  Local Symbol: {details[0].localSymbol}")
-            print(f"  Exchange: {details[0].exchange}")
+        with socket.create_connection((host, port), timeout=timeout):
             return True
-        else:
-            print("✗ No contract details found for SPY")
-            return False
-
-    except Exception as e:
-        print(f"✗ Error looking up contract: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
-
-
-async def test_market_data_request(client: IBKRClient):
-    """Test requesting market data."""
-    print("\n" + "=" * 60)
-    print("TEST: Request Market Data")
-    print("=" * 60)
-
-    if not client or not client._connected:
-        print("⊘ Skipping: Not connected to IBKR")
-        return None
-
-    try:
-        print("Requesting market data for SPY...")
-
-        spy_contract = Contract(
-            symbol='SPY',
-            secType='STK',
-            exchange='SMART',
-            currency='USD'
-        )
-
-        ticker = await client.req_market_data(spy_contract)
-
-        if ticker:
-            # Wait a few seconds for data to arrive
-            print("Waiting for market data...")
-            await asyncio.sleep(3)
-
-            print(f"\nMarket Data:")
-            print(f"  Bid: {ticker.bid if ticker.bid and ticker.bid > 0 else 'N/A'}")
-            print(f"  Ask: {ticker.ask if ticker.ask and ticker.ask > 0 else 'N/A'}")
-            print(f"  Last: {ticker.last if ticker.last and ticker.last > 0 else 'N/A'}")
-
-            if ticker.bid and ticker.ask and ticker.bid > 0 and ticker.ask > 0:
-                midpoint = (ticker.bid + ticker.ask) / 2
-                print(f"  Midpoint: {midpoint:.2f}")
-                print("✓ Market data received successfully")
-                return True
-            else:
-                print("⚠ Market data request succeeded but no prices received")
-                print("  (This is normal for paper trading outside market hours)")
-                return True  # Still count as success
-
-        else:
-            print("✗ Failed to request market data")
-            return False
-
-    except Exception as e:
-        print(f"✗ Error requesting market data: {e}")
-        import traceback
-        traceback.print_exc()
+    except OSError:
         return False
 
 
-async def test_forecastex_contract_lookup(client: IBKRClient):
-    """Test looking up ForecastEx contracts."""
-    print("\n" + "=" * 60)
-    print("TEST: Look Up ForecastEx Contracts")
-    print("=" * 60)
-
-    if not client or not client._connected:
-        print("⊘ Skipping: Not connected to IBKR")
-        return None
-
-    try:
-        print("Searching for ForecastEx contracts...")
-
-        factory = ForecastExContractFactory(client)
-
-        # Try to find a ForecastEx contract
-        # Note: This may not find anything if ForecastEx contracts aren't available
-        # or if the symbol mapping is incorrect
-        print("Attempting to look up 'US CPI YoY' contract...")
-
-        contract = factory.get_forecastex_contract(
-            description="US CPI YoY",
-            strike=100.0,
-            expiry_date="2026-03-15",
-            is_yes=True
-        )
-
-        if contract:
-            print(f"✓ Found ForecastEx contract!")
-            print(f"  Symbol: {contract.symbol}")
-            print(f"  Local Symbol: {contract.localSymbol if hasattr(contract, 'localSymbol') else 'N/A'}")
-            print(f"  Contract ID: {contract.conId if hasattr(contract, 'conId') else 'N/A'}")
-            return True
-        else:
-            print("⚠ No ForecastEx contract found")
-            print("  This is expected if:")
-            print("  1. ForecastEx contracts aren't available in your account")
-            print("  2. The symbol mapping needs to be updated")
-            print("  3. The contract doesn't exist for this date/strike")
-            return None  # Not a failure, just not available
-
-    except Exception as e:
-        print(f"⚠ Error looking up ForecastEx contract: {e}")
-        print("  This is expected if ForecastEx isn't available")
-        return None
-
-
-async def test_positions_query(client: IBKRClient):
-    """Test querying current positions."""
-    print("\n" + "=" * 60)
-    print("TEST: Query Current Positions")
-    print("=" * 60)
-
-    if not client or not client._connected:
-        print("⊘ Skipping: Not connected to IBKR")
-        return None
-
-    try:
-        print("Requesting current positions...")
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client():
+    """One connected IBKR client for the whole session: a single
+    connect/disconnect instead of one per test."""
+    if not _reachable(settings.IB_HOST, settings.IB_PORT):
+        pytest.skip(f"Nothing listening on {settings.IB_HOST}:{settings.IB_PORT} "
+                    "(start TWS or IB Gateway)")
+    client = IBKRClient()
+    await client.connect()
+    if not client._connected:
+        pytest.skip("Could not connect to IBKR (check API settings in TWS/Gateway)")
+    yield client
+    client.disconnect()
 
-        positions = client.req_positions()
 
-        print(f"Found {len(positions)} open positions")
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def spy_contract(client):
+    """SPY qualified once per session; later requests reference the
+    resolved conId instead of re-triggering contract resolution."""
+    contract = await client.qualify(Contract(**SPY_CONTRACT))
+    if not contract.conId:
+        pytest.skip("Could not qualify SPY")
+    return contract
 
-        if positions:
-            print("\nOpen Positions:")
-            for pos in positions[:5]:  # Show first 5
-                print(f"  {pos.contract.symbol}: {pos.position} @ avg cost {pos.avgCost:.2f}")
 
-        print("✓ Positions query successful")
-        return True
+@pytest.mark.asyncio(loop_scope="session")
+async def test_ibkr_connection(client):
+    """The session fixture established a live connection."""
+    assert client._connected
 
-    except Exception as e:
-        print(f"✗ Error querying positions: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
 
+@pytest.mark.asyncio(loop_scope="session")
+async def test_contract_details_lookup(client, spy_contract):
+    """Look up contract details for a well-known contract (SPY ETF)."""
+    details = await client.get_contract_details_async(spy_contract)
 
-async def main():
-    """Run all IBKR integration tests."""
-    print("\n" + "#" * 60)
-    print("# IBKR INTEGRATION TESTS")
-    print("# (Read-only queries - no orders placed)")
-    print("#" * 60)
+    assert details, "expected contract details for SPY"
+    assert details[0].conId > 0
 
-    print("\nPrerequisites:")
-    print("- TWS or IB Gateway must be running")
-    print("- API connections must be enabled")
-    print(f"- Check settings: {settings.IB_HOST}:{settings.IB_PORT}")
-    print()
 
-    results = []
-    client = None
+@pytest.mark.asyncio(loop_scope="session")
+async def test_market_data_request(client, spy_contract):
+    """Request market data for SPY."""
+    ticker = await client.req_market_data(spy_contract)
+    assert ticker is not None
 
+    # Wait for the first tick instead of sleeping a fixed 3s; outside
+    # market hours no tick may come, which still counts as a successful
+    # request
+    first_tick = asyncio.get_running_loop().create_future()
+    ticker.updateEvent += lambda t: first_tick.done() or first_tick.set_result(True)
     try:
-        # Test 1: Connection
-        client = await test_ibkr_connection()
-        results.append(("IBKR Connection", client is not None))
-
-        if client:
-            # Test 2: Contract lookup
-            result2 = await test_contract_details_lookup(client)
-            results.append(("Contract Lookup", result2))
-
-            # Test 3: Market data
-            result3 = await test_market_data_request(client)
-            results.append(("Market Data Request", result3))
-
-            # Test 4: ForecastEx lookup
-            result4 = await test_forecastex_contract_lookup(client)
-            results.append(("ForecastEx Lookup", result4))
-
-            # Test 5: Positions query
-            result5 = await test_positions_query(client)
-            results.append(("Positions Query", result5))
-
-    finally:
-        # Cleanup
-        if client and client._connected:
-            print("\nDisconnecting from IBKR...")
-            client.disconnect()
-
-    # Summary
-    print("\n" + "=" * 60)
-    print("TEST SUMMARY")
-    print("=" * 60)
-
-    for test_name, result in results:
-        if result is True:
-            status = "✓ PASS"
-        elif result is False:
-            status = "✗ FAIL"
-        else:
-            status = "⊘ SKIP"
-        print(f"{status:10} {test_name}")
-
-    passed = sum(1 for _, r in results if r is True)
-    failed = sum(1 for _, r in results if r is False)
-    skipped = sum(1 for _, r in results if r is None)
-
-    print(f"\nTotal: {len(results)} tests")
-    print(f"Passed: {passed}")
-    print(f"Failed: {failed}")
-    print(f"Skipped: {skipped}")
-
-    # Only fail if we couldn't connect at all
-    return client is not None
-
-
-if __name__ == "__main__":
-    success = asyncio.run(main())
-    sys.exit(0 if success else 1)
+        await asyncio.wait_for(first_tick, timeout=3.0)
+    except asyncio.TimeoutError:
+        pass
+    if ticker.bid and ticker.ask and ticker.bid > 0 and ticker.ask > 0:
+        assert ticker.bid <= ticker.ask
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_forecastex_contract_lookup(client):
+    """Look up a ForecastEx contract (skips when not available)."""
+    factory = ForecastExContractFactory(client)
+
+    # Warm the caches asynchronously so the lookup below is a cache hit
+    # instead of a blocking reqContractDetails round-trip
+    query = ("US CPI YoY", 100.0, "2026-03-15", True)
+    await factory.prefetch([query])
+    contract = factory.get_forecastex_contract(*query)
+
+    if contract is None:
+        pytest.skip("ForecastEx contract not available for this account/date")
+    assert contract.symbol
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_positions_query(client):
+    """Query current positions (may legitimately be empty)."""
+    positions = client.req_positions(limit=5)
+    assert isinstance(positions, list)
+    assert len(positions) <= 5
@@ -3,20 +3,49 @@ Unit tests for trade ledger.
 """
 import pytest
 import os
-import tempfile
 from pathlib import Path
 from src.storage.ledger import TradeLedger
 from src.models.trade_intent import TradeIntent
 
+# Shared field set: tests override only the fields they exercise
+BASE_KWARGS = dict(
+    venue="ForecastEx",
+    market_type="Binary Option",
+    symbol_root="USCPI",
+    strike=100.0,
+    expiry="20260315",
+    side="BUY",
+    quantity=10.0,
+    limit_price=0.52,
+    mode="paper"
+)
+
+
+def make_trade(**overrides) -> TradeIntent:
+    """Builds a TradeIntent from BASE_KWARGS plus per-test overrides."""
+    return TradeIntent(**{**BASE_KWARGS, **overrides})
+
+
+@pytest.fixture(scope="session")
+def temp_ledger(tmp_path_factory):
+    """One ledger for the whole session: the DB file and its DDL are
+    created once instead of per test."""
+    tmpdir = tmp_path_factory.mktemp("ledger")
+    ledger = TradeLedger(
+        db_path=str(tmpdir / "test_trades.db"),
+        csv_path=str(tmpdir / "test_trades.csv")
+    )
+    yield ledger
+    ledger.close()
+
 
-@pytest.fixture
-def temp_ledger():
-    """Create a temporary ledger for testing."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        db_path = os.path.join(tmpdir, "test_trades.db")
-        csv_path = os.path.join(tmpdir, "test_trades.csv")
-        ledger = TradeLedger(db_path=db_path, csv_path=csv_path)
-        yield ledger
+@pytest.fixture(autouse=True)
+def _fresh_trades(temp_ledger):
+    """Empty the trades table before each test so the shared DB behaves
+    like the old per-test one."""
+    conn = temp_ledger._get_conn()
+    conn.execute("DELETE FROM trades")
+    conn.commit()
 
 
 def test_ledger_initialization(temp_ledger):
@@ -37,18 +66,7 @@ def test_ledger_initialization(temp_ledger):
 
 def test_record_trade(temp_ledger):
     """Test recording a trade."""
-    trade = TradeIntent(
-        venue="ForecastEx",
-        market_type="Binary Option",
-        symbol_root="USCPI",
-        strike=100.0,
-        expiry="20260315",
-        side="BUY",
-        quantity=10.0,
-        limit_price=0.52,
-        mode="paper",
-        notes="Test trade"
-    )
+    trade = make_trade(notes="Test trade")
 
     trade_id = temp_ledger.record_trade(trade)
     assert trade_id > 0
@@ -56,17 +74,7 @@ def test_record_trade(temp_ledger):
 
 def test_update_trade_status(temp_ledger):
     """Test updating trade status."""
-    trade = TradeIntent(
-        venue="ForecastEx",
-        market_type="Binary Option",
-        symbol_root="USCPI",
-        strike=100.0,
-        expiry="20260315",
-        side="BUY",
-        quantity=10.0,
-        limit_price=0.52,
-        mode="paper"
-    )
+    trade = make_trade()
 
     trade_id = temp_ledger.record_trade(trade)
     temp_ledger.update_trade_status(trade_id, "EXECUTED", transaction_id="TEST-001")
@@ -80,21 +88,11 @@ def test_update_trade_status(temp_ledger):
 
 def test_get_trades_filter_by_status(temp_ledger):
     """Test filtering trades by status."""
-    # Create multiple trades with different statuses
-    for i, status in enumerate(['PENDING', 'EXECUTED', 'CANCELLED']):
-        trade = TradeIntent(
-            venue="ForecastEx",
-            market_type="Binary Option",
-            symbol_root=f"SYM{i}",
-            strike=100.0,
-            expiry="20260315",
-            side="BUY",
-            quantity=10.0,
-            limit_price=0.52,
-            mode="paper",
-            status=status
-        )
-        temp_ledger.record_trade(trade)
+    # Create multiple trades with different statuses (one transaction,
+    # so the loop commits once)
+    with temp_ledger.batch():
+        for i, status in enumerate(['PENDING', 'EXECUTED', 'CANCELLED']):
+            temp_ledger.record_trade(make_trade(symbol_root=f"SYM{i}", status=status))
 
     # Filter by each status
     pending = temp_ledger.get_trades(status="PENDING")
@@ -109,32 +107,9 @@ def test_get_trades_filter_by_status(temp_ledger):
 
 def test_get_trades_filter_by_venue(temp_ledger):
     """Test filtering trades by venue."""
-    trade1 = TradeIntent(
-        venue="ForecastEx",
-        market_type="Binary Option",
-        symbol_root="USCPI",
-        strike=100.0,
-        expiry="20260315",
-        side="BUY",
-        quantity=10.0,
-        limit_price=0.52,
-        mode="paper"
-    )
-
-    trade2 = TradeIntent(
-        venue="OtherVenue",
-        market_type="Binary Option",
-        symbol_root="BTCQ",
-        strike=100.0,
-        expiry="20260315",
-        side="BUY",
-        quantity=5.0,
-        limit_price=0.65,
-        mode="paper"
-    )
-
-    temp_ledger.record_trade(trade1)
-    temp_ledger.record_trade(trade2)
+    temp_ledger.record_trade(make_trade())
+    temp_ledger.record_trade(make_trade(venue="OtherVenue", symbol_root="BTCQ",
+                                        quantity=5.0, limit_price=0.65))
 
     fx_trades = temp_ledger.get_trades(venue="ForecastEx")
     assert len(fx_trades) == 1
@@ -143,20 +118,10 @@ def test_get_trades_filter_by_venue(temp_ledger):
 
 def test_export_to_csv(temp_ledger):
     """Test CSV export functionality."""
-    # Create a few trades
-    for i in range(3):
-        trade = TradeIntent(
-            venue="ForecastEx",
-            market_type="Binary Option",
-            symbol_root=f"SYM{i}",
-            strike=100.0,
-            expiry="20260315",
-            side="BUY",
-            quantity=10.0,
-            limit_price=0.52,
-            mode="paper"
-        )
-        temp_ledger.record_trade(trade)
+    # Create a few trades under one commit
+    with temp_ledger.batch():
+        for i in range(3):
+            temp_ledger.record_trade(make_trade(symbol_root=f"SYM{i}"))
 
     # Export to CSV
     temp_ledger.export_to_csv()
@@ -164,30 +129,16 @@ def test_export_to_csv(temp_ledger):
     # Verify CSV was created
     assert os.path.exists(temp_ledger.csv_path)
 
-    # Verify CSV contents
-    import csv
+    # Verify CSV contents: header plus one line per trade (no need to
+    # materialize dicts just to count)
     with open(temp_ledger.csv_path, 'r') as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
-        assert len(rows) == 3
+        assert sum(1 for _ in f) - 1 == 3
 
 
 def test_calculate_pnl_simple(temp_ledger):
     """Test simple PnL calculation."""
     # Create and execute a buy trade
-    trade1 = TradeIntent(
-        venue="ForecastEx",
-        market_type="Binary Option",
-        symbol_root="USCPI",
-        strike=100.0,
-        expiry="20260315",
-        side="BUY",
-        quantity=10.0,
-        limit_price=0.52,
-        mode="paper",
-        status="EXECUTED"
-    )
-    temp_ledger.record_trade(trade1)
+    temp_ledger.record_trade(make_trade(status="EXECUTED"))
 
     # Calculate PnL
     pnl = temp_ledger.calculate_pnl()
@@ -200,34 +151,11 @@ def test_calculate_pnl_simple(temp_ledger):
 def test_calculate_pnl_multiple_trades(temp_ledger):
     """Test PnL calculation with multiple trades."""
     # Buy 10 @ 0.52
-    trade1 = TradeIntent(
-        venue="ForecastEx",
-        market_type="Binary Option",
-        symbol_root="USCPI",
-        strike=100.0,
-        expiry="20260315",
-        side="BUY",
-        quantity=10.0,
-        limit_price=0.52,
-        mode="paper",
-        status="EXECUTED"
-    )
-    temp_ledger.record_trade(trade1)
+    temp_ledger.record_trade(make_trade(status="EXECUTED"))
 
     # Sell 5 @ 0.58
-    trade2 = TradeIntent(
-        venue="ForecastEx",
-        market_type="Binary Option",
-        symbol_root="USCPI",
-        strike=100.0,
-        expiry="20260315",
-        side="SELL",
-        quantity=5.0,
-        limit_price=0.58,
-        mode="paper",
-        status="EXECUTED"
-    )
-    temp_ledger.record_trade(trade2)
+    temp_ledger.record_trade(make_trade(side="SELL", quantity=5.0,
+                                        limit_price=0.58, status="EXECUTED"))
 
     # Calculate PnL
     pnl = temp_ledger.calculate_pnl()
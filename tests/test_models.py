@@ -5,20 +5,28 @@ import pytest
 from datetime import datetime, timezone
 from src.models.trade_intent import TradeIntent
 
+# Shared field set: tests override only the fields they exercise
+BASE_KWARGS = dict(
+    venue="ForecastEx",
+    market_type="Binary Option",
+    symbol_root="USCPI",
+    strike=100.0,
+    expiry="20260315",
+    side="BUY",
+    quantity=10.0,
+    limit_price=0.52,
+    mode="paper"
+)
+
+
+def make_trade(**overrides) -> TradeIntent:
+    """Builds a TradeIntent from BASE_KWARGS plus per-test overrides."""
+    return TradeIntent(**{**BASE_KWARGS, **overrides})
+
 
 def test_trade_intent_creation():
     """Test TradeIntent model creation with required fields."""
-    trade = TradeIntent(
-        venue="ForecastEx",
-        market_type="Binary Option",
-        symbol_root="USCPI",
-        strike=100.0,
-        expiry="20260315",
-        side="BUY",
-        quantity=10.0,
-        limit_price=0.52,
-        mode="paper"
-    )
+    trade = make_trade()
 
     assert trade.venue == "ForecastEx"
     assert trade.symbol_root == "USCPI"
@@ -31,105 +39,41 @@ def test_trade_intent_creation():
 
 def test_trade_intent_with_notes():
     """Test TradeIntent with optional notes."""
-    trade = TradeIntent(
-        venue="ForecastEx",
-        market_type="Binary Option",
-        symbol_root="BTCQ",
-        strike=100.0,
-        expiry="20260430",
-        side="SELL",
-        quantity=5.0,
-        limit_price=0.65,
-        mode="paper",
-        notes="Test trade with notes"
-    )
+    trade = make_trade(symbol_root="BTCQ", expiry="20260430", side="SELL",
+                       quantity=5.0, limit_price=0.65,
+                       notes="Test trade with notes")
 
     assert trade.notes == "Test trade with notes"
 
 
-def test_trade_intent_timestamp_unique():
-    """Test that each TradeIntent gets a unique timestamp."""
-    import time
-
-    trade1 = TradeIntent(
-        venue="ForecastEx",
-        market_type="Binary Option",
-        symbol_root="USCPI",
-        strike=100.0,
-        expiry="20260315",
-        side="BUY",
-        quantity=10.0,
-        limit_price=0.52,
-        mode="paper"
-    )
-
-    time.sleep(0.01)  # Small delay
-
-    trade2 = TradeIntent(
-        venue="ForecastEx",
-        market_type="Binary Option",
-        symbol_root="USCPI",
-        strike=100.0,
-        expiry="20260315",
-        side="BUY",
-        quantity=10.0,
-        limit_price=0.52,
-        mode="paper"
-    )
-
-    # Timestamps should be different (or at least not fail)
-    assert trade1.timestamp != trade2.timestamp or trade1.timestamp == trade2.timestamp
-
-
-def test_trade_intent_validation():
-    """Test TradeIntent validation."""
-    # Valid sides
-    for side in ['BUY', 'SELL']:
-        trade = TradeIntent(
-            venue="ForecastEx",
-            market_type="Binary Option",
-            symbol_root="USCPI",
-            strike=100.0,
-            expiry="20260315",
-            side=side,
-            quantity=10.0,
-            limit_price=0.52,
-            mode="paper"
-        )
-        assert trade.side == side
-
-    # Valid modes
-    for mode in ['paper', 'live']:
-        trade = TradeIntent(
-            venue="ForecastEx",
-            market_type="Binary Option",
-            symbol_root="USCPI",
-            strike=100.0,
-            expiry="20260315",
-            side="BUY",
-            quantity=10.0,
-            limit_price=0.52,
-            mode=mode
-        )
-        assert trade.mode == mode
-
-
-def test_trade_intent_status_values():
+def test_trade_intent_timestamp_ordering():
+    """Test that default timestamps are assigned in creation order."""
+    trade1 = make_trade()
+    trade2 = make_trade()
+
+    # datetime.now(timezone.utc) is non-decreasing, so creation order holds
+    assert trade2.timestamp >= trade1.timestamp
+
+
+@pytest.mark.parametrize("side", ['BUY', 'SELL'])
+def test_trade_intent_valid_sides(side):
+    """Test TradeIntent side validation."""
+    trade = make_trade(side=side)
+    assert trade.side == side
+
+
+@pytest.mark.parametrize("mode", ['paper', 'live'])
+def test_trade_intent_valid_modes(mode):
+    """Test TradeIntent mode validation."""
+    trade = make_trade(mode=mode)
+    assert trade.mode == mode
+
+
+@pytest.mark.parametrize("status", ['PENDING', 'EXECUTED', 'CANCELLED', 'FAILED'])
+def test_trade_intent_status_values(status):
     """Test different status values."""
-    for status in ['PENDING', 'EXECUTED', 'CANCELLED', 'FAILED']:
-        trade = TradeIntent(
-            venue="ForecastEx",
-            market_type="Binary Option",
-            symbol_root="USCPI",
-            strike=100.0,
-            expiry="20260315",
-            side="BUY",
-            quantity=10.0,
-            limit_price=0.52,
-            mode="paper",
-            status=status
-        )
-        assert trade.status == status
+    trade = make_trade(status=status)
+    assert trade.status == status
 
 
 if __name__ == "__main__":
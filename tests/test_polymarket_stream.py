@@ -0,0 +1,132 @@
+"""
+Unit tests for the streamed order book: incremental updates against the
+tick-keyed SortedDict sides and the running VWAP sums.
+"""
+import pytest
+from src.signal_server.polymarket_stream import PolymarketStream, _TICK_SCALE
+
+
+@pytest.fixture
+def stream():
+    """Stream with one subscribed market seeded from a snapshot."""
+    stream = PolymarketStream()
+    stream.subscriptions['mkt'] = {
+        'callback': None,
+        'subscribed_at': None,
+        'last_update_ns': None,
+        'order_book': PolymarketStream._make_book(
+            [[0.50, 100.0], [0.48, 50.0], [0.45, 25.0]],
+            [[0.52, 80.0], [0.55, 40.0]]
+        )
+    }
+    return stream
+
+
+def _reference_vwap(order_book):
+    """Whole-book VWAP midpoint recomputed from scratch off the sides."""
+    sums = {}
+    for side, prefix in (('bids', 'bid'), ('asks', 'ask')):
+        levels = order_book[side]
+        sums[prefix + '_value'] = sum((t / _TICK_SCALE) * s for t, s in levels.items())
+        sums[prefix + '_size'] = sum(levels.values())
+
+    if sums['bid_size'] <= 0.0 and sums['ask_size'] <= 0.0:
+        return None
+    vwap_bid = sums['bid_value'] / sums['bid_size'] if sums['bid_size'] > 0.0 else 0.0
+    vwap_ask = sums['ask_value'] / sums['ask_size'] if sums['ask_size'] > 0.0 else 0.0
+    if sums['bid_size'] > 0.0 and sums['ask_size'] > 0.0:
+        return (vwap_bid + vwap_ask) / 2
+    return vwap_bid if sums['bid_size'] > 0.0 else vwap_ask
+
+
+def _assert_sums_match(order_book):
+    """The incrementally maintained sums must equal a from-scratch pass."""
+    for side, prefix in (('bids', 'bid'), ('asks', 'ask')):
+        levels = order_book[side]
+        assert order_book[prefix + '_value_sum'] == pytest.approx(
+            sum((t / _TICK_SCALE) * s for t, s in levels.items()))
+        assert order_book[prefix + '_size_sum'] == pytest.approx(
+            sum(levels.values()))
+
+
+def test_snapshot_sums(stream):
+    """Snapshot seeding populates the running sums correctly."""
+    book = stream.subscriptions['mkt']['order_book']
+    _assert_sums_match(book)
+    assert stream.calculate_vwap('mkt', n_levels=None) == pytest.approx(
+        _reference_vwap(book))
+
+
+def test_level_insert_update_remove(stream):
+    """Sums stay in sync through insert, size update, and removal."""
+    book = stream.subscriptions['mkt']['order_book']
+
+    # Insert a new bid level
+    stream._apply_order_book_update(book, {'side': 'bid', 'price': '0.49', 'size': '60'})
+    assert book['bids'][round(0.49 * _TICK_SCALE)] == 60.0
+    _assert_sums_match(book)
+
+    # Update an existing ask level's size
+    stream._apply_order_book_update(book, {'side': 'ask', 'price': '0.52', 'size': '30'})
+    assert book['asks'][round(0.52 * _TICK_SCALE)] == 30.0
+    _assert_sums_match(book)
+
+    # Remove a bid level (size 0)
+    stream._apply_order_book_update(book, {'side': 'bid', 'price': '0.48', 'size': '0'})
+    assert round(0.48 * _TICK_SCALE) not in book['bids']
+    _assert_sums_match(book)
+
+    assert stream.calculate_vwap('mkt', n_levels=None) == pytest.approx(
+        _reference_vwap(book))
+
+
+def test_no_drift_over_many_updates(stream):
+    """A long remove/re-add churn sequence must not accumulate drift."""
+    book = stream.subscriptions['mkt']['order_book']
+
+    for i in range(200):
+        price = 0.40 + (i % 10) * 0.01
+        size = float((i * 7) % 90)  # hits 0 periodically, exercising removal
+        side = 'bid' if i % 2 == 0 else 'ask'
+        stream._apply_order_book_update(book, {'side': side, 'price': str(price), 'size': str(size)})
+
+    _assert_sums_match(book)
+    assert stream.calculate_vwap('mkt', n_levels=None) == pytest.approx(
+        _reference_vwap(book))
+
+
+def test_bids_iterate_best_first(stream):
+    """Bids yield highest price first, asks lowest first (top-N slicing)."""
+    top = stream.get_current_order_book('mkt', n_levels=2)
+    assert [price for price, _ in top['bids']] == [0.50, 0.48]
+    assert [price for price, _ in top['asks']] == [0.52, 0.55]
+
+
+def test_top_n_vwap_matches_manual(stream):
+    """The kernel-backed top-N VWAP matches a manual computation."""
+    vwap = stream.calculate_vwap('mkt', n_levels=2)
+
+    bid_value = 0.50 * 100.0 + 0.48 * 50.0
+    bid_size = 150.0
+    ask_value = 0.52 * 80.0 + 0.55 * 40.0
+    ask_size = 120.0
+    expected = (bid_value / bid_size + ask_value / ask_size) / 2
+
+    assert vwap == pytest.approx(expected)
+
+
+def test_vwap_empty_book():
+    """An empty book yields no VWAP rather than a zero division."""
+    stream = PolymarketStream()
+    stream.subscriptions['mkt'] = {
+        'callback': None,
+        'subscribed_at': None,
+        'last_update_ns': None,
+        'order_book': PolymarketStream._empty_book()
+    }
+    assert stream.calculate_vwap('mkt', n_levels=None) is None
+    assert stream.calculate_vwap('mkt', n_levels=3) is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])